@@ -0,0 +1,87 @@
+"""Benchmark artist entity resolution at increasing numbers of rows.
+
+Synthetic artists are made by recombining the first and last words of the
+combined dataset's artist names, each with a random birth year. A share of
+them are then repeated as a variant spelling (accents, run-together
+CamelCase, hyphens, a dropped letter, a parenthetical alias), as they appear
+across museums. For each size, reports the time taken by
+utils.artists.resolve_artists and how many variants got their artist's ID.
+
+Run from the repository root:
+
+    python benchmarks/artist_resolution.py
+    python benchmarks/artist_resolution.py --sizes 100000 --workers 4
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import pandas as pd
+
+from utils.artists import resolve_artists
+from utils.datasets import read_dataset
+
+VARIANTS = [
+    lambda name: name.replace("e", "é", 1),
+    lambda name: name.title().replace(" ", ""),
+    lambda name: name.replace(" ", "-", 1) if name.count(" ") > 1 else name.upper(),
+    lambda name: name[:-2] + name[-1],
+    lambda name: f"{name} (Studio of)",
+]
+
+
+def synthetic_artists(names, size, variant_share=0.2, seed=0):
+    """Return the rows, the ground-truth artist of each row and the number of variants."""
+    words = [name.split() for name in names if len(name.split()) > 1]
+    first = np.array([w[0] for w in words])
+    last = np.array([w[-1] for w in words])
+    rng = np.random.default_rng(seed)
+
+    n_artists = int(size / (1 + variant_share))
+    artists = pd.DataFrame({
+        "Artist": np.char.add(np.char.add(rng.choice(first, n_artists), " "),
+                              rng.choice(last, n_artists)),
+        "BeginDate": rng.integers(1800, 2000, n_artists),
+    })
+    # Recombined names can repeat; the same name and year is the same artist
+    truth = artists.groupby(["Artist", "BeginDate"]).ngroup().to_numpy()
+
+    copies = rng.choice(n_artists, size - n_artists)
+    variants = artists.iloc[copies].reset_index(drop=True)
+    kinds = rng.integers(len(VARIANTS), size=len(copies))
+    variants["Artist"] = [VARIANTS[kind](name) for kind, name in zip(kinds, variants["Artist"])]
+    # Half of the variants come from a museum that doesn't record birth years
+    variants["BeginDate"] = variants["BeginDate"].where(rng.random(len(copies)) < 0.5)
+    rows = pd.concat([artists, variants], ignore_index=True).astype({"BeginDate": "Int16"})
+    return rows, np.concatenate([truth, truth[copies]]), len(copies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20_000, 100_000, 250_000])
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes scoring candidate pairs (default: one per CPU)")
+    args = parser.parse_args()
+
+    names = read_dataset("combined")["Artist"].dropna().unique().tolist()
+    print(f"{'rows':>10} {'seconds':>8} {'artists':>9} {'resolved':>9} {'variants matched':>17}")
+    for size in args.sizes:
+        rows, truth, n_variants = synthetic_artists(names, size)
+        start = time.perf_counter()
+        ids = resolve_artists(rows, "Artist", "BeginDate", workers=args.workers).to_numpy()
+        elapsed = time.perf_counter() - start
+
+        # A variant is matched when it got the ID of its artist's first row
+        first_row = pd.Series(np.arange(len(truth))).groupby(truth).transform("min").to_numpy()
+        matched = (ids[-n_variants:] == ids[first_row[-n_variants:]]).mean()
+        print(f"{size:>10,} {elapsed:>8.2f} {len(np.unique(truth)):>9,} "
+              f"{len(np.unique(ids)):>9,} {matched:>16.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark the trigram artist search at increasing numbers of names.
+
+Synthetic names are made by recombining the first and last words of the
+combined dataset's artist names. For each size, reports the index build
+time and the median and 95th percentile query latency of
+utils.search.TrigramIndex, next to a linear ``str.contains`` scan.
+
+Run from the repository root:
+
+    python benchmarks/artist_search.py
+    python benchmarks/artist_search.py --sizes 17000 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np
+import pandas as pd
+
+from utils.datasets import read_dataset
+from utils.search import TrigramIndex
+
+QUERIES = ["kehinde wiley", "kehinde wily", "okeke", "durer", "Dürer", "nigerian", "smith",
+           "an", "yayoi kusama", "basquiat", "jean-michel", "xq"]
+
+
+def synthetic_names(names, size, seed=0):
+    words = [name.split() for name in names if len(name.split()) > 1]
+    first = np.array([w[0] for w in words])
+    last = np.array([w[-1] for w in words])
+    rng = np.random.default_rng(seed)
+    extra = size - len(names)
+    if extra <= 0:
+        return list(names[:size])
+    made = np.char.add(np.char.add(rng.choice(first, extra), " "), rng.choice(last, extra))
+    return list(names) + made.tolist()
+
+
+def time_queries(search, repeat=5):
+    latencies = []
+    for query in QUERIES:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            search(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return np.median(latencies), np.percentile(latencies, 95)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[17_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    names = read_dataset("combined")["Artist"].dropna().unique().tolist()
+    print(f"{'names':>10} {'build s':>8} {'trigram p50/p95 ms':>20} {'str.contains p50/p95 ms':>24}")
+    for size in args.sizes:
+        values = synthetic_names(names, size)
+        start = time.perf_counter()
+        index = TrigramIndex(values)
+        build = time.perf_counter() - start
+
+        series = pd.Series(values)
+        trigram = time_queries(lambda q: index.search(q, k=20))
+        linear = time_queries(lambda q: series[series.str.contains(q, case=False, regex=False)], 1)
+        print(f"{size:>10,} {build:>8.2f} {trigram[0]:>9.2f} / {trigram[1]:<8.2f} "
+              f"{linear[0]:>11.2f} / {linear[1]:<8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark the background image CSS sent on every page rerun.
+
+Compares the old behaviour (read + base64-encode the image on each rerun and
+inline it in the CSS) with the shared asset cache in utils/assets.py, both in
+data-URI fallback mode and with static serving enabled.
+
+Run from the repository root:
+
+    python benchmarks/background_assets.py
+"""
+import argparse
+import base64
+import glob
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit import config
+from streamlit.testing.v1 import AppTest
+
+from utils.assets import STATIC_DIR, background_url
+
+PAGES = ["Home.py"] + sorted(glob.glob("pages/*.py", root_dir=ROOT))
+BACKGROUNDS = [
+    "aaron douglas - from slavery to recognition.jfif",
+    "aaron douglas - song of the tower.jfif",
+]
+
+
+def legacy_background_css(image_name):
+    """What every page used to do on each rerun."""
+    with open(STATIC_DIR / image_name, "rb") as f:
+        b64_encoded = base64.b64encode(f.read()).decode()
+    return f"<style>.stApp {{ background-image: url(data:image/jfif;base64,{b64_encoded}); }}</style>"
+
+
+def shared_background_css(image_name):
+    return f'<style>.stApp {{ background-image: url("{background_url(image_name)}"); }}</style>'
+
+
+def time_call(func, arg, repeat):
+    func(arg)  # warm up caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        css = func(arg)
+    return len(css.encode()), (time.perf_counter() - start) / repeat * 1000
+
+
+def bench_css(repeat):
+    print(f"{'image':<52}{'mode':<10}{'bytes/rerun':>14}{'ms/rerun':>10}")
+    for image_name in BACKGROUNDS:
+        for mode, func, static in [
+            ("legacy", legacy_background_css, False),
+            ("inline", shared_background_css, False),
+            ("static", shared_background_css, True),
+        ]:
+            config.set_option("server.enableStaticServing", static)
+            size, ms = time_call(func, image_name, repeat)
+            print(f"{image_name:<52}{mode:<10}{size:>14,}{ms:>10.3f}")
+
+
+def bench_pages(repeat):
+    print(f"\n{'page':<40}{'mode':<10}{'markdown bytes':>16}{'ms/rerun':>10}")
+    for page in PAGES:
+        for mode, static in [("inline", False), ("static", True)]:
+            config.set_option("server.enableStaticServing", static)
+            at = AppTest.from_file(str(ROOT / page), default_timeout=60).run()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                at.run()
+            ms = (time.perf_counter() - start) / repeat * 1000
+            size = sum(len(m.value.encode()) for m in at.markdown)
+            print(f"{page:<40}{mode:<10}{size:>16,}{ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="reruns per measurement")
+    args = parser.parse_args()
+
+    bench_css(args.repeat)
+    bench_pages(max(1, args.repeat // 4))
+
+
+if __name__ == "__main__":
+    main()
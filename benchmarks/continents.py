@@ -0,0 +1,80 @@
+"""Benchmark nationality-to-continent classification on the combined dataset.
+
+Compares the old exact-string dict lookup (``Series.map``) with
+utils.continents.classify_continents, and reports how many artists each
+approach leaves unmapped.
+
+Run from the repository root:
+
+    python benchmarks/continents.py
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd
+
+from utils.continents import classify_continents, classify_nationality, unmapped_nationalities
+from utils.datasets import read_dataset
+
+# Keys of the exact-match dict the Small Institutions page used to apply
+LEGACY_KEYS = [
+    "American", "African-American", "Native American", "Mexican", "Mexican-American",
+    "Canadian", "Canadian-American", "Cuban", "Cuban-American", "Bahamian", "Haitian",
+    "American-Haitian", "Dominican", "Peruvian", "Brazilian", "Brazilian-American",
+    "Venezuelan", "Colombian", "German", "German-American", "Irish-American", "Italian",
+    "Italian-American", "Dutch", "Norwegian", "Swedish", "Danish", "Finnish",
+    "Polish-Ukrainian", "British", "British-American", "French", "Icelandic-Danish",
+    "English", "Nigerian", "Ghanaian", "Kenyan", "Ugandan", "Congolese", "South African",
+    "Indian", "Lebanese", "Turkish", "Chinese", "Chinese-American", "South Korean",
+    "Japanese", "Korean", "American-Korean", "Palestinian-American", "Singaporean",
+    "Asian-American", "Australian", "Canadian-Ukrainian", "Haitian Jamaican",
+]
+LEGACY_MAP = {key: classify_nationality(key) for key in LEGACY_KEYS}
+
+
+def time_it(func, repeat):
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="runs per measurement")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="replicate the dataset this many times")
+    args = parser.parse_args()
+
+    nationalities = read_dataset("combined")["Nationality"]
+    if args.scale > 1:
+        nationalities = pd.concat([nationalities] * args.scale, ignore_index=True)
+    as_text = nationalities.astype(str)
+    known = (as_text != "Unknown").sum()
+    print(f"{len(nationalities):,} artists, {known:,} with a known nationality, "
+          f"{nationalities.nunique()} distinct values\n")
+
+    runs = [
+        ("dict map (str)", lambda: as_text.map(LEGACY_MAP)),
+        ("classify (str)", lambda: classify_continents(as_text)),
+        ("classify (category)", lambda: classify_continents(nationalities)),
+    ]
+    print(f"{'method':<22}{'ms/run':>10}{'unmapped known':>16}")
+    for label, func in runs:
+        classify_nationality.cache_clear()
+        result, ms = time_it(func, args.repeat)
+        unmapped = result.isna().sum() - (len(result) - known)
+        print(f"{label:<22}{ms:>10.2f}{unmapped:>16,}")
+
+    missing = unmapped_nationalities(nationalities)
+    print("\nUnmapped nationalities:", ", ".join(missing.index.astype(str)) or "none")
+
+
+if __name__ == "__main__":
+    main()
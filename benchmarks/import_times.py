@@ -0,0 +1,127 @@
+"""Report what each page's imports cost on a cold interpreter.
+
+For every page, the module-level import statements are run in a fresh
+``python -X importtime`` process after ``import streamlit`` (which the
+server has already paid for by the time a page runs). The report lists the
+page's total import time and the packages that contributed most, by
+cumulative time: the time spent wherever another package (or the page)
+imports the package, including everything it imports in turn.
+Modules the page imports through utils.lazy are only loaded when used, so
+they don't appear here. With ``--budget`` the script exits with status 1 if
+any page's imports take longer than that many milliseconds.
+
+Run from the repository root:
+
+    python benchmarks/import_times.py
+    python benchmarks/import_times.py --pages "pages/About.py" --top 20
+    python benchmarks/import_times.py --json benchmarks/results/imports.json
+    python benchmarks/import_times.py --budget 600
+"""
+import argparse
+import ast
+import glob
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+PAGES = ["Home.py"] + sorted(glob.glob("pages/*.py", root_dir=ROOT))
+
+# Imported before the page's imports and left out of its cost
+BASELINE = "import streamlit"
+
+
+def page_imports(page: str) -> str:
+    """Return the page's module-level import statements as source."""
+    source = (ROOT / page).read_text()
+    tree = ast.parse(source)
+    return "\n".join(ast.get_source_segment(source, node) for node in tree.body
+                     if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def import_times(code: str) -> List[Tuple[int, str, int, int]]:
+    """Run ``code`` under -X importtime; return (depth, module, self us, cumulative us)."""
+    run = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                         capture_output=True, text=True)
+    if run.returncode != 0:
+        raise RuntimeError(run.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in run.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+def package_times(rows: List[Tuple[int, str, int, int]]) -> Dict[str, int]:
+    """Sum the cumulative time of each top-level package where it is entered from outside."""
+    totals: Dict[str, int] = {}
+    ancestors: List[str] = []
+    # -X importtime lists a module after its imports; reversed, parents come first
+    for depth, name, own, cumulative in reversed(rows):
+        del ancestors[depth:]
+        package = name.split(".")[0]
+        if not ancestors or ancestors[-1].split(".")[0] != package:
+            totals[package] = totals.get(package, 0) + cumulative
+        ancestors.append(name)
+    return totals
+
+
+def page_report(page: str, runs: int) -> dict:
+    """Import cost of one page, in ms; the median of ``runs`` cold processes."""
+    code = page_imports(page)
+    totals, packages = [], {}
+    for _ in range(runs):
+        # Everything printed after the baseline import belongs to the page
+        rows = import_times(f"{BASELINE}\n# page imports\n{code}")
+        start = max(i for i, row in enumerate(rows) if row[0] == 0 and row[1] == "streamlit") + 1
+        top_level = [row for row in rows[start:] if row[0] == 0]
+        totals.append(sum(row[3] for row in top_level))
+        for package, cumulative in package_times(rows[start:]).items():
+            packages.setdefault(package, []).append(cumulative)
+    return {
+        "page": page,
+        "total_ms": round(statistics.median(totals) / 1000, 1),
+        "packages": {name: round(statistics.median(times) / 1000, 1)
+                     for name, times in packages.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=PAGES, metavar="PAGE",
+                        help="pages to report, relative to the repository root (default: all)")
+    parser.add_argument("--top", type=int, default=8, help="heaviest packages listed per page")
+    parser.add_argument("--runs", type=int, default=3, help="cold processes per page")
+    parser.add_argument("--json", type=Path, help="also write the full report here")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="fail if any page's imports take longer than this")
+    args = parser.parse_args()
+
+    reports = [page_report(page, args.runs) for page in args.pages]
+    for report in reports:
+        print(f"{report['page']:<40}{report['total_ms']:>9.1f} ms")
+        heaviest: Dict[str, float] = dict(sorted(report["packages"].items(),
+                                                 key=lambda item: -item[1])[:args.top])
+        for name, ms in heaviest.items():
+            print(f"    {name:<36}{ms:>9.1f} ms")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(reports, indent=2))
+    if args.budget is not None:
+        over = [report for report in reports if report["total_ms"] > args.budget]
+        for report in over:
+            print(f"{report['page']} is over the {args.budget:.0f} ms budget")
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Benchmark page reruns headlessly with Streamlit's AppTest harness.
+
+Every page is loaded in its own fresh process, so the first run is a true
+cold start (imports, data loading, empty caches). The page then replays a
+few interactions a visitor would make. Each interaction alternates between
+two widget values: the first change is reported as cold, the median of the
+later ones as warm. A widget inside an ``st.fragment`` reruns only that
+fragment, as it would in the browser; other widgets rerun the whole page.
+For every step the suite records:
+
+* rerun latency, cold and warm (median and 95th percentile) in ms;
+* peak Python memory allocated during one rerun (tracemalloc), in KiB;
+* the size of the element tree the rerun emits (the serialized delta
+  protos the browser would receive; only the fragment's for a fragment
+  rerun), in bytes.
+
+Results are written as JSON; pass an earlier file to ``--compare`` to print
+the change per step.
+
+Run from the repository root:
+
+    python benchmarks/page_reruns.py
+    python benchmarks/page_reruns.py --pages "pages/Large Institutions.py" --repeat 10
+    python benchmarks/page_reruns.py --compare benchmarks/results/<earlier run>.json
+"""
+import argparse
+import functools
+import glob
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+PAGES = ["Home.py"] + sorted(glob.glob("pages/*.py", root_dir=ROOT))
+
+# Fragment key of utils.browser.show_browser, not imported here so that the
+# worker's first run still pays for every import
+BROWSER_FRAGMENT = "table_browser"
+
+# Session state keys of the dashboard tabs; opening another tab reruns the
+# page with only that tab's content
+LARGE_TABS_KEY = "large_tabs"
+SMALL_TABS_KEY = "small_tabs"
+
+# An interaction sets a widget (or session state) to one of two values
+Setter = Callable[[object, object], None]
+
+
+def widget(kind: str, label: str) -> Setter:
+    """Set the first ``kind`` widget (e.g. "slider") labelled ``label``."""
+    def set_value(at, value):
+        matches = [w for w in getattr(at, kind) if w.label == label]
+        if not matches:
+            raise LookupError(f"no {kind} labelled {label!r}")
+        matches[0].set_value(value)
+    return set_value
+
+
+def keyed(kind: str, key: str) -> Setter:
+    """Set the ``kind`` widget with the given key."""
+    def set_value(at, value):
+        getattr(at, kind)(key=key).set_value(value)
+    return set_value
+
+
+def session_state(key: str) -> Setter:
+    def set_value(at, value):
+        at.session_state[key] = value
+    return set_value
+
+
+class Step(NamedTuple):
+    name: str
+    set_value: Setter
+    values: Tuple[object, object]
+    # Key of the st.fragment holding the widget, which then reruns alone
+    fragment: Optional[str] = None
+    # (tabs key, label) of the tab to open before the step
+    tab: Optional[Tuple[str, str]] = None
+
+
+SCENARIOS: Dict[str, List[Step]] = {
+    "pages/Mission Statement Analysis.py": [
+        Step("move word count slider", widget("slider", "Number of words to display"), (40, 10),
+             fragment="word_chart"),
+        Step("search for a word", widget("text_input", "Search for a specific word:"),
+             ("commun", "art"), fragment="word_table"),
+    ],
+    "pages/Small Institutions.py": [
+        Step("switch tabs", session_state(SMALL_TABS_KEY), ("Gender", "Continental")),
+        Step("type in raw data search", keyed("text_input", "small_raw_search"), ("Amer", "Ha"),
+             fragment=BROWSER_FRAGMENT, tab=(SMALL_TABS_KEY, "Raw Data")),
+        Step("change minimum count", widget("number_input", "Minimum count to display"), (3, 1),
+             fragment="small_nationality_chart", tab=(SMALL_TABS_KEY, "Nationality")),
+    ],
+    "pages/Large Institutions.py": [
+        Step("switch tabs", session_state(LARGE_TABS_KEY), ("Historical Trends", "Raw Data")),
+        Step("move nationalities slider", widget("slider", "Nationalities to show"), (30, 10),
+             fragment="nationality_chart", tab=(LARGE_TABS_KEY, "Nationality Distribution")),
+        Step("change trend bin width", widget("select_slider", "Bin width"),
+             ("Year", "Quarter century"), fragment="trend_chart",
+             tab=(LARGE_TABS_KEY, "Historical Trends")),
+        Step("search for an artist", widget("text_input", "Find an Artist"),
+             ("kehinde wily", "okeke"), fragment="artist_search"),
+    ],
+}
+
+
+def delta_bytes(at) -> int:
+    """Return the serialized size of every element and block in the page."""
+    def size(node) -> int:
+        total = node.proto.ByteSize() if getattr(node, "proto", None) is not None else 0
+        for child in getattr(node, "children", {}).values():
+            total += size(child)
+        return total
+    return size(at._tree)
+
+
+@contextmanager
+def fragment_scope(at, fragment: Optional[str]):
+    """Make the reruns inside the block run only the fragment with key ``fragment``.
+
+    AppTest always reruns the whole script, so the rerun request is given
+    the fragment's IDs the way the browser sends them for a widget inside it.
+    """
+    if fragment is None:
+        yield
+        return
+    from streamlit.testing.v1 import local_script_runner
+
+    ids = list(at._fragment_storage._ids_by_target_key.get(fragment, ()))
+    if not ids:
+        raise LookupError(f"no fragment with key {fragment!r}")
+    rerun_data = local_script_runner.RerunData
+    local_script_runner.RerunData = functools.partial(rerun_data, fragment_id_queue=ids)
+    try:
+        yield
+    finally:
+        local_script_runner.RerunData = rerun_data
+
+
+def timed_run(at, fragment: Optional[str] = None) -> float:
+    with fragment_scope(at, fragment):
+        start = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+
+def traced_run(at, fragment: Optional[str] = None) -> int:
+    """Rerun with tracemalloc on and return the peak allocation in KiB."""
+    with fragment_scope(at, fragment):
+        tracemalloc.start()
+        try:
+            at.run()
+            return tracemalloc.get_traced_memory()[1] // 1024
+        finally:
+            tracemalloc.stop()
+
+
+def result(page: str, step: str, cold: float, warm: List[float], peak: int, size: int) -> dict:
+    warm = sorted(warm)
+    return {
+        "page": page,
+        "step": step,
+        "cold_ms": round(cold, 2),
+        "warm_ms": round(statistics.median(warm), 2),
+        "warm_p95_ms": round(warm[min(len(warm) - 1, int(0.95 * len(warm)))], 2),
+        "peak_kib": peak,
+        "delta_bytes": size,
+    }
+
+
+def bench_page(page: str, repeat: int) -> List[dict]:
+    """Run one page's scenario in this process; meant to be a fresh one."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / page), default_timeout=300)
+    cold = timed_run(at)
+    warm = [timed_run(at) for _ in range(repeat)]
+    results = [result(page, "load", cold, warm, traced_run(at), delta_bytes(at))]
+
+    for step, set_value, values, fragment, tab in SCENARIOS.get(page, []):
+        if tab is not None:
+            at.session_state[tab[0]] = tab[1]
+            timed_run(at)
+        set_value(at, values[0])
+        cold = timed_run(at, fragment)
+        warm = []
+        for i in range(repeat):
+            set_value(at, values[(i + 1) % 2])
+            warm.append(timed_run(at, fragment))
+        set_value(at, values[0])
+        results.append(result(page, step, cold, warm, traced_run(at, fragment), delta_bytes(at)))
+        if fragment is not None:
+            # The tree now holds only the fragment, and AppTest has dropped the
+            # state of the widgets outside it; start the next step from a new
+            # session (the process-wide caches stay warm)
+            at = AppTest.from_file(str(ROOT / page), default_timeout=300)
+            timed_run(at)
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[dict], path: Path):
+    previous = {(r["page"], r["step"]): r for r in json.loads(path.read_text())["results"]}
+    print(f"\nChange from {path.name}:")
+    print(f"{'page':<38}{'step':<28}{'cold ms':>16}{'warm ms':>16}")
+    for r in results:
+        old = previous.get((r["page"], r["step"]))
+        if old is None:
+            continue
+        print(f"{r['page']:<38}{r['step']:<28}"
+              f"{old['cold_ms']:>7.1f} -> {r['cold_ms']:<6.1f}{old['warm_ms']:>7.1f} -> {r['warm_ms']:<6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="+", default=PAGES, metavar="PAGE",
+                        help="pages to run, relative to the repository root (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per step")
+    parser.add_argument("--out", type=Path, help="JSON file to write "
+                        "(default: benchmarks/results/page_reruns-<timestamp>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier JSON results to compare with")
+    parser.add_argument("--worker", metavar="PAGE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(bench_page(args.worker, args.repeat)))
+        return
+
+    import streamlit
+
+    results = []
+    print(f"{'page':<38}{'step':<28}{'cold ms':>9}{'warm ms':>9}{'p95 ms':>9}"
+          f"{'peak KiB':>10}{'delta B':>10}")
+    for page in args.pages:
+        # A fresh interpreter per page, so every page starts cold
+        worker = subprocess.run(
+            [sys.executable, __file__, "--worker", page, "--repeat", str(args.repeat)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if worker.returncode != 0:
+            print(f"{page:<38}failed:\n{worker.stderr[-2000:]}")
+            continue
+        for r in json.loads(worker.stdout.strip().splitlines()[-1]):
+            results.append(r)
+            print(f"{r['page']:<38}{r['step']:<28}{r['cold_ms']:>9.1f}{r['warm_ms']:>9.1f}"
+                  f"{r['warm_p95_ms']:>9.1f}{r['peak_kib']:>10,}{r['delta_bytes']:>10,}")
+
+    now = datetime.now(timezone.utc)
+    out = args.out or RESULTS_DIR / f"page_reruns-{now:%Y%m%dT%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps({
+        "timestamp": now.isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "repeat": args.repeat,
+        "results": results,
+    }, indent=2))
+    print(f"\nWrote {out.relative_to(ROOT) if out.is_relative_to(ROOT) else out}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
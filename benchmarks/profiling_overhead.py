@@ -0,0 +1,79 @@
+"""Benchmark the cost of utils.profiling sections, disabled and enabled.
+
+Times an empty ``with section(...)`` block and a call through a
+``@profiled()`` function, first with no page being profiled (the default)
+and then inside a recorded rerun, against the bare loop or call.
+
+Run from the repository root:
+
+    python benchmarks/profiling_overhead.py
+    python benchmarks/profiling_overhead.py --calls 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.profiling import Recorder, _current, profiled, section
+
+
+def noop():
+    pass
+
+
+traced_noop = profiled()(noop)
+
+
+def per_call_ns(run, calls: int) -> float:
+    start = time.perf_counter_ns()
+    run(calls)
+    return (time.perf_counter_ns() - start) / calls
+
+
+def bare_loop(calls):
+    for _ in range(calls):
+        pass
+
+
+def sections(calls):
+    for _ in range(calls):
+        with section("noop"):
+            pass
+
+
+def bare_calls(calls):
+    for _ in range(calls):
+        noop()
+
+
+def decorated_calls(calls):
+    for _ in range(calls):
+        traced_noop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    base = {"section": per_call_ns(bare_loop, args.calls),
+            "profiled": per_call_ns(bare_calls, args.calls)}
+    runs = {"section": sections, "profiled": decorated_calls}
+    print(f"{'':<10}{'baseline ns':>13}{'disabled ns':>13}{'enabled ns':>13}")
+    for name, run in runs.items():
+        disabled = per_call_ns(run, args.calls)
+        # Enabled sections record into a rerun and trace allocations
+        token = _current.set(Recorder("benchmark"))
+        try:
+            enabled = per_call_ns(run, args.calls // 10)
+        finally:
+            _current.get().finish()
+            _current.reset(token)
+        print(f"{name:<10}{base[name]:>13.0f}{disabled:>13.0f}{enabled:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
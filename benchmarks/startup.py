@@ -0,0 +1,145 @@
+"""Time a cold ``streamlit run Home.py`` and check it against a budget.
+
+Each run starts a fresh server and records:
+
+* ready: from launching the process until ``/_stcore/health`` answers;
+* first render: from a new session asking for the page (the message the
+  browser sends when it connects) until the script run finishes, i.e. the
+  page's imports and first rerun.
+
+Other pages can be rendered after Home in the same server with ``--pages``;
+each is timed as that page's first render in the process. The median over
+``--runs`` servers is reported. The script exits with status 1 if ready
+plus Home's first render is over ``--budget`` seconds, so it can gate a
+change.
+
+Run from the repository root:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 5 --budget 2.5
+    python benchmarks/startup.py --pages About "Large Institutions"
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+APP = "Home.py"
+DEFAULT_BUDGET = 3.0
+SERVER_TIMEOUT = 60
+RENDER_TIMEOUT = 300
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, log) -> subprocess.Popen:
+    # Output goes to a file: a full pipe would block the server mid-run
+    return subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT, stdout=log, stderr=subprocess.STDOUT,
+    )
+
+
+def wait_ready(server: subprocess.Popen, port: int) -> float:
+    """Poll the health endpoint; return the seconds since ``server`` was started."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < SERVER_TIMEOUT:
+        if server.poll() is not None:
+            raise RuntimeError("server exited")
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health", timeout=1):
+                return time.perf_counter() - start
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError(f"server not ready after {SERVER_TIMEOUT} s")
+
+
+async def render(port: int, page: str) -> float:
+    """Run ``page`` ("" for Home) in a new session; return the seconds it took."""
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from websockets.asyncio.client import connect
+
+    request = BackMsg()
+    request.rerun_script.query_string = ""
+    request.rerun_script.page_name = page
+    async with connect(f"ws://localhost:{port}/_stcore/stream", subprotocols=["streamlit"],
+                       max_size=None) as ws:
+        start = time.perf_counter()
+        await ws.send(request.SerializeToString())
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(await asyncio.wait_for(ws.recv(), RENDER_TIMEOUT))
+            if message.WhichOneof("type") != "script_finished":
+                continue
+            if message.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+                status = ForwardMsg.ScriptFinishedStatus.Name(message.script_finished)
+                raise RuntimeError(f"{page or APP} did not finish: {status}")
+            return time.perf_counter() - start
+
+
+def measure(pages: List[str]) -> Dict[str, float]:
+    """Start one server and time it; returns seconds per measurement."""
+    port = free_port()
+    with tempfile.TemporaryFile("w+") as log:
+        start = time.perf_counter()
+        server = start_server(port, log)
+        try:
+            times = {"ready": wait_ready(server, port)}
+            times[APP] = asyncio.run(render(port, ""))
+            times["startup"] = time.perf_counter() - start
+            for page in pages:
+                times[page] = asyncio.run(render(port, page.replace(" ", "_")))
+            return times
+        except Exception as error:
+            log.seek(0)
+            raise RuntimeError(f"{error}\nserver output:\n{log.read()[-2000:]}") from error
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3, help="fresh servers to start")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"seconds allowed until Home is rendered (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--pages", nargs="+", default=[], metavar="PAGE",
+                        help="other pages to render after Home, by name (e.g. About)")
+    parser.add_argument("--json", type=Path, help="also write the medians here")
+    args = parser.parse_args()
+
+    runs = [measure(args.pages) for _ in range(args.runs)]
+    medians = {name: round(statistics.median(run[name] for run in runs), 3) for name in runs[0]}
+    print(f"{'server ready':<48}{medians['ready'] * 1000:>9.0f} ms")
+    print(f"{'first render of ' + APP:<48}{medians[APP] * 1000:>9.0f} ms")
+    for page in args.pages:
+        print(f"{'first render of ' + page:<48}{medians[page] * 1000:>9.0f} ms")
+    print(f"{'startup (launch to Home rendered)':<48}{medians['startup'] * 1000:>9.0f} ms"
+          f"   budget {args.budget * 1000:.0f} ms")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({"budget": args.budget, "median_s": medians}, indent=2))
+    if medians["startup"] > args.budget:
+        print(f"Over budget by {(medians['startup'] - args.budget) * 1000:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,15 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import base64
-from pathlib import Path
+
+from utils.assets import DEFAULT_BACKGROUND, background_url
+from utils.profiling import profile_page
 
 def add_bg_from_local(image_file):
-    # Convert string path to Path object and resolve it
-    image_path = Path(image_file).resolve()
-    
     try:
-        with open(image_path, "rb") as f:
-            img_data = f.read()
-        b64_encoded = base64.b64encode(img_data).decode()
+        bg_url = background_url(image_file)
         return f'''
         <style>
         .stApp {{
-            background-image: url(data:image/jfif;base64,{b64_encoded});
+            background-image: url("{bg_url}");
             background-size: cover;
             background-repeat: no-repeat;
             background-attachment: fixed;
@@ -33,15 +26,15 @@ def add_bg_from_local(image_file):
         st.error(f"Error loading image: {str(e)}")
         return ""
 
+@profile_page("About")
 def run():
     # Page configuration
     st.set_page_config(
         page_icon=":grey_exclamation:",
     )
     
-    # Add background image - Using raw string for path
-    image_path = Path("images") / "aaron douglas - from slavery to recognition.jfif"
-    st.markdown(add_bg_from_local(image_path), unsafe_allow_html=True)
+    # Add background image
+    st.markdown(add_bg_from_local(DEFAULT_BACKGROUND), unsafe_allow_html=True)
 
 
     # Page header
@@ -1,23 +1,17 @@
 import streamlit as st
-from pathlib import Path
-import base64
 
-st.set_page_config(
-    page_icon=":speech_balloon:",
-)
+from utils.assets import DEFAULT_BACKGROUND, background_url
+from utils.profiling import profile_page
 
 
 def add_bg_from_local(image_file):
     try:
-        image_path = Path(image_file).resolve()
-        with open(image_path, "rb") as f:
-            img_data = f.read()
-        b64_encoded = base64.b64encode(img_data).decode()
+        bg_url = background_url(image_file)
         
         return f"""
         <style>
         .stApp {{
-            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url(data:image/jfif;base64,{b64_encoded});
+            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url("{bg_url}");
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -86,14 +80,6 @@ def add_bg_from_local(image_file):
         return ""
 
 
-# Add background image
-image_path = Path("images") / "aaron douglas - from slavery to recognition.jfif"
-st.markdown(add_bg_from_local(image_path), unsafe_allow_html=True)
-
-
-st.title("Get in Touch")
-st.write("Questions, ideas, or just want to connect? Reach out through our socials or email—we’d love to hear from you! Check out our contact info and photos below. Looking forward to connecting!")
-
 # Team member dictionary with relevant information
 team_members = [
     {
@@ -172,15 +158,33 @@ def display_member(member):
         
         st.markdown("</div>", unsafe_allow_html=True)
 
-# Display team members in a 2-column layout
-for i in range(0, len(team_members), 2):
-    cols = st.columns(2)
+@profile_page("Contact")
+def main():
+    # Page configuration
+    st.set_page_config(
+        page_icon=":speech_balloon:",
+    )
+
+    # Add background image
+    st.markdown(add_bg_from_local(DEFAULT_BACKGROUND), unsafe_allow_html=True)
+
+
+    st.title("Get in Touch")
+    st.write("Questions, ideas, or just want to connect? Reach out through our socials or email—we’d love to hear from you! Check out our contact info and photos below. Looking forward to connecting!")
+
+    # Display team members in a 2-column layout
+    for i in range(0, len(team_members), 2):
+        cols = st.columns(2)
     
-    with cols[0]:
-        display_member(team_members[i])
+        with cols[0]:
+            display_member(team_members[i])
     
-    if i + 1 < len(team_members):
-        with cols[1]:
-            display_member(team_members[i + 1])
+        if i + 1 < len(team_members):
+            with cols[1]:
+                display_member(team_members[i + 1])
     
-    st.markdown("<br>", unsafe_allow_html=True)
\ No newline at end of file
+        st.markdown("<br>", unsafe_allow_html=True)
+
+
+if __name__ == "__main__":
+    main()
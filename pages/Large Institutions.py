@@ -1,58 +1,35 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from pathlib import Path
-
-# Set page configuration
-st.set_page_config(
-    page_title="Museum Collections Analysis",
-    page_icon="🎨",
-    layout="wide"
-)
-
-# Title and introduction
-st.title("Museum Collections Analysis Dashboard")
-st.markdown("""
-This dashboard analyzes artist diversity across the Museum of Modern Art (MoMA) and smaller museums,
-combining data from MoMA's public dataset and hand-collected data from smaller institutions.
-""")
-
-# Methodology Section - Placed at the top for context
-with st.expander("📚 Methodology", expanded=False):
-    st.markdown("""
-    ### Project Overview
-    This analysis combines the MoMA Artists dataset with data from smaller museums, focusing on artist 
-    diversity and institutional representation. The data comes from two main sources:
-    
-    1. **MoMA Collection Data**
-       - Sourced from [MoMA's GitHub Repository](https://github.com/MuseumofModernArt/collection)
-       - Includes comprehensive artist and artwork information
-    
-    2. **Smaller Museums Dataset**
-       - Hand-collected by Abigail Gedney at Western Washington University
-       - Features currently displayed artists
-       - Includes self-distinguished ethnicities from artists' personal websites/portfolios
-    
-    ### Data Processing Steps
-    1. Downloaded and preprocessed MoMA data
-    2. Cleaned and standardized artist names and dates
-    3. Integrated hand-collected smaller museum data
-    4. Merged datasets while maintaining institutional attribution
-    
-    ### Analysis Goals
-    - Examine artist diversity across institutions
-    - Compare representation in major vs. smaller museums
-    - Track changes in artist diversity over time
-    """)
+from functools import partial
+
+from utils.aggregates import bucket_tail, shared_cube
+from utils.artists import ARTIST_ID
+from utils.browser import TableBrowser, show_browser
+from utils.datasets import dataset_version, dataset_view
+from utils.groups import GROUP_COLUMNS, REPRESENTATION_GROUPS
+from utils.export import EXPORT_FORMATS, read_export
+from utils.figures import cached_figure
+from utils.lazy import lazy_import
+from utils.profiling import profile_page, profiled, section
+from utils.search import RowSearch
+from utils.tabs import lazy_tabs
+from utils.trends import BIN_WIDTHS, TrendEngine
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+# Session state key holding the open tab
+LARGE_TABS_KEY = "large_tabs"
+
+# Columns shown in the Raw Data tab (the derived flag columns are left out)
+BROWSER_COLUMNS = ['Artist', 'Nationality', 'Gender', 'BeginDate', 'EndDate', 'Museum',
+                   'Ethnicity', 'Race', 'Continent']
 
 # Load data
-@st.cache_data
+@profiled()
 def load_data():
     try:
-        # Use Path to create cross-platform compatible path
-        data_path = Path('data') / 'combinedSmallandLargeFinal.csv'
-        df = pd.read_csv(data_path)
+        # Shared, read-only view; derived columns are computed once per process
+        df = dataset_view("combined")
         return df
     except FileNotFoundError:
         st.error("Error: Could not find the dataset file. Please check if 'combinedSmallandLargeFinal.csv' exists in the data directory.")
@@ -61,53 +38,180 @@ def load_data():
         st.error(f"Error loading data: {str(e)}")
         return None
 
-df = load_data()
+# Counts for every chart are sliced from this cube, shared by all sessions
+@profiled()
+def load_cube():
+    try:
+        # Count each artist once, however many museums hold their work
+        return shared_cube("combined", flags=GROUP_COLUMNS, unique=ARTIST_ID)
+    except Exception:
+        # load_data() has already reported the error
+        return None
+
+# Search index and sort keys for the Raw Data tab, rebuilt when batches are ingested
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_browser(version):
+    return TableBrowser(
+        dataset_view("combined"),
+        search_columns=['Artist', 'Nationality', 'Museum'],
+        columns=BROWSER_COLUMNS
+    )
+
+# Typo-tolerant artist search, rebuilt when batches are ingested
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_search(version):
+    return RowSearch(dataset_view("combined"), ['Artist', 'Nationality', 'Museum'])
+
+# Birth-year arrays for the trend charts, rebuilt when batches are ingested
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_trends(version):
+    return TrendEngine(dataset_view("combined"), flags=GROUP_COLUMNS)
 
-if df is not None:
-    # Create tabs for different analyses
-    tab1, tab2, tab3 = st.tabs([
-        "Nationality Distribution", 
-        "African Representation",
-        "Historical Trends"
-    ])
+# Each widget and what it drives is a fragment: using it reruns only that part
+@profiled()
+@st.fragment(key="artist_search")
+def show_artist_search():
+    query = st.text_input("Find an Artist",
+                          placeholder="Artist, nationality or museum, e.g. Kehinde Wiley")
+    if query.strip():
+        with section("artist search"):
+            results = load_search(dataset_version("combined")).search(query)
+        if results.empty:
+            st.info(f"No artists found for \"{query}\".")
+        else:
+            st.dataframe(
+                results[BROWSER_COLUMNS + ['Matched on', 'Score']],
+                hide_index=True,
+                use_container_width=True,
+                column_config={'Score': st.column_config.ProgressColumn(
+                    'Match', min_value=0.0, max_value=3.0, format="%.2f")},
+            )
+
+@profiled()
+@st.fragment(key="nationality_chart")
+def show_nationality_chart(cube):
+    top_k = st.slider("Nationalities to show", 5, 40, 20,
+                      help="The remaining nationalities are summed into one \"Other\" bar")
+
+    def build_nationality_chart():
+        nationality_df = bucket_tail(cube.counts('Nationality'), 'Nationality', k=top_k)
     
-    with tab1:
-        # Nationality Analysis
-        nationality_counts = df['Nationality'].value_counts().head(20)
-        nationality_df = nationality_counts.reset_index()
-        nationality_df.columns = ['Nationality', 'Count']
-        
         fig_nationality = px.bar(nationality_df, 
                      x='Count', 
                      y='Nationality',
                      orientation='h',
-                     title='Top 20 Nationality Counts in the Museum of Modern Art',
+                     title=f'Top {top_k} Nationality Counts Across All Museums',
                      color='Count',
                      color_continuous_scale='viridis')
-        
+    
+        # Largest at the top, with "Other" pinned to the bottom
         fig_nationality.update_layout(
             showlegend=False,
             xaxis_title="Count",
             yaxis_title="Nationality",
-            yaxis={'categoryorder':'total ascending'},
+            yaxis={'categoryorder': 'array',
+                   'categoryarray': nationality_df['Nationality'].tolist()[::-1]},
             margin=dict(l=20, r=20, t=40, b=20),
         )
-        
-        st.plotly_chart(fig_nationality, use_container_width=True)
+        return fig_nationality
+
+    fig_nationality = cached_figure("combined", "nationality_top", {"top_k": top_k},
+                                    build_nationality_chart)
     
-    with tab2:
-        # African Representation Analysis
-        african_df = df[
-            df['Ethnicity'].str.contains('African', na=False) |
-            df['Nationality'].str.contains('African', na=False)
-        ]
-
-        # Calculate total number of artists
-        total_artists = len(df)
-        african_count = len(african_df)
-        non_african_count = total_artists - african_count
-
-        # Create pie chart with absolute values
+    st.plotly_chart(fig_nationality, use_container_width=True)
+
+@profiled()
+@st.fragment(key="trend_chart")
+def show_trends(trends):
+    group_labels = {group.column: group.label for group in REPRESENTATION_GROUPS}
+    col1, col2, col3 = st.columns([2, 2, 3])
+    with col1:
+        bin_label = st.select_slider("Bin width", options=list(BIN_WIDTHS), value="Decade")
+        group = st.selectbox("Group", list(group_labels), format_func=group_labels.get)
+    with col2:
+        cumulative = st.toggle("Cumulative", help="Count every artist born up to each bin")
+        smooth = st.slider("Smoothing (bins)", 1, 9, 1, step=2, disabled=cumulative,
+                           help="Sum counts over this many neighbouring bins before taking the proportion")
+    if cumulative:
+        # Running totals aren't smoothed; one cached chart for any slider value
+        smooth = 1
+    with col3:
+        compared = st.multiselect("Compare museums", trends.museums,
+                                  placeholder="All museums combined")
+
+    width = BIN_WIDTHS[bin_label]
+    trend_params = {"width": width, "group": group, "cumulative": cumulative,
+                    "smooth": smooth, "museums": tuple(compared)}
+
+    def build_trend_chart():
+        trend_df = trends.trend(width, group, by_museum=bool(compared), cumulative=cumulative,
+                                smooth=smooth, museums=compared or None)
+        where = "by Museum" if compared else "Across All Museums"
+        fig_trends = px.line(trend_df, x='Period', y='Proportion', color='Museum',
+                             markers=True, hover_data={'Count': ':,', 'Total': ':,'},
+                             color_discrete_sequence=['lightcoral'] + px.colors.qualitative.Set2)
+        fig_trends.update_layout(
+            title={
+                'text': f'Proportion of {group_labels[group]} Artists Over Time {where}',
+                'y': 0.95,
+                'x': 0.5,
+                'xanchor': 'center',
+                'yanchor': 'top'
+            },
+            xaxis_title=f"Birth year ({bin_label.lower()} bins)",
+            yaxis_title="Cumulative proportion" if cumulative else "Proportion",
+            yaxis_tickformat = ',.1%',
+            hovermode='x unified',
+            showlegend=bool(compared)
+        )
+        return fig_trends
+
+    fig_trends = cached_figure("combined", "group_trend", trend_params, build_trend_chart)
+    
+    st.plotly_chart(fig_trends, use_container_width=True)
+    
+    # Add contextual information
+    st.markdown(f"""
+    ### Analysis Insights
+    This visualization shows how the representation of {group_labels[group]} artists changes
+    with the artists' birth years. Key observations:
+    - The trend line indicates changes in the proportion of {group_labels[group]} artists relative to all artists
+    - Each point represents one {bin_label.lower()} bin; choose another width or smooth over neighbouring bins above
+    - Each artist is counted once overall, and once per museum when comparing museums
+    - Hover over points to see exact proportions and artist counts
+    """)
+
+@profiled()
+@st.fragment(key="download")
+def show_download():
+    export_fmt = st.selectbox(
+        "File format",
+        list(EXPORT_FORMATS),
+        format_func=lambda fmt: EXPORT_FORMATS[fmt].label
+    )
+    export_format = EXPORT_FORMATS[export_fmt]
+    
+    # The file is only built when the button is clicked, then cached on disk
+    st.download_button(
+        label=f"Download Dataset as {export_format.label}",
+        data=partial(read_export, "combined", export_fmt),
+        file_name=f"museum_artists_analysis.{export_format.extension}",
+        mime=export_format.mime,
+        on_click="ignore"
+    )
+
+# Tab contents; lazy_tabs only runs the open one
+def show_african_representation(cube):
+    # African Representation Analysis
+    total_artists = cube.total()
+    african_count = cube.total(is_african=True)
+    non_african_count = total_artists - african_count
+
+    # Create pie chart with absolute values
+    def build_african_chart():
         fig_african = go.Figure(data=[go.Pie(
             labels=['African', 'Non-African'],
             values=[african_count, non_african_count],
@@ -136,103 +240,108 @@ if df is not None:
                 x=0.5
             )
         )
+        return fig_african
 
-        st.plotly_chart(fig_african, use_container_width=True)
-
-        # Display actual numbers
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("### Representation Statistics")
-            st.markdown(f"""
-            - Total Artists: {total_artists:,}
-            - African Artists: {african_count:,} ({african_count/total_artists:.2%})
-            - Non-African Artists: {non_african_count:,} ({non_african_count/total_artists:.2%})
-            """)
-        with col2:
-            st.markdown("### Top 10 Nationalities")
-            st.write(df['Nationality'].value_counts().head(10).to_frame('Count'))
-
-    with tab3:
-        st.markdown("### Historical Trends in African Representation")
-        
-        # Convert BeginDate to numeric and create decade grouping
-        df['BeginDate'] = pd.to_numeric(df['BeginDate'], errors='coerce')
-        df['Decade'] = (df['BeginDate'] // 10) * 10
-        
-        # Filter data
-        filtered_df = df[df['Decade'] >= 1000].copy()
-        
-        african_data = filtered_df[
-            filtered_df['Ethnicity'].str.contains('African', na=False) |
-            filtered_df['Nationality'].str.contains('African', na=False)
-        ]
-        
-        # Calculate proportions
-        total_per_decade = filtered_df.groupby('Decade').size()
-        african_per_decade = african_data.groupby('Decade').size()
-        proportion = (african_per_decade / total_per_decade).fillna(0)
-        
-        # Create dataframe for plotting
-        trend_df = pd.DataFrame({
-            'Decade': proportion.index,
-            'Proportion': proportion.values
-        })
-        
-        # Create Plotly line chart
-        fig_trends = go.Figure()
-        fig_trends.add_trace(
-            go.Scatter(
-                x=trend_df['Decade'],
-                y=trend_df['Proportion'],
-                mode='lines+markers',
-                name='Proportion',
-                line=dict(color='lightcoral'),
-                marker=dict(size=8)
-            )
-        )
-        
-        fig_trends.update_layout(
-            title={
-                'text': 'Proportion of African Representation Over Time at Museum of Modern Art',
-                'y': 0.95,
-                'x': 0.5,
-                'xanchor': 'center',
-                'yanchor': 'top'
-            },
-            xaxis_title="Decade",
-            yaxis_title="Proportion",
-            yaxis_tickformat = ',.1%',
-            hovermode='x unified',
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig_trends, use_container_width=True)
-        
-        # Add contextual information
-        st.markdown("""
-        ### Analysis Insights
-        This visualization shows the historical progression of African representation in the museum's 
-        collection over time. Key observations:
-        - The trend line indicates changes in the proportion of African artists relative to the total collection
-        - Each point represents a decade's proportion of African representation
-        - Hover over points to see exact proportions for each decade
+    fig_african = cached_figure("combined", "african_share", None, build_african_chart)
+
+    st.plotly_chart(fig_african, use_container_width=True)
+
+    # Display actual numbers
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("### Representation Statistics")
+        st.markdown(f"""
+        - Total Artists: {total_artists:,}
+        - African Artists: {african_count:,} ({african_count/total_artists:.2%})
+        - Non-African Artists: {non_african_count:,} ({non_african_count/total_artists:.2%})
         """)
-    
-    # Download section at the bottom
-    st.header("Download Data")
+    with col2:
+        st.markdown("### Top 10 Nationalities")
+        st.write(cube.counts('Nationality').head(10).set_index('Nationality'))
+
+def show_historical_trends():
+    st.markdown("### Historical Trends in Representation")
+
+    show_trends(load_trends(dataset_version("combined")))
+
+def show_raw_data():
+    st.markdown("### Browse the Combined Dataset")
+    # Only the visible page of rows is sent to the browser
+    show_browser(load_browser(dataset_version("combined")), "combined_raw",
+                 "Search by artist, nationality or museum")
+
+@profile_page("Large Institutions")
+def main():
+    # Set page configuration
+    st.set_page_config(
+        page_title="Museum Collections Analysis",
+        page_icon="🎨",
+        layout="wide"
+    )
+
+    # Title and introduction
+    st.title("Museum Collections Analysis Dashboard")
     st.markdown("""
-    The processed dataset is available for download. This includes:
-    - Combined artist information from MoMA and smaller museums
-    - Standardized ethnicity classifications
-    - Institutional attribution
+    This dashboard analyzes artist diversity across the Museum of Modern Art (MoMA) and smaller museums,
+    combining data from MoMA's public dataset and hand-collected data from smaller institutions.
     """)
+
+    # Methodology Section - Placed at the top for context
+    with st.expander("📚 Methodology", expanded=False):
+        st.markdown("""
+        ### Project Overview
+        This analysis combines the MoMA Artists dataset with data from smaller museums, focusing on artist 
+        diversity and institutional representation. The data comes from two main sources:
     
-    csv = df.to_csv(index=False)
-    st.download_button(
-        label="Download Dataset as CSV",
-        data=csv,
-        file_name="museum_artists_analysis.csv",
-        mime="text/csv"
-    )
-else:
-    st.error("Unable to load the dataset. Please check the file path and try again.")
\ No newline at end of file
+        1. **MoMA Collection Data**
+           - Sourced from [MoMA's GitHub Repository](https://github.com/MuseumofModernArt/collection)
+           - Includes comprehensive artist and artwork information
+    
+        2. **Smaller Museums Dataset**
+           - Hand-collected by Abigail Gedney at Western Washington University
+           - Features currently displayed artists
+           - Includes self-distinguished ethnicities from artists' personal websites/portfolios
+    
+        ### Data Processing Steps
+        1. Downloaded and preprocessed MoMA data
+        2. Cleaned and standardized artist names and dates
+        3. Integrated hand-collected smaller museum data
+        4. Merged datasets while maintaining institutional attribution
+    
+        ### Analysis Goals
+        - Examine artist diversity across institutions
+        - Compare representation in major vs. smaller museums
+        - Track changes in artist diversity over time
+        """)
+
+    df = load_data()
+    cube = load_cube()
+
+    if df is not None and cube is not None:
+        # Artist search across both museums
+        show_artist_search()
+
+        # Create tabs for different analyses; only the open one is computed
+        lazy_tabs(LARGE_TABS_KEY, {
+            "Nationality Distribution": lambda: show_nationality_chart(cube),
+            "African Representation": lambda: show_african_representation(cube),
+            "Historical Trends": show_historical_trends,
+            "Raw Data": show_raw_data,
+        })
+
+        # Download section at the bottom
+        st.header("Download Data")
+        st.markdown("""
+        The processed dataset is available for download. This includes:
+        - Combined artist information from MoMA and smaller museums
+        - Standardized ethnicity classifications
+        - Institutional attribution
+        """)
+    
+        show_download()
+    else:
+        st.error("Unable to load the dataset. Please check the file path and try again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,26 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
-import base64
+
+from utils.assets import DEFAULT_BACKGROUND, background_url
+from utils.cooccurrence import COOCCURRENCE_PATH, load_index
+from utils.datasets import DATA_DIR, dataset_version, dataset_view, file_version
+from utils.lazy import lazy_import
+from utils.profiling import profile_page, profiled, section
+from utils.search import SubstringIndex
+from utils.sentiment import SENTIMENT_CSV, load_scores
+from utils.tfidf import INSTITUTION_WORDS_PATH, load_tfidf
+
+go = lazy_import("plotly.graph_objects")
 
 def add_bg_from_local(image_file):
     try:
-        image_path = Path(image_file).resolve()
-        with open(image_path, "rb") as f:
-            img_data = f.read()
-        b64_encoded = base64.b64encode(img_data).decode()
+        bg_url = background_url(image_file)
         
         return f"""
         <style>
         .stApp {{
-            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url(data:image/jfif;base64,{b64_encoded});
+            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url("{bg_url}");
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -121,240 +126,419 @@ def add_bg_from_local(image_file):
         st.error(f"Error loading image: {str(e)}")
         return ""
 
-# Page Configuration
-st.set_page_config(
-    page_icon=":mortar_board:",
-    page_title="Mission Statement Analysis",
-    layout="wide"
-)
-
-# Add background image
-image_path = Path("images") / "aaron douglas - from slavery to recognition.jfif"
-st.markdown(add_bg_from_local(image_path), unsafe_allow_html=True)
-
-
 # Define words to highlight (you can modify this list)
 HIGHLIGHT_WORDS = ['global','diverse','diversity','african','equity',
                    'black','women','inclusion','community','culture',
                    'cultural','identity','outreach','equitable','discrimination',
                    'integrity'
 ]
+HIGHLIGHT_SET = {w.lower() for w in HIGHLIGHT_WORDS}
+HIGHLIGHT_COLOR = '#FF6B6B'  # Coral red for highlighted words
+REGULAR_COLOR = '#4A90E2'  # Blue for regular words
 
-# Title
-st.title("Mission Statement Analysis")
+# Loaders are cached per version of the table they read, so tables rewritten
+# by scripts/process_statements.py are picked up without a restart
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_word_freq(version):
+    """Load the word frequencies once, flag highlighted words and index them for search."""
+    df = dataset_view("word_freq")
+    df = df.assign(is_highlighted=df['Words'].str.lower().isin(HIGHLIGHT_SET))
+    return df, SubstringIndex(df['Words'])
 
-try:
-    # Read data
-    data_path = Path('data/Mission_Statement_Word_Freq.csv')
-    df = pd.read_csv(data_path)
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_sentiment(version):
+    """Load the statement sentiment scores once per version (None until they are built)."""
+    return load_scores()
+
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_institution_index(version):
+    """Memory-map the institution TF-IDF index once per version (None until it is built)."""
+    return load_tfidf()
+
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_cooccurrence(version):
+    """Load the word co-occurrence index once per version (None until it is built)."""
+    return load_index()
+
+# Each widget and what it drives is a fragment: using it reruns only that part
+@profiled()
+@st.fragment(key="word_chart")
+def show_word_chart(df, show_highlights):
+    """Bar chart of the most frequent words, with its word count slider."""
+    # Slider for selecting number of words to display
+    num_words = st.slider("Number of words to display", 5, 50, 25)
+    top_n = df.head(num_words)
     
-    # Create two columns for better layout
-    col1, col2 = st.columns([2, 1])
+    # Create enhanced bar graph with highlighting as a single trace
+    if show_highlights:
+        highlighted = top_n['is_highlighted'].to_numpy()
+    else:
+        highlighted = np.zeros(len(top_n), dtype=bool)
+    colors = np.where(highlighted, HIGHLIGHT_COLOR, REGULAR_COLOR)
+    counts = top_n['Frequency'].astype(str).to_numpy()
     
-    with col1:
-        st.subheader("Mission Statement Word Frequencies")
-        
-        # Add highlight controls
-        show_highlights = st.checkbox("ADEI Buzzwords", value=True)
-        if show_highlights:
-            st.info(f"Highlighted words: {', '.join(HIGHLIGHT_WORDS)}")
-        
-        # Slider for selecting number of words to display
-        num_words = st.slider("Number of words to display", 5, 50, 25)
-        top_n = df.head(num_words)
-        
-        # Create enhanced bar graph with highlighting
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Create bars with different colors based on highlighting
-        bars = []
-        for i, (word, freq) in enumerate(zip(top_n['Words'], top_n['Frequency'])):
-            if show_highlights and word.lower() in [w.lower() for w in HIGHLIGHT_WORDS]:
-                # Highlighted bars
-                bar = ax.bar(i, freq, color='#FF6B6B')  # Coral red for highlighted words
-            else:
-                # Regular bars
-                bar = ax.bar(i, freq, color='#4A90E2')  # Blue for regular words
-            bars.append(bar[0])
-        
-        # Customize the graph
-        ax.set_xlabel('Words', fontsize=10)
-        ax.set_ylabel('Frequency', fontsize=10)
-        ax.set_title('Distribution of Most Common Words in Mission Statements', fontsize=12)
-        
-        # Set x-axis labels
-        plt.xticks(range(len(top_n)), top_n['Words'], rotation=45, ha='right')
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            word_idx = bars.index(bar)
-            word = top_n['Words'].iloc[word_idx]
-            
-            # Different text color and weight for highlighted words
-            if show_highlights and word.lower() in [w.lower() for w in HIGHLIGHT_WORDS]:
-                color = '#FF6B6B'
-                weight = 'bold'
-            else:
-                color = '#4A90E2'
-                weight = 'normal'
-                
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom',
-                   color=color,
-                   weight=weight)
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        
-    with col2:
-        # Display interactive dataframe with highlighting
-        st.subheader("Word Frequency Data")
-        
-        # Add search functionality
-        search_word = st.text_input("Search for a specific word:")
-        
-        # Style the dataframe to highlight specific words
-        def highlight_words(row):
-            if show_highlights and row['Words'].lower() in [w.lower() for w in HIGHLIGHT_WORDS]:
-                return ['background-color: #FFE0E0'] * len(row)
-            return [''] * len(row)
-        
-        if search_word:
-            filtered_df = df[df['Words'].str.contains(search_word, case=False)]
-            st.dataframe(filtered_df.style.apply(highlight_words, axis=1))
-        else:
-            st.dataframe(df.style.apply(highlight_words, axis=1))
+    # Value labels on top of bars, bold for highlighted words
+    labels = np.where(highlighted, '<b>' + counts + '</b>', counts)
     
-      # Add summary statistics
-    st.subheader("Quick Statistics")
-    col3, col4, col5 = st.columns(3)
+    fig = go.Figure(go.Bar(
+        x=top_n['Words'],
+        y=top_n['Frequency'],
+        marker_color=colors,
+        text=labels,
+        textposition='outside',
+        textfont=dict(color=colors),
+        cliponaxis=False,
+        hovertemplate="<b>%{x}</b><br>Frequency: %{y}<extra></extra>"
+    ))
     
-    # Calculate highlighted words statistics
-    highlighted_words_present = df[df['Words'].str.lower().isin([w.lower() for w in HIGHLIGHT_WORDS])]
+    # Customize the graph
+    fig.update_layout(
+        title='Distribution of Most Common Words in Mission Statements',
+        xaxis_title='Words',
+        yaxis_title='Frequency',
+        xaxis_tickangle=-45,
+        height=500,
+        margin=dict(t=60, b=20),
+        showlegend=False
+    )
     
-    with col3:
-        st.metric("Words That Occur Three or More Times", len(df))
-    with col4:
-        st.metric("Highlighted Words Found", 
-                 len(highlighted_words_present),
-                 f"out of {len(HIGHLIGHT_WORDS)} tracked")
-    with col5:
-        if not highlighted_words_present.empty:
-            top_highlighted = highlighted_words_present.iloc[0]
-            st.metric("Top Highlighted Word", 
-                     top_highlighted['Words'],
-                     f"Frequency: {top_highlighted['Frequency']}")
-        else:
-            st.metric("Top Highlighted Word", "None found", "No highlighted words in data")
+    st.plotly_chart(fig, use_container_width=True)
 
-    # Add Key Findings section
-    st.markdown("---")
-    st.subheader("Research Findings")
+@profiled()
+@st.fragment(key="word_table")
+def show_word_table(df, word_index, show_highlights):
+    """Searchable table of word frequencies."""
+    # Add search functionality
+    search_word = st.text_input("Search for a specific word:")
     
-    # Study Overview
-    st.markdown("""
-    ### Study Overview
-    This research analyzed 81 museum mission statements to examine the alignment between institutional language and actual diversity practices. 
-    Our methodology included examining common word frequencies, conducting sentiment analysis, and analyzing word co-occurrences to understand 
-    the tones and language patterns used in these statements.
-    """)
+    if search_word:
+        filtered_df = df.iloc[word_index.search(search_word)]
+    else:
+        filtered_df = df
     
-    # Create columns for detailed findings
-    find_col1, find_col2 = st.columns([1, 1])
+    # Mark highlighted words with a column instead of styling every row
+    columns = ['Words', 'Frequency', 'is_highlighted'] if show_highlights else ['Words', 'Frequency']
+    st.dataframe(
+        filtered_df,
+        column_order=columns,
+        column_config={
+            'is_highlighted': st.column_config.CheckboxColumn(
+                "ADEI", help="Word is one of the highlighted ADEI buzzwords"
+            )
+        }
+    )
+
+@profiled()
+@st.fragment(key="cooccurring_words")
+def show_cooccurring_words(cooccurrence):
+    """Table of the words appearing near a chosen word."""
+    # Words ordered by how much they co-occur, highlighted words first
+    options = list(cooccurrence.degree().index)
+    if not options:
+        st.info("No words co-occur in the processed statements.")
+        return
+    default = next((w for w in HIGHLIGHT_WORDS if w in cooccurrence), options[0])
+    query = st.selectbox("Words that appear near:", options,
+                         index=options.index(default))
+    top_k = st.slider("Number of co-occurring words", 5, 25, 10)
+    st.dataframe(cooccurrence.neighbors(query, top_k), hide_index=True)
+
+@profiled()
+@st.fragment(key="cooccurrence_heatmap")
+def show_cooccurrence_heatmap(cooccurrence, words):
+    """Heatmap of how often the most frequent words occur together."""
+    heatmap_size = st.slider("Words in heatmap", 5, 30, 15)
+    heatmap_words = [w for w in words if w in cooccurrence][:heatmap_size]
+    heatmap = go.Figure(go.Heatmap(
+        z=cooccurrence.matrix(heatmap_words),
+        x=heatmap_words,
+        y=heatmap_words,
+        colorscale='Blues',
+        hovertemplate="%{y} + %{x}: %{z}<extra></extra>"
+    ))
+    heatmap.update_layout(
+        title='Co-occurrence of the Most Frequent Words',
+        xaxis_tickangle=-45,
+        yaxis_autorange='reversed',
+        height=550,
+        margin=dict(t=60, b=20)
+    )
+    st.plotly_chart(heatmap, use_container_width=True)
+
+@profiled()
+@st.fragment(key="similar_institutions")
+def show_similar_institutions(tfidf):
+    """Institutions with similar statements, next to the clusters they fall in."""
+    sim_col1, sim_col2 = st.columns([1, 1])
+
+    with sim_col1, section("similar institutions"):
+        institution = st.selectbox("Institutions whose mission statements read like:",
+                                   tfidf.institutions)
+        num_similar = st.slider("Number of similar institutions", 3, 20, 5)
+        st.dataframe(
+            tfidf.similar(institution, num_similar),
+            hide_index=True,
+            column_config={
+                'Similarity': st.column_config.ProgressColumn(
+                    "Similarity", help="Cosine similarity of TF-IDF word vectors",
+                    min_value=0.0, max_value=1.0, format="%.2f"
+                )
+            }
+        )
+
+    with sim_col2, section("institution clusters"):
+        clusters = tfidf.cluster_table()
+        sizes = clusters['Cluster'].value_counts().sort_index()
+        cluster_labels = [f"{c}: {', '.join(tfidf.cluster_terms[c][:3])}" for c in sizes.index]
+        selected = int(clusters.loc[clusters['Institution'] == institution, 'Cluster'].iloc[0])
+        cluster_fig = go.Figure(go.Bar(
+            x=sizes.to_numpy(),
+            y=cluster_labels,
+            orientation='h',
+            marker_color=np.where(sizes.index == selected, HIGHLIGHT_COLOR, REGULAR_COLOR),
+            hovertemplate="%{y}<br>Institutions: %{x}<extra></extra>"
+        ))
+        cluster_fig.update_layout(
+            title='Institution Clusters by Mission Statement Vocabulary',
+            xaxis_title='Institutions',
+            yaxis_autorange='reversed',
+            height=350,
+            margin=dict(t=60, b=20)
+        )
+        st.plotly_chart(cluster_fig, use_container_width=True)
+        peers = clusters.loc[(clusters['Cluster'] == selected) &
+                             (clusters['Institution'] != institution), 'Institution']
+        st.caption(f"{institution} is in cluster {selected}, alongside: "
+                   f"{', '.join(peers.head(10))}")
+
+@profile_page("Mission Statement Analysis")
+def main():
+    # Page Configuration
+    st.set_page_config(
+        page_icon=":mortar_board:",
+        page_title="Mission Statement Analysis",
+        layout="wide"
+    )
+
+    # Add background image
+    st.markdown(add_bg_from_local(DEFAULT_BACKGROUND), unsafe_allow_html=True)
+
+    # Title
+    st.title("Mission Statement Analysis")
+
+    try:
+        # Read data
+        df, word_index = load_word_freq(dataset_version("word_freq"))
     
-    with find_col1:
-        st.markdown("""
-        ### Common Words Analysis
-        The analysis of word frequencies revealed important patterns:
+        # Create two columns for better layout
+        col1, col2 = st.columns([2, 1])
+    
+        with col1, section("word frequencies"):
+            st.subheader("Mission Statement Word Frequencies")
         
-        - **Top-Tier Words** (Most Frequent):
-          - "american"
-          - "cultural"
-          - "world"
-          - "community"
-          - "global"
+            # Add highlight controls
+            show_highlights = st.checkbox("ADEI Buzzwords", value=True)
+            if show_highlights:
+                st.info(f"Highlighted words: {', '.join(HIGHLIGHT_WORDS)}")
         
-        - **Second-Tier Words** (9-12 occurrences):
-          - "diverse"
-          - "diversity"
-          - "african"
-          - "equity" (fewer than 10 mentions across 80+ statements)
+            show_word_chart(df, show_highlights)
         
-        **Key Finding:** Only approximately 10% of mission statements employ language explicitly supporting diversity claims, 
-        which correlates with the limited diversity representation observed in other platforms like social media.
-        """)
+        with col2:
+            # Display interactive dataframe with highlighting
+            st.subheader("Word Frequency Data")
+        
+            show_word_table(df, word_index, show_highlights)
+
+            with section("sentiment"):
+                # Statement sentiment next to the frequency chart
+                st.subheader("Statement Sentiment")
+                sentiment = load_sentiment(file_version(DATA_DIR / SENTIMENT_CSV))
+                if sentiment is None:
+                    st.caption("Sentiment scores have not been built yet. Run "
+                               "`python scripts/process_statements.py <statements>` to generate them.")
+                else:
+                    polarity = sentiment['Polarity']
+                    st.metric("Average Polarity", f"{polarity.mean():.3f}",
+                              f"range {polarity.min():.2f} to {polarity.max():.2f}", delta_color="off")
+                    sentiment_fig = go.Figure(go.Histogram(
+                        x=polarity,
+                        xbins=dict(start=-1, end=1, size=0.1),
+                        marker_color=REGULAR_COLOR,
+                        hovertemplate="Polarity %{x}<br>Statements: %{y}<extra></extra>"
+                    ))
+                    sentiment_fig.update_layout(
+                        xaxis_title='Polarity (-1 negative to +1 positive)',
+                        yaxis_title='Statements',
+                        xaxis_range=[-1, 1],
+                        height=250,
+                        margin=dict(t=10, b=10)
+                    )
+                    st.plotly_chart(sentiment_fig, use_container_width=True)
+    
+          # Add summary statistics
+        st.subheader("Quick Statistics")
+        col3, col4, col5 = st.columns(3)
+    
+        # Calculate highlighted words statistics
+        highlighted_words_present = df[df['is_highlighted']]
+    
+        with col3:
+            st.metric("Words That Occur Three or More Times", len(df))
+        with col4:
+            st.metric("Highlighted Words Found", 
+                     len(highlighted_words_present),
+                     f"out of {len(HIGHLIGHT_WORDS)} tracked")
+        with col5:
+            if not highlighted_words_present.empty:
+                top_highlighted = highlighted_words_present.iloc[0]
+                st.metric("Top Highlighted Word", 
+                         top_highlighted['Words'],
+                         f"Frequency: {top_highlighted['Frequency']}")
+            else:
+                st.metric("Top Highlighted Word", "None found", "No highlighted words in data")
+
+        # Word co-occurrence section
+        st.markdown("---")
+        st.subheader("Word Co-occurrence")
+        cooccurrence = load_cooccurrence(file_version(COOCCURRENCE_PATH))
+
+        if cooccurrence is None:
+            st.info("Co-occurrence data has not been built yet. Run "
+                    "`python scripts/process_statements.py <statements>` to generate it.")
+        else:
+            co_col1, co_col2 = st.columns([1, 2])
+
+            with co_col1:
+                show_cooccurring_words(cooccurrence)
+
+            with co_col2:
+                show_cooccurrence_heatmap(cooccurrence, df['Words'])
+
+        # Institution similarity section
+        st.markdown("---")
+        st.subheader("Similar Institutions")
+        tfidf = load_institution_index(file_version(INSTITUTION_WORDS_PATH))
+
+        if tfidf is None:
+            st.info("Per-institution word counts have not been built yet. Run "
+                    "`python scripts/process_statements.py <statements>` to generate them.")
+        else:
+            show_similar_institutions(tfidf)
+
+        # Add Key Findings section
+        st.markdown("---")
+        st.subheader("Research Findings")
     
-    with find_col2:
+        # Study Overview
         st.markdown("""
-        ### Sentiment Analysis
-        Using TextBlob analysis tools, we evaluated the emotional tone of statements:
-        
-        - **Scale:** -1 (negative) to +1 (positive)
-        - **Average Score:** 0.1778
-        - **Range:**
-          - Minimum: -0.2
-          - Maximum: 0.8
-        
-        **Key Finding:** Mission statements generally maintain a neutral tone with a slight positive 
-        lean, suggesting careful and measured institutional messaging rather than strongly 
-        emotional or aspirational language.
+        ### Study Overview
+        This research analyzed 81 museum mission statements to examine the alignment between institutional language and actual diversity practices. 
+        Our methodology included examining common word frequencies, conducting sentiment analysis, and analyzing word co-occurrences to understand 
+        the tones and language patterns used in these statements.
         """)
     
-    # Add overall implications
-    st.markdown("""
-    ### Research Implications
-    This analysis reveals a significant gap between institutional rhetoric and diversity initiatives. While museums often 
-    present themselves as globally-oriented cultural institutions, the limited use of diversity-related language in mission 
-    statements (only ~10%) suggests a disconnect between public messaging and diversity commitments. The neutral tone of 
-    most statements, combined with sparse use of DEI terminology, indicates that many institutions may not be explicitly 
-    positioning themselves as champions of diversity and inclusion in their core messaging.
-    """)
-
- # Add overall summary
-    st.markdown("""
-    ### Summary of Analysis
-    This word frequency analysis demonstrates how institutions are articulating their commitments through mission statements. 
-    The data suggests a balance between traditional academic missions and evolving societal responsibilities, particularly 
-    in areas of diversity, equity, and inclusion. The varying frequency of ADEI-related terms may indicate different levels 
-    of emphasis across institutions, while also highlighting opportunities for more explicit integration of these concepts 
-    into institutional messaging.
-    """)
+        # Create columns for detailed findings
+        find_col1, find_col2 = st.columns([1, 1])
     
-    # Add descriptive section at the bottom
-    st.markdown("---")  # Add a horizontal line for visual separation
+        with find_col1:
+            st.markdown("""
+            ### Common Words Analysis
+            The analysis of word frequencies revealed important patterns:
+        
+            - **Top-Tier Words** (Most Frequent):
+              - "american"
+              - "cultural"
+              - "world"
+              - "community"
+              - "global"
+        
+            - **Second-Tier Words** (9-12 occurrences):
+              - "diverse"
+              - "diversity"
+              - "african"
+              - "equity" (fewer than 10 mentions across 80+ statements)
+        
+            **Key Finding:** Only approximately 10% of mission statements employ language explicitly supporting diversity claims, 
+            which correlates with the limited diversity representation observed in other platforms like social media.
+            """)
     
-    with st.expander("About This Analysis", expanded=False):
+        with find_col2:
+            st.markdown("""
+            ### Sentiment Analysis
+            Using TextBlob analysis tools, we evaluated the emotional tone of statements:
+        
+            - **Scale:** -1 (negative) to +1 (positive)
+            - **Average Score:** 0.1778
+            - **Range:**
+              - Minimum: -0.2
+              - Maximum: 0.8
+        
+            **Key Finding:** Mission statements generally maintain a neutral tone with a slight positive 
+            lean, suggesting careful and measured institutional messaging rather than strongly 
+            emotional or aspirational language.
+            """)
+    
+        # Add overall implications
         st.markdown("""
-        ### Understanding the Mission Statement Analysis
-        
-        This dashboard provides a comprehensive analysis of word frequencies in institutional mission statements, with a particular focus on Access, Diversity, Equity, and Inclusion (ADEI) related terms. Here's what you're seeing:
-        
-        #### 🎯 Purpose
-        - Identify and track the most commonly used words across mission statements
-        - Highlight ADEI-related terms to understand their prevalence
-        - Provide interactive tools for deeper analysis of word usage patterns
-        
-        #### 📊 Features Explained
-        - **Bar Graph**: Shows the distribution of the most frequent words, with ADEI terms highlighted in coral red
-        - **Word Frequency Data**: Searchable table of all words that appear three or more times
-        - **Quick Statistics**: Overview of total word count, ADEI terms found, and top highlighted words
-        
-        #### 🔍 How to Use
-        1. Use the slider to adjust how many words you want to see in the graph
-        2. Toggle the "ADEI Buzzwords" checkbox to highlight relevant terms
-        3. Search for specific words using the search box in the Word Frequency Data section
-        4. Click on column headers in the data table to sort by frequency or alphabetically
-        
-        #### 📈 Data Notes
-        - Only words appearing three or more times are included in the analysis
-        - ADEI terms are pre-defined and can be modified as needed
-        - Frequencies represent the total count across all analyzed mission statements
+        ### Research Implications
+        This analysis reveals a significant gap between institutional rhetoric and diversity initiatives. While museums often 
+        present themselves as globally-oriented cultural institutions, the limited use of diversity-related language in mission 
+        statements (only ~10%) suggests a disconnect between public messaging and diversity commitments. The neutral tone of 
+        most statements, combined with sparse use of DEI terminology, indicates that many institutions may not be explicitly 
+        positioning themselves as champions of diversity and inclusion in their core messaging.
         """)
 
-except FileNotFoundError:
-    st.error("Could not find the CSV file in the data directory.")
-    st.info(f"Current working directory: {Path.cwd()}")
-except Exception as e:
-    st.error(f"An unexpected error occurred: {str(e)}")
\ No newline at end of file
+     # Add overall summary
+        st.markdown("""
+        ### Summary of Analysis
+        This word frequency analysis demonstrates how institutions are articulating their commitments through mission statements. 
+        The data suggests a balance between traditional academic missions and evolving societal responsibilities, particularly 
+        in areas of diversity, equity, and inclusion. The varying frequency of ADEI-related terms may indicate different levels 
+        of emphasis across institutions, while also highlighting opportunities for more explicit integration of these concepts 
+        into institutional messaging.
+        """)
+    
+        # Add descriptive section at the bottom
+        st.markdown("---")  # Add a horizontal line for visual separation
+    
+        with st.expander("About This Analysis", expanded=False):
+            st.markdown("""
+            ### Understanding the Mission Statement Analysis
+        
+            This dashboard provides a comprehensive analysis of word frequencies in institutional mission statements, with a particular focus on Access, Diversity, Equity, and Inclusion (ADEI) related terms. Here's what you're seeing:
+        
+            #### 🎯 Purpose
+            - Identify and track the most commonly used words across mission statements
+            - Highlight ADEI-related terms to understand their prevalence
+            - Provide interactive tools for deeper analysis of word usage patterns
+        
+            #### 📊 Features Explained
+            - **Bar Graph**: Shows the distribution of the most frequent words, with ADEI terms highlighted in coral red
+            - **Word Frequency Data**: Searchable table of all words that appear three or more times
+            - **Quick Statistics**: Overview of total word count, ADEI terms found, and top highlighted words
+        
+            #### 🔍 How to Use
+            1. Use the slider to adjust how many words you want to see in the graph
+            2. Toggle the "ADEI Buzzwords" checkbox to highlight relevant terms
+            3. Search for specific words using the search box in the Word Frequency Data section
+            4. Click on column headers in the data table to sort by frequency or alphabetically
+        
+            #### 📈 Data Notes
+            - Only words appearing three or more times are included in the analysis
+            - ADEI terms are pre-defined and can be modified as needed
+            - Frequencies represent the total count across all analyzed mission statements
+            """)
+
+    except FileNotFoundError:
+        st.error("Could not find the CSV file in the data directory.")
+        st.info(f"Current working directory: {Path.cwd()}")
+    except Exception as e:
+        st.error(f"An unexpected error occurred: {str(e)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,39 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-from pathlib import Path
-import plotly.graph_objects as go
-import base64
-from typing import Optional, Dict, Any
-import numpy as np
+from typing import Optional
 
-# Cache the data loading to improve performance
-@st.cache_data
+from utils.aggregates import CountCube, bucket_tail, shared_cube
+from utils.artists import ARTIST_ID
+from utils.assets import background_url
+from utils.browser import TableBrowser, show_browser
+from utils.continents import unmapped_nationalities
+from utils.datasets import dataset_version, dataset_view
+from utils.figures import cached_figure
+from utils.lazy import lazy_import
+from utils.profiling import profile_page, profiled, section
+from utils.tabs import lazy_tabs
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+BACKGROUND_IMAGE = "aaron douglas - song of the tower.jfif"
+
+# Pie charts show at most this many slices; smaller groups are summed as "Other"
+MAX_PIE_SLICES = 12
+MIN_PIE_SHARE = 0.01
+
+# Session state key holding the open tab
+SMALL_TABS_KEY = "small_tabs"
+
+# Columns shown in the Raw Data tab (the derived ArtistID is left out)
+BROWSER_COLUMNS = ['Name', 'Nationality', 'Gender', 'Museum', 'SmallMuseum', 'Continent']
+
+@profiled()
 def load_data() -> Optional[pd.DataFrame]:
-    """Load and preprocess the museum data."""
+    """Load the museum data as a shared, read-only view."""
     try:
-        data_path = Path('data/Small Museum Data - Sheet1 (1).csv')
-        df = pd.read_csv(data_path, skiprows=1, names=['Name', 'Nationality', 'Gender', 'Museum', 'SmallMuseum'])
-        
-        # Clean the data
-        df = df.fillna('Unknown')
-        df['Gender'] = df['Gender'].str.strip()
-        df['Nationality'] = df['Nationality'].str.strip()
+        # Cleaned, typed and derived once per process by utils.datasets
+        df = dataset_view("small")
         
         return df
     except FileNotFoundError:
@@ -28,81 +43,23 @@ def load_data() -> Optional[pd.DataFrame]:
         st.error(f"⚠️ Error loading data: {str(e)}")
         return None
 
-@st.cache_data
-def create_continent_map() -> Dict[str, str]:
-    """Create mapping of nationalities to continents."""
-    return {
-        # North America
-        "American": "North America",
-        "African-American": "North America",
-        "Native American": "North America",
-        "Mexican": "North America",
-        "Mexican-American": "North America",
-        "Canadian": "North America",
-        "Canadian-American": "North America",
-        "Cuban": "North America",
-        "Cuban-American": "North America",
-        "Bahamian": "North America",
-        "Haitian": "North America",
-        "American-Haitian": "North America",
-        "Dominican": "North America",
-        
-        # South America
-        "Peruvian": "South America",
-        "Brazilian": "South America",
-        "Brazilian-American": "South America",
-        "Venezuelan": "South America",
-        "Colombian": "South America",
-        
-        # Europe
-        "German": "Europe",
-        "German-American": "Europe",
-        "Irish-American": "Europe",
-        "Italian": "Europe",
-        "Italian-American": "Europe",
-        "Dutch": "Europe",
-        "Norwegian": "Europe",
-        "Swedish": "Europe",
-        "Danish": "Europe",
-        "Finnish": "Europe",
-        "Polish-Ukrainian": "Europe",
-        "British": "Europe",
-        "British-American": "Europe",
-        "French": "Europe",
-        "Icelandic-Danish": "Europe",
-        "English": "Europe",
-        
-        # Africa
-        "Nigerian": "Africa",
-        "Ghanaian": "Africa",
-        "Kenyan": "Africa",
-        "Ugandan": "Africa",
-        "Congolese": "Africa",
-        "South African": "Africa",
-        
-        # Asia
-        "Indian": "Asia",
-        "Lebanese": "Asia",
-        "Turkish": "Asia",
-        "Chinese": "Asia",
-        "Chinese-American": "Asia",
-        "South Korean": "Asia",
-        "Japanese": "Asia",
-        "Korean": "Asia",
-        "American-Korean": "Asia",
-        "Palestinian-American": "Asia",
-        "Singaporean": "Asia",
-        "Asian-American": "Asia",
-        
-        # Oceania
-        "Australian": "Oceania",
-        
-        # Multinational
-        "Canadian-Ukrainian": "Multinational/Other",
-        "Haitian Jamaican": "Multinational/Other",
-    }
+@profiled()
+def load_cube() -> Optional[CountCube]:
+    """Return the nationality/gender/continent count cube shared by all sessions."""
+    try:
+        return shared_cube("small", unique=ARTIST_ID)
+    except Exception:
+        # load_data() has already reported the error
+        return None
+
+@profiled()
+@st.cache_resource(max_entries=2)
+def load_browser(version: str) -> TableBrowser:
+    """Index the raw data for searching and paging, once per dataset version."""
+    return TableBrowser(dataset_view("small"), search_columns=['Name', 'Nationality'],
+                        columns=BROWSER_COLUMNS)
 
-def create_pie_chart(data: pd.DataFrame, names: str, values: str, title: str) -> Optional[go.Figure]:
+def create_pie_chart(data: pd.DataFrame, names: str, values: str, title: str) -> Optional["go.Figure"]:
     """Create an enhanced pie chart with custom styling."""
     try:
         fig = px.pie(
@@ -143,7 +100,7 @@ def create_pie_chart(data: pd.DataFrame, names: str, values: str, title: str) ->
         st.error(f"⚠️ Error creating pie chart: {str(e)}")
         return None
 
-def create_bar_chart(data: pd.DataFrame, x: str, y: str, title: str) -> Optional[go.Figure]:
+def create_bar_chart(data: pd.DataFrame, x: str, y: str, title: str) -> Optional["go.Figure"]:
     """Create an enhanced bar chart with custom styling."""
     try:
         fig = px.bar(
@@ -218,7 +175,7 @@ def show_overview(df: pd.DataFrame):
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total Artists", len(df))
+        st.metric("Total Artists", df[ARTIST_ID].nunique())
     with col2:
         st.metric("Museums Represented", df['Museum'].nunique())
     with col3:
@@ -226,6 +183,38 @@ def show_overview(df: pd.DataFrame):
     
     st.divider()
 
+@profiled()
+@st.fragment(key="small_nationality_chart")
+def show_nationality_chart(nationality_counts: pd.DataFrame):
+    """Render the minimum count filter and the nationality pie it controls.
+
+    This is a fragment, so changing the filter reruns only this chart.
+    """
+    min_count = st.number_input(
+        "Minimum count to display",
+        min_value=1,
+        value=1,
+        key="nationality_filter",
+        help=f"Smaller nationalities, and any beyond the top {MAX_PIE_SLICES}, "
+             "are grouped as \"Other\""
+    )
+    
+    filtered_nationality = bucket_tail(
+        nationality_counts, 'Nationality', k=MAX_PIE_SLICES,
+        min_share=MIN_PIE_SHARE, min_count=min_count
+    )
+    
+    fig = cached_figure("small", "nationality_pie", {"min_count": min_count},
+        lambda: create_pie_chart(
+            filtered_nationality,
+            'Nationality',
+            'Count',
+            'Artist Nationality Distribution'
+        )
+    )
+    if fig:
+        st.plotly_chart(fig, use_container_width=True)
+
 def render_data_table(df: pd.DataFrame, title: str, height: int = 500):
     """Render a styled dataframe with consistent formatting."""
     st.markdown(f"""
@@ -243,6 +232,80 @@ def render_data_table(df: pd.DataFrame, title: str, height: int = 500):
         height=height
     )
 
+def show_nationality_tab(cube: CountCube):
+    """Nationality pie (with its filter) and counts."""
+    st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Nationality Distribution</h2>", unsafe_allow_html=True)
+    col1, col2 = st.columns([2, 1])
+    
+    nationality_counts = cube.counts('Nationality')
+    with col1:
+        show_nationality_chart(nationality_counts)
+    
+    with col2:
+        render_data_table(nationality_counts, "Nationality Data")
+
+def show_gender_tab(cube: CountCube):
+    """Gender pie and counts."""
+    st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Gender Distribution</h2>", unsafe_allow_html=True)
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        gender_counts = cube.counts('Gender')
+        
+        fig = cached_figure("small", "gender_pie", None,
+            lambda: create_pie_chart(
+                bucket_tail(gender_counts, 'Gender', k=MAX_PIE_SLICES,
+                            min_share=MIN_PIE_SHARE),
+                'Gender',
+                'Count',
+                'Artist Gender Distribution'
+            )
+        )
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        render_data_table(gender_counts, "Gender Data")
+
+def show_continental_tab(cube: CountCube, df: pd.DataFrame):
+    """Continent pie and counts, and the nationalities without a continent."""
+    st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Continental Distribution</h2>", unsafe_allow_html=True)
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        continent_counts = cube.counts('Continent')
+        
+        fig = cached_figure("small", "continent_pie", None,
+            lambda: create_pie_chart(
+                bucket_tail(continent_counts, 'Continent', k=MAX_PIE_SLICES,
+                            min_share=MIN_PIE_SHARE),
+                'Continent',
+                'Count',
+                'Artist Distribution by Continent'
+            )
+        )
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        render_data_table(continent_counts, "Continental Data")
+        
+        # Report nationalities the continent classifier couldn't resolve
+        unmapped = unmapped_nationalities(df['Nationality'])
+        if not unmapped.empty:
+            st.warning(
+                f"{int(unmapped.sum())} artists have a nationality that could not be "
+                f"mapped to a continent: {', '.join(unmapped.index.astype(str))}"
+            )
+
+def show_raw_data_tab():
+    """Searchable, paginated raw data."""
+    st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Raw Data</h2>", unsafe_allow_html=True)
+    # Only the visible page of rows is sent to the browser
+    show_browser(load_browser(dataset_version("small")), "small_raw",
+                 "Search artists by name or nationality", height=600)
+
+@profile_page("Small Institutions")
 def main():
     # Page configuration
     st.set_page_config(
@@ -252,127 +315,37 @@ def main():
     
     # Load background image
     try:
-        image_path = Path('images/aaron douglas - song of the tower.jfif')
-        with open(image_path, "rb") as f:
-            img_data = f.read()
-            b64_encoded = base64.b64encode(img_data).decode()
-            st.markdown(generate_background_style(b64_encoded), unsafe_allow_html=True)
+        st.markdown(generate_background_style(background_url(BACKGROUND_IMAGE)), unsafe_allow_html=True)
     except Exception as e:
         st.warning(f"Background image could not be loaded: {str(e)}")
     
     # Load and process data
     df = load_data()
+    cube = load_cube()
     
-    if df is not None:
+    if df is not None and cube is not None:
         try:
-            show_overview(df)
-            
-            # Create navigation tabs
-            tabs = st.tabs([
-                "Nationality",
-                "Gender",
-                "Continental",
-                "Raw Data"
-            ])
-            
-            # Nationality Distribution Tab
-            with tabs[0]:
-                st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Nationality Distribution</h2>", unsafe_allow_html=True)
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    nationality_counts = df['Nationality'].value_counts().reset_index()
-                    nationality_counts.columns = ['Nationality', 'Count']
-                    
-                    min_count = st.number_input(
-                        "Minimum count to display",
-                        min_value=1,
-                        value=1,
-                        key="nationality_filter"
-                    )
-                    
-                    filtered_nationality = nationality_counts[
-                        nationality_counts['Count'] >= min_count
-                    ]
-                    
-                    fig = create_pie_chart(
-                        filtered_nationality,
-                        'Nationality',
-                        'Count',
-                        'Artist Nationality Distribution'
-                    )
-                    if fig:
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    render_data_table(nationality_counts, "Nationality Data")
-            
-            # Gender Distribution Tab
-            with tabs[1]:
-                st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Gender Distribution</h2>", unsafe_allow_html=True)
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    gender_counts = df['Gender'].value_counts().reset_index()
-                    gender_counts.columns = ['Gender', 'Count']
-                    
-                    fig = create_pie_chart(
-                        gender_counts,
-                        'Gender',
-                        'Count',
-                        'Artist Gender Distribution'
-                    )
-                    if fig:
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    render_data_table(gender_counts, "Gender Data")
-            
-            # Continental Distribution Tab
-            with tabs[2]:
-                st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Continental Distribution</h2>", unsafe_allow_html=True)
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    df['Continent'] = df['Nationality'].map(create_continent_map())
-                    continent_counts = df['Continent'].value_counts().reset_index()
-                    continent_counts.columns = ['Continent', 'Count']
-                    
-                    fig = create_pie_chart(
-                        continent_counts,
-                        'Continent',
-                        'Count',
-                        'Artist Distribution by Continent'
-                    )
-                    if fig:
-                        st.plotly_chart(fig, use_container_width=True)
-                
-                with col2:
-                    render_data_table(continent_counts, "Continental Data")
+            with section("overview"):
+                show_overview(df)
             
-            # Raw Data Tab
-            with tabs[3]:
-                st.markdown("<h2 style='color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.5);'>Raw Data</h2>", unsafe_allow_html=True)
-                search = st.text_input("Search artists by name or nationality")
-                if search:
-                    filtered_df = df[
-                        df['Name'].str.contains(search, case=False) |
-                        df['Nationality'].str.contains(search, case=False)
-                    ]
-                else:
-                    filtered_df = df
-                st.dataframe(filtered_df, height=600)
+            # Create navigation tabs; only the open one is computed
+            lazy_tabs(SMALL_TABS_KEY, {
+                "Nationality": lambda: show_nationality_tab(cube),
+                "Gender": lambda: show_gender_tab(cube),
+                "Continental": lambda: show_continental_tab(cube, df),
+                "Raw Data": show_raw_data_tab,
+            })
 
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
             st.write("Please check your data format and contents.")
 
-def generate_background_style(b64_encoded: str) -> str:
+def generate_background_style(bg_url: str) -> str:
     """Generate CSS styles for the dashboard with enhanced accessibility."""
     return """
         <style>
         .stApp {
-            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url(data:image/jfif;base64,""" + b64_encoded + """);
+            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url('""" + bg_url + """');
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -1,18 +1,16 @@
 import streamlit as st
-from pathlib import Path
-import base64
+
+from utils.assets import DEFAULT_BACKGROUND, background_url
+from utils.profiling import profile_page
 
 def add_bg_from_local(image_file):
     try:
-        image_path = Path(image_file).resolve()
-        with open(image_path, "rb") as f:
-            img_data = f.read()
-        b64_encoded = base64.b64encode(img_data).decode()
+        bg_url = background_url(image_file)
         
         return f"""
         <style>
         .stApp {{
-            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url(data:image/jfif;base64,{b64_encoded});
+            background-image: linear-gradient(rgba(0, 0, 0, 0.7), rgba(0, 0, 0, 0.7)), url("{bg_url}");
             background-size: cover;
             background-position: center;
             background-repeat: no-repeat;
@@ -98,6 +96,7 @@ def add_bg_from_local(image_file):
         st.error(f"Error loading image: {str(e)}")
         return ""
 
+@profile_page("Solution")
 def main():
     st.set_page_config(
         page_title="Solutions for Improved Transparency",
@@ -106,8 +105,7 @@ def main():
     )
 
     # Add background image
-    image_path = Path("images") / "aaron douglas - from slavery to recognition.jfif"
-    st.markdown(add_bg_from_local(image_path), unsafe_allow_html=True)
+    st.markdown(add_bg_from_local(DEFAULT_BACKGROUND), unsafe_allow_html=True)
 
 
     st.title("Museum Diversity Transparency Framework")
@@ -0,0 +1,35 @@
+"""Build typed columnar copies of the CSV datasets in data/build/.
+
+Run from the repository root after changing any CSV in data/:
+
+    python scripts/build_data.py            # build every dataset
+    python scripts/build_data.py combined   # build only the named datasets
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.datasets import DATASETS, build_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help=f"datasets to build, from {', '.join(DATASETS)} (default: all)")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(DATASETS)
+    if unknown:
+        parser.error(f"unknown dataset(s): {', '.join(sorted(unknown))}")
+
+    for name in args.names or DATASETS:
+        start = time.perf_counter()
+        path = build_dataset(name)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name:<10} -> {path} ({elapsed:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Add new museum batches to data/partitions/ without rebuilding the datasets.
+
+Each CSV must have the columns of "Small Museum Data - Sheet1 (1).csv"
+(Name, Nationality, Gender, Museum, SmallMuseum). Run from the repository
+root:
+
+    python scripts/ingest_batch.py new_museum.csv [--name "Museum Name"]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+
+from utils.aggregates import shared_cube
+from utils.artists import ARTIST_ID
+from utils.continents import unmapped_nationalities
+from utils.groups import GROUP_COLUMNS
+from utils.ingest import ingest_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", type=Path, help="batch CSV files")
+    parser.add_argument("--name", help="label for the partition file (default: the museum)")
+    args = parser.parse_args()
+
+    # Load once so the timings below only cover the incremental update
+    before = shared_cube("combined", flags=GROUP_COLUMNS, unique=ARTIST_ID).total()
+
+    for path in args.paths:
+        try:
+            partition = ingest_batch(path, args.name)
+        except (OSError, ValueError) as e:
+            parser.exit(1, f"{path}: {e}\n")
+        rows = pd.read_csv(partition, dtype=str)
+        print(f"{path} -> {partition.name} ({len(rows)} rows)")
+
+        unmapped = unmapped_nationalities(rows["Nationality"].fillna("Unknown"))
+        if not unmapped.empty:
+            print(f"  nationalities without a continent: {', '.join(unmapped.index)}")
+
+    start = time.perf_counter()
+    after = shared_cube("combined", flags=GROUP_COLUMNS, unique=ARTIST_ID).total()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"combined artists: {before:,} -> {after:,} (incremental update {elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Build the mission statement word tables from raw statements.
+
+The corpus is a directory of .txt files (one per institution) or a JSONL
+file of {"institution": ..., "text": ...} records. Run from the repository
+root:
+
+    python scripts/process_statements.py statements/            # writes to data/
+    python scripts/process_statements.py statements.jsonl --workers 4 --min-count 3
+
+Writes data/Mission_Statement_Word_Freq.csv (read by the Mission Statement
+Analysis page), data/Mission_Statement_Institution_Words.csv, the word
+co-occurrence table data/Mission_Statement_Cooccurrence.csv and the
+sentiment tables data/Mission_Statement_Sentiment.csv and
+data/Mission_Statement_Sentence_Sentiment.csv, then rebuilds the word
+frequency dataset and the institution TF-IDF index in data/build/.
+Sentiment scores are cached in data/build/, so only new or edited
+statements are scored on a re-run.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.cooccurrence import COOCCURRENCE_CSV, DEFAULT_WINDOW, pairs_table
+from utils.datasets import BUILD_DIR, DATA_DIR, DATASETS, build_dataset
+from utils.sentiment import SENTENCE_SENTIMENT_CSV, SENTIMENT_CSV, SentimentScorer
+from utils.tfidf import INSTITUTION_WORDS_PATH, build_tfidf
+from utils.text import INSTITUTION_WORDS_CSV, count_corpus, read_corpus
+
+SENTIMENT_CACHE = BUILD_DIR / "sentiment_cache.csv"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", type=Path, help="directory of .txt files or a .jsonl file")
+    parser.add_argument("--out-dir", type=Path, default=DATA_DIR,
+                        help="where to write the CSV tables (default: data/)")
+    parser.add_argument("--workers", type=int, help="tokenizer processes (default: one per CPU)")
+    parser.add_argument("--min-count", type=int, default=3,
+                        help="leave out words used fewer times than this (default: 3)")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help=f"co-occurrence window in words (default: {DEFAULT_WINDOW})")
+    parser.add_argument("--min-pair-count", type=int, default=2,
+                        help="leave out word pairs seen fewer times than this (default: 2)")
+    args = parser.parse_args()
+    if not args.corpus.exists():
+        parser.error(f"{args.corpus} does not exist")
+
+    start = time.perf_counter()
+    try:
+        counts = count_corpus(read_corpus(args.corpus), workers=args.workers,
+                              window=args.window)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{args.corpus}: {e}\n")
+    elapsed = time.perf_counter() - start
+    if not counts.by_institution:
+        parser.exit(1, f"{args.corpus}: no statements found\n")
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    freq_path = args.out_dir / DATASETS["word_freq"].csv_name
+    freq = counts.frequency_table(args.min_count)
+    freq.to_csv(freq_path, index=False)
+    institution_path = args.out_dir / INSTITUTION_WORDS_CSV
+    counts.institution_table().to_csv(institution_path, index=False)
+    pairs_path = args.out_dir / COOCCURRENCE_CSV
+    pairs = pairs_table(counts.pairs, args.min_pair_count)
+    pairs.to_csv(pairs_path, index=False)
+
+    start = time.perf_counter()
+    scorer = SentimentScorer()
+    scorer.load_cache(SENTIMENT_CACHE)
+    statements, sentences = scorer.score(read_corpus(args.corpus))
+    scorer.save_cache(SENTIMENT_CACHE)
+    sentiment_elapsed = time.perf_counter() - start
+    statements.to_csv(args.out_dir / SENTIMENT_CSV, index=False)
+    sentences.to_csv(args.out_dir / SENTENCE_SENTIMENT_CSV, index=False)
+
+    print(f"{len(counts.by_institution)} institutions tokenized in {elapsed:.2f} s")
+    print(f"{len(freq)} words used {args.min_count}+ times -> {freq_path}")
+    print(f"per-institution counts -> {institution_path}")
+    print(f"{len(pairs)} word pairs seen {args.min_pair_count}+ times -> {pairs_path}")
+    print(f"{scorer.misses} statements scored, {scorer.hits} unchanged, "
+          f"in {sentiment_elapsed:.2f} s -> {args.out_dir / SENTIMENT_CSV}")
+    if freq_path.resolve() == DATASETS["word_freq"].csv_path.resolve():
+        print(f"rebuilt {build_dataset('word_freq')}")
+    if institution_path.resolve() == INSTITUTION_WORDS_PATH.resolve():
+        index = build_tfidf()
+        print(f"rebuilt TF-IDF index: {len(index)} institutions x {len(index.terms)} words, "
+              f"{len(index.cluster_terms)} clusters")
+
+
+if __name__ == "__main__":
+    main()
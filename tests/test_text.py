@@ -0,0 +1,9 @@
+from utils.text import tokenize
+
+
+def test_tokenize_drops_stopwords_before_folding_plurals():
+    assert tokenize("does themselves") == []
+
+
+def test_tokenize_folds_plurals_of_other_words():
+    assert tokenize("The museums' communities") == ["museum", "community"]
@@ -0,0 +1,26 @@
+import pandas as pd
+
+from utils.tfidf import TfidfIndex
+
+
+def small_index() -> TfidfIndex:
+    counts = pd.DataFrame({
+        "Institution": ["A", "A", "B", "B", "C"],
+        "Words": ["art", "community", "art", "history", "community"],
+        "Count": [3, 1, 2, 2, 4],
+    })
+    return TfidfIndex.build(counts, n_clusters=2)
+
+
+def test_similar_leaves_out_the_institution_itself():
+    similar = small_index().similar("A", k=2)
+    assert "A" not in set(similar["Institution"])
+    assert len(similar) == 2
+
+
+def test_similar_clamps_k_to_the_other_institutions():
+    index = small_index()
+    similar = index.similar("B", k=20)
+    assert sorted(similar["Institution"]) == ["A", "C"]
+    assert (similar["Similarity"] >= 0).all()
+    assert similar["Similarity"].is_monotonic_decreasing
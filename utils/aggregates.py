@@ -0,0 +1,205 @@
+"""Precomputed artist counts that the dashboard charts slice from.
+
+A :class:`CountCube` groups the artist rows once by every available
+dimension. Charts then sum the (much smaller) cube instead of scanning the
+full dataset with ``value_counts``/``groupby`` on every rerun.
+:func:`bucket_tail` then folds the long tail of a count table into one
+"Other" row, so a chart's size doesn't grow with the number of categories.
+
+:func:`shared_cube` keeps one cube per dataset for the whole process and,
+when new museum batches are ingested, extends it with just the new rows.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.datasets import LoadedDataset, load_shared
+from utils.profiling import profiled
+
+# Dimensions the cube is keyed by, when present in the data
+CUBE_DIMENSIONS = ["Museum", "Nationality", "Gender", "Continent", "Ethnicity", "Decade"]
+# Dimensions of a holding rather than of the artist, dropped when artists are
+# counted once (utils.trends counts per museum instead)
+HOLDING_DIMENSIONS = ["Museum"]
+
+# Label of the row that bucket_tail() sums the small groups into
+OTHER = "Other"
+# Slices kept per cube, least recently used first out
+MAX_CACHED_SLICES = 64
+
+
+def distinct_positions(df: pd.DataFrame, unique: str, columns: Sequence[str]) -> np.ndarray:
+    """Return the position of one row per ``unique`` value, in ascending order.
+
+    Of an artist's rows, the one with the fewest missing or "Unknown"
+    ``columns`` is kept. Rows where ``unique`` is missing are all kept.
+    """
+    unknown = sum(
+        (df[col].isna() | (df[col] == "Unknown")).to_numpy(dtype=np.int8)
+        for col in columns
+    )
+    order = np.argsort(unknown, kind="stable")
+    ids = df[unique].iloc[order]
+    return np.sort(order[(ids.isna() | ~ids.duplicated()).to_numpy()])
+
+
+class CountCube:
+    """Artist counts for every observed combination of the cube dimensions.
+
+    ``flags`` names boolean columns of ``df`` (such as the ``is_african``
+    representation flags from utils.groups) that are added as extra keys,
+    so they can be used as filters in :meth:`counts` and :meth:`total`.
+
+    With ``unique`` (such as the ``ArtistID`` from utils.artists), each
+    value of that column is counted once, from its most complete row, so an
+    artist held by several museums isn't counted several times. Rows where
+    it is missing are all counted. Such a cube has no ``Museum`` dimension,
+    since one row per artist can't count the artists of each museum.
+    """
+
+    def __init__(self, df: pd.DataFrame, flags: Optional[List[str]] = None,
+                 unique: Optional[str] = None):
+        self.dimensions = [dim for dim in CUBE_DIMENSIONS if dim in df.columns]
+        self.flags = [flag for flag in (flags or []) if flag in df.columns]
+        self.unique = unique if unique in df.columns else None
+        if self.unique:
+            df = self._distinct(df)
+            self.seen = pd.Index(df[self.unique].dropna())
+            self.dimensions = [dim for dim in self.dimensions if dim not in HOLDING_DIMENSIONS]
+        self.table = self._group(df.groupby(self.keys, observed=True, dropna=False).size())
+        self._slices: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        # Cubes are shared by every session through shared_cube
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> List[str]:
+        return self.dimensions + self.flags
+
+    @staticmethod
+    def _group(counts: pd.Series) -> pd.DataFrame:
+        return counts.rename("Count").reset_index()
+
+    def _distinct(self, df: pd.DataFrame) -> pd.DataFrame:
+        # The same row per artist as utils.trends picks, so the counts agree
+        dimensions = [dim for dim in CUBE_DIMENSIONS if dim in df.columns]
+        return df.iloc[distinct_positions(df, self.unique, dimensions)]
+
+    def extend(self, rows: pd.DataFrame) -> "CountCube":
+        """Return a new cube that also counts ``rows``.
+
+        Only the new rows and the existing cube table are regrouped, so the
+        cost doesn't depend on the size of the original dataset.
+        """
+        if self.unique:
+            rows = rows[~rows[self.unique].isin(self.seen)]
+        new = CountCube(rows, self.flags, self.unique)
+        if self.unique:
+            new.seen = self.seen.append(new.seen)
+        table = pd.concat([self.table, new.table], ignore_index=True)
+        for col in self.dimensions:
+            if isinstance(self.table[col].dtype, pd.CategoricalDtype):
+                table[col] = table[col].astype("category")
+        new.table = self._group(
+            table.groupby(self.keys, observed=True, dropna=False)["Count"].sum()
+        )
+        return new
+
+    def _filter(self, where: Dict[str, object]) -> pd.DataFrame:
+        table = self.table
+        for column, value in where.items():
+            table = table[table[column] == value]
+        return table
+
+    def counts(self, by: Union[str, Sequence[str]], sort: bool = True,
+               dropna: bool = True, **where) -> pd.DataFrame:
+        """Return counts grouped by ``by`` with a ``Count`` column.
+
+        Like ``value_counts``, results are sorted by descending count unless
+        ``sort`` is False (then they are ordered by key), and missing keys are
+        dropped unless ``dropna`` is False. Keyword arguments filter on a
+        dimension or flag, e.g. ``counts("Decade", is_african=True)``.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        key = (tuple(by), sort, dropna, tuple(sorted(where.items())))
+        with self._lock:
+            result = self._slices.get(key)
+            if result is not None:
+                self._slices.move_to_end(key)
+                return result.copy()
+        result = (
+            self._filter(where)
+            .groupby(by, observed=True, dropna=dropna)["Count"]
+            .sum()
+        )
+        if sort:
+            result = result.sort_values(ascending=False, kind="stable")
+        result = result.reset_index()
+        with self._lock:
+            self._slices[key] = result
+            self._slices.move_to_end(key)
+            while len(self._slices) > MAX_CACHED_SLICES:
+                self._slices.popitem(last=False)
+        return result.copy()
+
+    def total(self, **where) -> int:
+        """Return the number of artists matching the filters."""
+        return int(self._filter(where)["Count"].sum())
+
+
+def bucket_tail(counts: pd.DataFrame, by: str, k: Optional[int] = None,
+                min_share: Optional[float] = None, min_count: Optional[int] = None,
+                label: str = OTHER) -> pd.DataFrame:
+    """Keep the largest groups of a count table and sum the rest into one row.
+
+    A group is kept if it is among the ``k`` largest, makes up at least
+    ``min_share`` of the total and has at least ``min_count`` artists (each
+    condition only applies when given). The result is sorted by descending
+    count with the ``label`` row last, and ``by`` holds plain strings.
+    """
+    counts = counts.sort_values("Count", ascending=False, kind="stable")
+    values = counts["Count"].to_numpy()
+    keep = np.ones(len(counts), dtype=bool)
+    if k is not None:
+        keep[k:] = False
+    if min_share is not None:
+        keep &= values >= min_share * values.sum()
+    if min_count is not None:
+        keep &= values >= min_count
+
+    head = counts.loc[keep, [by, "Count"]].astype({by: str})
+    if keep.all():
+        return head.reset_index(drop=True)
+    other = pd.DataFrame({by: [label], "Count": [values[~keep].sum()]})
+    # A real category with the same name as the bucket is merged into it
+    head = head[head[by] != label]
+    other["Count"] += counts.loc[keep & (counts[by].astype(str) == label).to_numpy(), "Count"].sum()
+    return pd.concat([head, other], ignore_index=True)
+
+
+_cubes: Dict[tuple, Tuple[LoadedDataset, CountCube]] = {}
+_cube_lock = threading.Lock()
+
+
+@profiled()
+def shared_cube(name: str, flags: Optional[List[str]] = None,
+                unique: Optional[str] = None) -> CountCube:
+    """Return the process-wide cube for a dataset from utils.datasets.
+
+    If batches were ingested since the cube was built, it is extended with
+    the appended rows instead of being rebuilt from the whole dataset.
+    """
+    loaded = load_shared(name)
+    key = (name, tuple(flags or ()), unique)
+    with _cube_lock:
+        previous = _cubes.get(key)
+        if previous and previous[0] is loaded:
+            return previous[1]
+        if previous and loaded.extends(previous[0]):
+            cube = previous[1].extend(loaded.df.iloc[len(previous[0].df):])
+        else:
+            cube = CountCube(loaded.df, flags, unique)
+        _cubes[key] = (loaded, cube)
+        return cube
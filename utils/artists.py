@@ -0,0 +1,263 @@
+"""Resolve the spellings of an artist's name to one stable artist ID.
+
+The combined dataset mixes MoMA, the Met and hand-collected small-museum
+rows, so one artist can appear as "Rachel Harrison" and "RachelHarrison",
+with and without accents, or once per museum. :func:`resolve_artists`
+groups such variants without comparing every pair of names:
+
+* each distinct (name, birth year) is reduced to a compact key, with
+  diacritics, punctuation, spacing and parenthetical aliases dropped;
+* only names sharing a block are compared: the same compact key, or the
+  same first two letters and Soundex code of the surname;
+* the candidate pairs are scored together with numpy, as the Jaccard
+  similarity of their keys' trigrams, in a process pool when there are many;
+  a shared birth year lowers the bar, and pairs whose birth years are more
+  than a year apart never match;
+* matched pairs are joined into connected components, one per artist.
+
+An artist's ID is a hash of its most common key and birth year, so it
+doesn't depend on row order and survives rebuilds. Rows appended later are
+resolved against the rows already known, and join their artists' IDs.
+"""
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.search import first_of_runs, normalize_text, trigram_codes
+
+ARTIST_ID = "ArtistID"
+
+# Minimum trigram Jaccard similarity of two keys for them to be one artist,
+# and the lower bar for two names with the same known birth year
+MATCH_THRESHOLD = 0.8
+SAME_YEAR_THRESHOLD = 0.65
+# Largest difference in birth years still treated as the same artist
+MAX_YEAR_GAP = 1
+# Candidate pairs per scoring task; fewer pairs are scored in this process
+CHUNK_PAIRS = 250_000
+
+_ALIAS = re.compile(r"\([^)]*\)")
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+_SOUNDEX = str.maketrans("bfpvcgjkqsxzdtlmnr", "111122222222334556")
+# Birth year stored for entities without one
+_NO_YEAR = -1
+
+
+@lru_cache(maxsize=1 << 17)
+def name_tokens(name: str) -> Tuple[str, ...]:
+    """Return the normalized words of an artist name.
+
+    Parenthetical aliases ("A.R. Penck (Ralf Winkler)") are dropped and a
+    run-together name such as "RachelHarrison" is split at its capitals.
+    """
+    stripped = _ALIAS.sub(" ", name)
+    if " " not in stripped.strip():
+        stripped = _CAMEL.sub(" ", stripped)
+    return tuple(normalize_text(stripped).split()) or tuple(normalize_text(name).split())
+
+
+@lru_cache(maxsize=1 << 16)
+def soundex(word: str) -> str:
+    """Return the four-character Soundex code of a lowercase word."""
+    codes = word.translate(_SOUNDEX)
+    code, last = word[:1], codes[:1]
+    for char in codes[1:]:
+        if char.isdigit() and char != last:
+            code += char
+        # H and W don't separate two letters with the same code
+        if char not in "hw":
+            last = char
+    return (code + "000")[:4]
+
+
+def _entities(names: pd.Series, years: Optional[pd.Series]):
+    """Group rows into distinct (compact key, birth year) entities.
+
+    Returns each row's entity (-1 for a missing name) and, per entity, its
+    compact key, phonetic block, birth year and number of rows.
+    """
+    names = names.astype("category")
+    tokens = [name_tokens(str(name)) for name in names.cat.categories]
+    compact = np.array(["".join(words) for words in tokens], dtype=object)
+    phonetic = np.array(
+        [f"{key[:2]}{soundex(words[-1])}" if words else "" for key, words in zip(compact, tokens)],
+        dtype=object,
+    )
+    key_codes, keys = pd.factorize(compact, sort=True)
+
+    codes = names.cat.codes.to_numpy()
+    present = codes >= 0
+    if years is None:
+        row_years = np.full(len(names), _NO_YEAR, dtype=np.int64)
+    else:
+        row_years = years.to_numpy(dtype=np.float64, na_value=np.nan)
+        row_years = np.where(np.isnan(row_years), _NO_YEAR, row_years).astype(np.int64)
+    packed = (key_codes[codes[present]].astype(np.int64) << 16) | (row_years[present] & 0xFFFF)
+    unique, inverse, sizes = np.unique(packed, return_inverse=True, return_counts=True)
+
+    entity = np.full(len(names), -1, dtype=np.int64)
+    entity[present] = inverse
+    # The first row of each entity gives its category, for the phonetic block
+    first = np.full(len(unique), -1, dtype=np.int64)
+    first[inverse[::-1]] = codes[present][::-1]
+    entity_years = (unique & 0xFFFF).astype(np.int16).astype(np.int64)
+    return entity, unique >> 16, keys, phonetic[first], entity_years, sizes
+
+
+def _block_pairs(blocks: np.ndarray) -> np.ndarray:
+    """Return every pair of entities sharing a block code, packed as ``i << 32 | j`` with i < j."""
+    order = np.argsort(blocks, kind="stable")
+    starts = np.flatnonzero(first_of_runs(blocks[order]))
+    ends = np.append(starts[1:], len(order))
+    pairs = [np.array([], dtype=np.int64)]
+    for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+        members = order[start:end].astype(np.int64)
+        i, j = np.triu_indices(end - start, 1)
+        a, b = members[i], members[j]
+        pairs.append((np.minimum(a, b) << 32) | np.maximum(a, b))
+    return np.concatenate(pairs)
+
+
+def _entity_grams(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the sorted distinct ``entity << 24 | trigram`` codes and each entity's span."""
+    width = max((len(key) for key in keys), default=0) + 2
+    rows, codes = trigram_codes(list(keys), max(width, 3))
+    grams = np.sort((rows.astype(np.int64) << 24) | codes)
+    grams = grams[first_of_runs(grams)]
+    starts = np.searchsorted(grams, np.arange(len(keys) + 1, dtype=np.int64) << 24)
+    return grams, starts[:-1], np.diff(starts)
+
+
+def pair_similarity(grams: np.ndarray, starts: np.ndarray, counts: np.ndarray,
+                    pairs: np.ndarray) -> np.ndarray:
+    """Return the trigram Jaccard similarity of each (left, right) entity pair.
+
+    Every trigram of the left entity is looked up among the right entity's
+    with one ``searchsorted`` over all pairs.
+    """
+    left, right = pairs[:, 0], pairs[:, 1]
+    lengths = counts[left]
+    owner = np.repeat(np.arange(len(pairs)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    probes = (right[owner] << 24) | (grams[starts[left][owner] + offsets] & 0xFFFFFF)
+    slots = np.minimum(np.searchsorted(grams, probes), len(grams) - 1)
+    shared = np.bincount(owner, weights=grams[slots] == probes, minlength=len(pairs))
+    return shared / np.maximum(counts[left] + counts[right] - shared, 1)
+
+
+_worker_grams: Tuple[np.ndarray, ...] = ()
+
+
+def _init_worker(grams, starts, counts):
+    global _worker_grams
+    _worker_grams = (grams, starts, counts)
+
+
+def _score_chunk(pairs: np.ndarray) -> np.ndarray:
+    return pair_similarity(*_worker_grams, pairs)
+
+
+def _score(keys: np.ndarray, pairs: np.ndarray, workers: Optional[int]) -> np.ndarray:
+    """Score candidate pairs, in ``workers`` processes when there are many."""
+    if not len(pairs):
+        return np.zeros(0)
+    grams = _entity_grams(keys)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) <= CHUNK_PAIRS:
+        return pair_similarity(*grams, pairs)
+    chunks = [pairs[i:i + CHUNK_PAIRS] for i in range(0, len(pairs), CHUNK_PAIRS)]
+    # The trigram arrays are sent to each worker once, not with every chunk
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=grams) as pool:
+        return np.concatenate(list(pool.map(_score_chunk, chunks)))
+
+
+def _components(n: int, edges: np.ndarray) -> np.ndarray:
+    """Label the connected components of an undirected graph by their lowest node."""
+    labels = np.arange(n)
+    a, b = edges[:, 0], edges[:, 1]
+    while len(edges):
+        low = np.minimum(labels[a], labels[b])
+        if np.array_equal(labels[a], low) and np.array_equal(labels[b], low):
+            break
+        np.minimum.at(labels, a, low)
+        np.minimum.at(labels, b, low)
+        # Point every node straight at the lowest label it can reach
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return labels
+
+
+def artist_key_id(key: str, year: int) -> str:
+    """Return the ID of the artist whose most common key and birth year are given."""
+    label = key if year == _NO_YEAR else f"{key}|{year}"
+    return hashlib.sha1(label.encode()).hexdigest()[:12]
+
+
+def resolve_artists(df: pd.DataFrame, name: str, year: Optional[str] = None,
+                    known: Optional[pd.DataFrame] = None,
+                    workers: Optional[int] = None) -> pd.Series:
+    """Return the artist ID of every row of ``df``.
+
+    ``name`` is the column holding the artist name and ``year`` an optional
+    birth year column. ``known`` holds rows resolved earlier (the same
+    columns plus ``ArtistID``): new rows matching them take their IDs, and
+    their own IDs never change. Rows without a name get no ID. Candidate
+    pairs are scored in ``workers`` processes (default: one per CPU).
+    """
+    columns = [name] + ([year] if year else [])
+    rows = df[columns] if known is None else pd.concat(
+        [known[columns], df[columns]], ignore_index=True)
+    entity, key_codes, keys, phonetic, years, sizes = _entities(
+        rows[name], rows[year] if year else None)
+    n = len(key_codes)
+
+    compact = keys[key_codes]
+    has_key = compact != ""
+    blocks = [key_codes, pd.factorize(phonetic)[0]]
+    pairs = np.unique(np.concatenate([
+        _block_pairs(np.where(has_key, codes, -1 - np.arange(n))) for codes in blocks
+    ]))
+    pairs = np.stack([pairs >> 32, pairs & 0xFFFFFFFF], axis=1)
+
+    n_known = 0 if known is None else len(known)
+    if n_known:
+        # Only pairs involving a new entity can change anything
+        new = np.zeros(n, dtype=bool)
+        new[entity[n_known:][entity[n_known:] >= 0]] = True
+        pairs = pairs[new[pairs[:, 0]] | new[pairs[:, 1]]]
+
+    left, right = years[pairs[:, 0]], years[pairs[:, 1]]
+    unknown = (left == _NO_YEAR) | (right == _NO_YEAR)
+    gap = np.abs(left - right)
+    threshold = np.where(unknown, MATCH_THRESHOLD, SAME_YEAR_THRESHOLD)
+    keep = unknown | (gap <= MAX_YEAR_GAP)
+    pairs, threshold = pairs[keep], threshold[keep]
+    matched = pairs[_score(compact, pairs, workers) >= threshold]
+    labels = _components(n, matched)
+
+    # Each artist is named after its most common entity, ties broken by key
+    order = np.lexsort((key_codes, -sizes, labels))
+    lead = order[first_of_runs(labels[order])]
+    cluster_ids = {labels[i]: artist_key_id(compact[i], years[i]) for i in lead}
+    if n_known:
+        known_ids = known[ARTIST_ID].to_numpy()
+        known_rows = np.flatnonzero(entity[:n_known] >= 0)
+        # Prefer the known entity with the most rows of each artist
+        for i in known_rows[np.argsort(sizes[entity[known_rows]], kind="stable")]:
+            cluster_ids[labels[entity[i]]] = known_ids[i]
+    entity_ids = np.array([cluster_ids[label] for label in labels], dtype=object)
+
+    ids = np.full(len(df), None, dtype=object)
+    new_entity = entity[n_known:]
+    ids[new_entity >= 0] = entity_ids[new_entity[new_entity >= 0]]
+    return pd.Series(ids, index=df.index, name=ARTIST_ID, dtype="str")
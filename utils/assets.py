@@ -0,0 +1,47 @@
+import base64
+import mimetypes
+from pathlib import Path
+from urllib.parse import quote
+
+import streamlit as st
+
+from utils.profiling import profiled
+
+# Images that can be served by Streamlit's static file server live here
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+
+# Background used by most pages
+DEFAULT_BACKGROUND = "aaron douglas - from slavery to recognition.jfif"
+
+
+def static_serving_enabled() -> bool:
+    """Return True when the app is configured to serve the static/ folder."""
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+@st.cache_resource(show_spinner=False)
+def encode_image(image_name: str) -> str:
+    """Read and base64-encode an image once per process as a data URI."""
+    image_path = STATIC_DIR / image_name
+    mime_type = mimetypes.guess_type(image_path.name)[0] or "image/jpeg"
+    with open(image_path, "rb") as f:
+        b64_encoded = base64.b64encode(f.read()).decode()
+    return f"data:{mime_type};base64,{b64_encoded}"
+
+
+@profiled()
+def background_url(image_name: str = DEFAULT_BACKGROUND) -> str:
+    """Return a URL for a background image in static/.
+
+    When static serving is enabled the browser fetches (and caches) the image
+    from app/static/, so only a short URL is sent with every rerun. Otherwise
+    fall back to a data URI that is encoded once and kept in memory.
+    """
+    if not (STATIC_DIR / image_name).is_file():
+        raise FileNotFoundError(f"No such image in {STATIC_DIR}: {image_name}")
+    if static_serving_enabled():
+        return f"app/static/{quote(image_name)}"
+    return encode_image(image_name)
@@ -0,0 +1,168 @@
+"""Server-side paginated table browser for the raw data tabs.
+
+A :class:`TableBrowser` is built once per dataset version. It indexes the
+searchable columns and precomputes a sort rank for every visible column, so
+a search, sort or page change costs a lookup plus one ``argsort`` over the
+matching rows, and :func:`show_browser` only sends the visible page of rows
+to the browser instead of the whole frame. It runs as a fragment, so paging
+or searching reruns the table alone.
+"""
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.profiling import profiled
+
+PAGE_SIZES = [25, 50, 100]
+# Fragment key of show_browser, for reruns scoped to the table
+BROWSER_FRAGMENT = "table_browser"
+# Search results kept per browser, most recently used first out
+MAX_CACHED_QUERIES = 64
+
+
+class ValueIndex:
+    """Case-insensitive substring search over the distinct values of a column.
+
+    The distinct values are joined into one lowercase string, so a query is
+    a few ``str.find`` calls in C; matching values are mapped back to rows by
+    categorical code.
+    """
+
+    def __init__(self, values: pd.Series):
+        values = values.astype("category")
+        categories = values.cat.categories.astype(str).str.lower()
+        self._haystack = "\n".join(categories) + "\n"
+        # Offset of each value in the haystack, plus the end
+        self._starts = list(accumulate((len(value) + 1 for value in categories), initial=0))
+        self._codes = values.cat.codes.to_numpy()
+
+    def search(self, query: str) -> np.ndarray:
+        """Return a boolean mask of the rows whose value contains ``query``."""
+        hits = np.zeros(len(self._starts), dtype=bool)
+        query = query.lower()
+        if "\n" not in query:
+            pos = self._haystack.find(query)
+            while pos != -1:
+                value = bisect_right(self._starts, pos) - 1
+                hits[value] = True
+                # Continue from the next value; one match per value is enough
+                pos = self._haystack.find(query, self._starts[value + 1])
+        # The last slot stays False, so code -1 (missing value) never matches
+        hits[-1] = False
+        return hits[self._codes]
+
+
+class TableBrowser:
+    """Search, sort and page through a DataFrame without copying it."""
+
+    def __init__(self, df: pd.DataFrame, search_columns: Sequence[str],
+                 columns: Optional[List[str]] = None):
+        self.df = df
+        self.columns = columns or list(df.columns)
+        self.search_columns = list(search_columns)
+        self._indexes = {col: ValueIndex(df[col]) for col in self.search_columns}
+        self._ranks: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            col: self._sort_rank(df[col]) for col in self.columns
+        }
+        self._queries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        # Browsers are shared by every session
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sort_rank(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Return each row's ascending rank (missing values last) and a missing mask."""
+        missing = values.isna().to_numpy()
+        if pd.api.types.is_numeric_dtype(values.dtype) and \
+                not isinstance(values.dtype, pd.CategoricalDtype):
+            key = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            key = np.asarray(values.astype(str).str.lower(), dtype=object)
+        present = np.flatnonzero(~missing)
+        order = np.concatenate([
+            present[np.argsort(key[present], kind="stable")],
+            np.flatnonzero(missing),
+        ])
+        rank = np.empty(len(values), dtype=np.int64)
+        rank[order] = np.arange(len(values))
+        return rank, missing
+
+    def search(self, query: str) -> np.ndarray:
+        """Return the positions of the rows matching ``query`` in any search column."""
+        query = query.strip().lower()
+        if not query:
+            return np.arange(len(self.df))
+        with self._lock:
+            rows = self._queries.get(query)
+            if rows is not None:
+                self._queries.move_to_end(query)
+                return rows
+        mask = np.zeros(len(self.df), dtype=bool)
+        for index in self._indexes.values():
+            mask |= index.search(query)
+        rows = np.flatnonzero(mask)
+        with self._lock:
+            self._queries[query] = rows
+            self._queries.move_to_end(query)
+            while len(self._queries) > MAX_CACHED_QUERIES:
+                self._queries.popitem(last=False)
+        return rows
+
+    def sort(self, rows: np.ndarray, by: str, ascending: bool = True) -> np.ndarray:
+        """Order row positions by a column, keeping missing values last."""
+        rank, missing = self._ranks[by]
+        keys = rank[rows]
+        if not ascending:
+            keys = np.where(missing[rows], keys, -keys)
+        return rows[np.argsort(keys, kind="stable")]
+
+    def page(self, query: str = "", by: Optional[str] = None, ascending: bool = True,
+             page: int = 1, page_size: int = PAGE_SIZES[0]) -> Tuple[pd.DataFrame, int]:
+        """Return one page of matching rows and the total number of matches."""
+        rows = self.search(query)
+        if by is not None:
+            rows = self.sort(rows, by, ascending)
+        start = (page - 1) * page_size
+        return self.df.iloc[rows[start:start + page_size]][self.columns], len(rows)
+
+
+@profiled()
+@st.fragment(key=BROWSER_FRAGMENT)
+def show_browser(browser: TableBrowser, key: str, search_label: str = "Search",
+                 height: Optional[int] = None):
+    """Render search, sort and paging controls and the current page of rows.
+
+    This is a fragment: its controls rerun only the table, not the page.
+    """
+    page_key = f"{key}_page"
+
+    def reset_page():
+        st.session_state.pop(page_key, None)
+
+    search_col, sort_col, order_col, size_col = st.columns([3, 2, 1, 1])
+    with search_col:
+        query = st.text_input(search_label, key=f"{key}_search", on_change=reset_page)
+    with sort_col:
+        by = st.selectbox("Sort by", browser.columns, key=f"{key}_sort", on_change=reset_page)
+    with order_col:
+        order = st.selectbox("Order", ["Ascending", "Descending"], key=f"{key}_order",
+                             on_change=reset_page)
+    with size_col:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_size",
+                                 on_change=reset_page)
+
+    total = len(browser.search(query))
+    pages = max(1, -(-total // page_size))
+    page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1,
+                           key=page_key)
+    rows, total = browser.page(query, by, order == "Ascending", page, page_size)
+
+    start = (page - 1) * page_size
+    st.caption(f"Showing rows {min(start + 1, total):,}-{start + len(rows):,} of {total:,}")
+    st.dataframe(rows, hide_index=True, use_container_width=True,
+                 **({"height": height} if height else {}))
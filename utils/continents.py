@@ -0,0 +1,251 @@
+"""Classification of artist nationalities into continents.
+
+Nationalities are normalized (case, whitespace, diacritics), compound values
+such as "Mexican-American" or "British-Jamaican,Bajan" are split into their
+parts, and each part is resolved through :data:`NATIONALITY_CONTINENTS`.
+For heritage compounds like "Chinese-American" the non-American part wins;
+parts from different continents become ``MULTINATIONAL``.
+
+:func:`classify_continents` classifies each distinct category once and maps
+the whole column by categorical code, so its cost depends on the number of
+distinct nationalities rather than the number of artists.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MULTINATIONAL = "Multinational/Other"
+CONTINENTS = ["North America", "South America", "Europe", "Africa", "Asia", "Oceania", MULTINATIONAL]
+
+NATIONALITY_CONTINENTS = {
+    # North America (including Central America and the Caribbean)
+    "American": "North America",
+    "Native American": "North America",
+    "Inuit": "North America",
+    "Mexican": "North America",
+    "Canadian": "North America",
+    "Cuban": "North America",
+    "Bahamian": "North America",
+    "Bajan": "North America",
+    "Haitian": "North America",
+    "Jamaican": "North America",
+    "Dominican": "North America",
+    "Puerto Rican": "North America",
+    "Trinidad and Tobagonian": "North America",
+    "Costa Rican": "North America",
+    "Guatemalan": "North America",
+    "Nicaraguan": "North America",
+    "Panamanian": "North America",
+    "Salvadoran": "North America",
+
+    # South America
+    "Argentine": "South America",
+    "Bolivian": "South America",
+    "Brazilian": "South America",
+    "Chilean": "South America",
+    "Colombian": "South America",
+    "Ecuadorian": "South America",
+    "Paraguayan": "South America",
+    "Peruvian": "South America",
+    "Uruguayan": "South America",
+    "Venezuelan": "South America",
+
+    # Europe
+    "Albanian": "Europe",
+    "Austrian": "Europe",
+    "Belgian": "Europe",
+    "Bosnian": "Europe",
+    "British": "Europe",
+    "Bulgarian": "Europe",
+    "Catalan": "Europe",
+    "Croatian": "Europe",
+    "Czech": "Europe",
+    "Czechoslovakian": "Europe",
+    "Danish": "Europe",
+    "Dutch": "Europe",
+    "English": "Europe",
+    "Estonian": "Europe",
+    "Finnish": "Europe",
+    "French": "Europe",
+    "German": "Europe",
+    "Greek": "Europe",
+    "Hungarian": "Europe",
+    "Icelandic": "Europe",
+    "Irish": "Europe",
+    "Italian": "Europe",
+    "Latvian": "Europe",
+    "Lithuanian": "Europe",
+    "Luxembourger": "Europe",
+    "Macedonian": "Europe",
+    "Norwegian": "Europe",
+    "Polish": "Europe",
+    "Portuguese": "Europe",
+    "Romanian": "Europe",
+    "Russian": "Europe",
+    "Scottish": "Europe",
+    "Serbian": "Europe",
+    "Slovak": "Europe",
+    "Slovenian": "Europe",
+    "Spanish": "Europe",
+    "Swedish": "Europe",
+    "Swiss": "Europe",
+    "Ukrainian": "Europe",
+    "Welsh": "Europe",
+    "Yugoslav": "Europe",
+
+    # Africa
+    "African": "Africa",
+    "West African": "Africa",
+    "South African": "Africa",
+    "Algerian": "Africa",
+    "Beninese": "Africa",
+    "Burkinabe": "Africa",
+    "Cameroonian": "Africa",
+    "Congolese": "Africa",
+    "Egyptian": "Africa",
+    "Ethiopian": "Africa",
+    "Ghanaian": "Africa",
+    "Ivorian": "Africa",
+    "Kenyan": "Africa",
+    "Malian": "Africa",
+    "Moroccan": "Africa",
+    "Mozambican": "Africa",
+    "Namibian": "Africa",
+    "Nigerian": "Africa",
+    "Senegalese": "Africa",
+    "Sierra Leonean": "Africa",
+    "Sudanese": "Africa",
+    "Tanzanian": "Africa",
+    "Tunisian": "Africa",
+    "Ugandan": "Africa",
+    "Zimbabwean": "Africa",
+
+    # Asia (including the Middle East and the Caucasus)
+    "Asian": "Asia",
+    "Afghan": "Asia",
+    "Azerbaijani": "Asia",
+    "Bangladeshi": "Asia",
+    "Chinese": "Asia",
+    "Emirati": "Asia",
+    "Filipino": "Asia",
+    "Georgian": "Asia",
+    "Indian": "Asia",
+    "Indonesian": "Asia",
+    "Iranian": "Asia",
+    "Iraqi": "Asia",
+    "Israeli": "Asia",
+    "Japanese": "Asia",
+    "Korean": "Asia",
+    "South Korean": "Asia",
+    "Kuwaiti": "Asia",
+    "Lebanese": "Asia",
+    "Malaysian": "Asia",
+    "Nepali": "Asia",
+    "Pakistani": "Asia",
+    "Palestinian": "Asia",
+    "Singaporean": "Asia",
+    "Sri Lankan": "Asia",
+    "Syrian": "Asia",
+    "Taiwanese": "Asia",
+    "Thai": "Asia",
+    "Turkish": "Asia",
+    "Vietnamese": "Asia",
+
+    # Oceania
+    "Australian": "Oceania",
+    "New Zealander": "Oceania",
+}
+
+# Whole values whose continent doesn't follow from their parts
+COMPOUND_OVERRIDES = {
+    "African-American": "North America",
+    "Haitian Jamaican": MULTINATIONAL,
+}
+
+# Values that mean the nationality is not known
+MISSING_VALUES = {"", "unknown", "nan", "none", "n/a"}
+
+# Separators between the parts of a compound nationality
+_SEPARATORS = re.compile(r"\s*[-/,;&]\s*")
+
+
+def normalize(value) -> str:
+    """Lowercase, strip diacritics and collapse whitespace."""
+    value = unicodedata.normalize("NFKD", str(value))
+    value = "".join(c for c in value if not unicodedata.combining(c))
+    return " ".join(value.lower().split())
+
+
+_LOOKUP = {normalize(k): v for k, v in NATIONALITY_CONTINENTS.items()}
+_OVERRIDES = {normalize(k): v for k, v in COMPOUND_OVERRIDES.items()}
+
+
+def _resolve_part(part: str) -> Optional[List[Tuple[str, str]]]:
+    """Return (token, continent) pairs for one part of a nationality."""
+    if part in _LOOKUP:
+        return [(part, _LOOKUP[part])]
+    # Space-separated compounds such as "Canadian Inuit"
+    words = part.split()
+    if len(words) > 1 and all(word in _LOOKUP for word in words):
+        return [(word, _LOOKUP[word]) for word in words]
+    return None
+
+
+@lru_cache(maxsize=None)
+def classify_nationality(value) -> Optional[str]:
+    """Return the continent for a nationality, or None if it can't be resolved."""
+    key = normalize(value)
+    if key in MISSING_VALUES:
+        return None
+    if key in _OVERRIDES:
+        return _OVERRIDES[key]
+
+    tokens = []
+    for part in filter(None, _SEPARATORS.split(key)):
+        resolved = _resolve_part(part)
+        if resolved is None:
+            return None
+        tokens.extend(resolved)
+    if not tokens:
+        return None
+
+    # Heritage compounds: "Chinese-American" is classified by "Chinese"
+    if len(tokens) > 1:
+        tokens = [t for t in tokens if t[0] != "american"] or tokens
+    continents = {continent for _, continent in tokens}
+    return continents.pop() if len(continents) == 1 else MULTINATIONAL
+
+
+def classify_continents(nationalities: pd.Series) -> pd.Series:
+    """Map a nationality column to a categorical Continent column.
+
+    Unresolved and missing nationalities become NaN.
+    """
+    nationalities = nationalities.astype("category")
+    lookup = np.array(
+        [
+            CONTINENTS.index(continent) if continent else -1
+            for continent in map(classify_nationality, nationalities.cat.categories)
+        ] + [-1],  # code -1 (missing nationality) maps to the trailing -1
+        dtype=np.int8,
+    )
+    codes = lookup[nationalities.cat.codes.to_numpy()]
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=CONTINENTS),
+        index=nationalities.index,
+        name="Continent",
+    )
+
+
+def unmapped_nationalities(nationalities: pd.Series) -> pd.Series:
+    """Count the known nationalities that could not be classified."""
+    counts = nationalities.value_counts()
+    unmapped = np.array([
+        count > 0 and classify_nationality(value) is None and normalize(value) not in MISSING_VALUES
+        for value, count in counts.items()
+    ], dtype=bool)
+    return counts[unmapped]
@@ -0,0 +1,119 @@
+"""Word co-occurrence counts for the mission statement corpus.
+
+Two words co-occur when they appear within a sliding window of each other
+in a tokenized statement (see utils.text). Pairs are counted in a sparse
+``Counter`` while the corpus is tokenized, so memory grows with the number of
+distinct pairs rather than with the square of the vocabulary, and written by
+``scripts/process_statements.py`` as a ``Word1``/``Word2``/``Count`` table.
+
+:class:`CooccurrenceIndex` loads that table into a compressed sparse row
+layout (one row per word, its neighbours sorted by count), so looking up a
+word's top co-occurring words is a slice rather than a scan.
+"""
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.datasets import DATA_DIR
+
+COOCCURRENCE_CSV = "Mission_Statement_Cooccurrence.csv"
+COOCCURRENCE_PATH = DATA_DIR / COOCCURRENCE_CSV
+
+# Words at most this many tokens apart co-occur
+DEFAULT_WINDOW = 5
+
+
+def window_pairs(tokens: Sequence[str], window: int = DEFAULT_WINDOW) -> Iterator[Tuple[str, str]]:
+    """Yield each pair of distinct words within ``window`` tokens, alphabetically ordered."""
+    for i, word in enumerate(tokens):
+        for other in tokens[i + 1:i + window]:
+            if other != word:
+                yield (word, other) if word < other else (other, word)
+
+
+def pairs_table(pairs: Counter, min_count: int = 1) -> pd.DataFrame:
+    """Return the pair counts as a ``Word1``/``Word2``/``Count`` table, most frequent first."""
+    rows = [(a, b, n) for (a, b), n in pairs.most_common() if n >= min_count]
+    return pd.DataFrame(rows, columns=["Word1", "Word2", "Count"])
+
+
+class CooccurrenceIndex:
+    """Symmetric sparse co-occurrence matrix with cached neighbour lookups."""
+
+    def __init__(self, table: pd.DataFrame):
+        first = table["Word1"].to_numpy(dtype=str)
+        second = table["Word2"].to_numpy(dtype=str)
+        counts = table["Count"].to_numpy(dtype=np.int32)
+
+        self.words, codes = np.unique(np.concatenate([first, second]), return_inverse=True)
+        half = len(first)
+        # Store both directions so each word's row lists all its neighbours
+        rows = np.concatenate([codes[:half], codes[half:]])
+        cols = np.concatenate([codes[half:], codes[:half]])
+        values = np.concatenate([counts, counts])
+
+        order = np.lexsort((-values, rows))
+        self._indices = cols[order]
+        self._counts = values[order]
+        self._indptr = np.searchsorted(rows[order], np.arange(len(self.words) + 1))
+        self._codes: Dict[str, int] = {word: i for i, word in enumerate(self.words)}
+        self._neighbors: Dict[Tuple[str, int], pd.DataFrame] = {}
+
+    @classmethod
+    def from_pairs(cls, pairs: Counter) -> "CooccurrenceIndex":
+        return cls(pairs_table(pairs))
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self._codes
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _row(self, code: int) -> slice:
+        return slice(self._indptr[code], self._indptr[code + 1])
+
+    def degree(self) -> pd.Series:
+        """Return each word's total co-occurrence count, largest first."""
+        totals = np.add.reduceat(self._counts, self._indptr[:-1]) if len(self._counts) else []
+        return pd.Series(totals, index=self.words, name="Count").sort_values(ascending=False)
+
+    def neighbors(self, word: str, k: int = 10) -> pd.DataFrame:
+        """Return the ``k`` words that co-occur most with ``word`` (``Word``/``Count``)."""
+        word = word.lower()
+        key = (word, k)
+        if key not in self._neighbors:
+            code = self._codes.get(word)
+            row = self._row(code) if code is not None else slice(0, 0)
+            indices = self._indices[row][:k]
+            self._neighbors[key] = pd.DataFrame(
+                {"Word": self.words[indices], "Count": self._counts[row][:k]}
+            )
+        return self._neighbors[key].copy()
+
+    def matrix(self, words: List[str]) -> np.ndarray:
+        """Return the dense co-occurrence counts among ``words`` (for a heatmap)."""
+        codes = [self._codes.get(word.lower(), -1) for word in words]
+        position = np.full(len(self.words), -1)
+        for i, code in enumerate(codes):
+            if code >= 0:
+                position[code] = i
+
+        result = np.zeros((len(words), len(words)), dtype=np.int32)
+        for i, code in enumerate(codes):
+            if code < 0:
+                continue
+            row = self._row(code)
+            columns = position[self._indices[row]]
+            hits = columns >= 0
+            result[i, columns[hits]] = self._counts[row][hits]
+        return result
+
+
+def load_index(path: Path = COOCCURRENCE_PATH) -> Optional[CooccurrenceIndex]:
+    """Load the co-occurrence table built by scripts/process_statements.py, if any."""
+    if not path.is_file():
+        return None
+    return CooccurrenceIndex(pd.read_csv(path, dtype={"Word1": str, "Word2": str}))
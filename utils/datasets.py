@@ -0,0 +1,339 @@
+"""Typed, columnar copies of the CSV datasets used by the pages.
+
+``scripts/build_data.py`` cleans each CSV once and writes an uncompressed
+Feather (Arrow IPC) file to ``data/build/``. :func:`read_dataset`
+memory-maps the Feather file when it was built from the current CSV and
+otherwise falls back to parsing and cleaning the CSV itself.
+
+New museum batches are appended as small CSV partitions under
+``data/partitions/`` (see utils/ingest.py) and added on top of the base
+datasets at load time, so the combined CSV never has to be rebuilt.
+
+Pages use :func:`dataset_view`, which adds the derived columns (including
+the ``ArtistID`` of utils/artists.py) once per process and hands every
+session a shallow copy-on-write view of that shared frame, so
+``st.cache_data`` no longer deep-copies it on every rerun. When new
+partitions appear, only their rows are read, derived and appended; their
+artists are resolved against the rows already loaded.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from utils.artists import ARTIST_ID, resolve_artists
+from utils.continents import classify_continents
+from utils.groups import group_flags
+from utils.profiling import profiled
+
+# Copy-on-Write is always on from pandas 3; views handed out below rely on it
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data"
+BUILD_DIR = DATA_DIR / "build"
+PARTITION_DIR = DATA_DIR / "partitions"
+
+# Columns of a new museum batch (same as the small museum CSV)
+SMALL_COLUMNS = ["Name", "Nationality", "Gender", "Museum", "SmallMuseum"]
+
+# Key stored in the Feather schema metadata to detect stale builds
+SOURCE_HASH_KEY = b"source_sha1"
+
+
+def clean_combined(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean the combined MoMA/Met/small-museum artist data."""
+    for col in ["Nationality", "Gender", "Museum", "Ethnicity", "SmallMuseum", "Race"]:
+        df[col] = df[col].fillna("Unknown").str.strip().astype("category")
+    df["Artist"] = df["Artist"].str.strip()
+
+    # "Unknown" dates become missing values
+    for col in ["BeginDate", "EndDate"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int16")
+    df["Decade"] = (df["BeginDate"] // 10) * 10
+    return df
+
+
+def clean_small(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean the hand-collected small museum data."""
+    df = df.fillna("Unknown")
+    df["Gender"] = df["Gender"].str.strip()
+    df["Nationality"] = df["Nationality"].str.strip()
+    for col in ["Nationality", "Gender", "Museum", "SmallMuseum"]:
+        df[col] = df[col].astype("category")
+    return df
+
+
+def clean_word_freq(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean the mission statement word frequency table."""
+    df["Words"] = df["Words"].str.strip()
+    df["Frequency"] = df["Frequency"].astype("int32")
+    return df
+
+
+def small_to_combined(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert small-museum-schema rows to the combined dataset's schema."""
+    return clean_combined(pd.DataFrame({
+        "Artist": df["Name"],
+        "Nationality": df["Nationality"],
+        "Gender": df["Gender"],
+        "BeginDate": "Unknown",
+        "EndDate": "Unknown",
+        "Museum": df["Museum"],
+        "Ethnicity": "Unknown",
+        "SmallMuseum": df["SmallMuseum"],
+        "Race": "Unknown",
+    }))
+
+
+def derive_combined(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the Continent and representation group columns to the combined data."""
+    return pd.concat(
+        [df.assign(Continent=classify_continents(df["Nationality"])), group_flags(df)],
+        axis=1,
+    )
+
+
+def derive_small(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the Continent column to the small museum data."""
+    return df.assign(Continent=classify_continents(df["Nationality"]))
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A CSV source and how to turn it into a typed DataFrame."""
+    csv_name: str
+    clean: Callable[[pd.DataFrame], pd.DataFrame]
+    names: Optional[List[str]] = None
+    derive: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    # Converts rows from data/partitions/ to this dataset, if it includes them
+    from_partitions: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    # Artist name and birth year columns resolved to an ArtistID (utils/artists.py)
+    artist_name: Optional[str] = None
+    artist_year: Optional[str] = None
+
+    @property
+    def csv_path(self) -> Path:
+        return DATA_DIR / self.csv_name
+
+    @property
+    def build_path(self) -> Path:
+        return BUILD_DIR / (Path(self.csv_name).stem + ".feather")
+
+    def read_csv(self) -> pd.DataFrame:
+        if self.names:
+            df = pd.read_csv(self.csv_path, skiprows=1, names=self.names)
+        else:
+            df = pd.read_csv(self.csv_path)
+        return self.clean(df)
+
+
+DATASETS: Dict[str, Dataset] = {
+    "combined": Dataset(
+        "combinedSmallandLargeFinal.csv",
+        clean_combined,
+        derive=derive_combined,
+        from_partitions=small_to_combined,
+        artist_name="Artist",
+        artist_year="BeginDate",
+    ),
+    "small": Dataset(
+        "Small Museum Data - Sheet1 (1).csv",
+        clean_small,
+        names=SMALL_COLUMNS,
+        derive=derive_small,
+        from_partitions=clean_small,
+        artist_name="Name",
+    ),
+    "word_freq": Dataset("Mission_Statement_Word_Freq.csv", clean_word_freq),
+}
+
+
+def source_hash(path: Path) -> str:
+    """Return the SHA-1 of a source file, used as its dataset version."""
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _cached_source_hash(path: Path, size: int, mtime_ns: int) -> str:
+    return source_hash(path)
+
+
+def csv_hash(path: Path) -> str:
+    """Return :func:`source_hash`, recomputed only when the file changes."""
+    stat = path.stat()
+    return _cached_source_hash(path, stat.st_size, stat.st_mtime_ns)
+
+
+def file_version(path: Path) -> Optional[str]:
+    """Return :func:`csv_hash` of a file, or None while it doesn't exist."""
+    return csv_hash(path) if path.is_file() else None
+
+
+def build_dataset(name: str) -> Path:
+    """Clean one CSV and write it as an uncompressed Feather file."""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    dataset = DATASETS[name]
+    table = pa.Table.from_pandas(dataset.read_csv(), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SOURCE_HASH_KEY] = source_hash(dataset.csv_path).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    # Uncompressed so the file can be memory-mapped at page load
+    feather.write_feather(table, dataset.build_path, compression="uncompressed")
+    return dataset.build_path
+
+
+def _read_build(dataset: Dataset) -> Optional[pd.DataFrame]:
+    """Memory-map the built file, or return None if missing or stale."""
+    if not dataset.build_path.is_file():
+        return None
+    try:
+        import pyarrow.feather as feather
+
+        table = feather.read_table(dataset.build_path, memory_map=True)
+    except Exception:
+        return None
+    built_from = (table.schema.metadata or {}).get(SOURCE_HASH_KEY, b"").decode()
+    if dataset.csv_path.is_file() and built_from != csv_hash(dataset.csv_path):
+        return None
+    return table.to_pandas()
+
+
+def read_dataset(name: str) -> pd.DataFrame:
+    """Load a dataset from its columnar build, falling back to the CSV."""
+    dataset = DATASETS[name]
+    df = _read_build(dataset)
+    if df is None:
+        df = dataset.read_csv()
+    return df
+
+
+def partition_files() -> List[Path]:
+    """Return the ingested batch files, oldest first."""
+    if not PARTITION_DIR.is_dir():
+        return []
+    return sorted(PARTITION_DIR.glob("*.csv"))
+
+
+def read_partitions(paths: Sequence[Path]) -> pd.DataFrame:
+    """Read ingested batches as raw small-museum-schema rows."""
+    frames = [pd.read_csv(path, dtype=str) for path in paths]
+    if not frames:
+        return pd.DataFrame(columns=SMALL_COLUMNS)
+    return pd.concat(frames, ignore_index=True)[SMALL_COLUMNS]
+
+
+def append_rows(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """Append rows, merging categories instead of falling back to strings."""
+    combined = pd.concat([df, rows[df.columns]], ignore_index=True)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            combined[col] = union_categoricals(
+                [df[col], rows[col].astype("category")], ignore_order=True
+            )
+    return combined
+
+
+@dataclass(frozen=True, eq=False)
+class LoadedDataset:
+    """A dataset as loaded into this process, with what it was built from."""
+    base_hash: str
+    partitions: Tuple[str, ...]
+    df: pd.DataFrame
+
+    def extends(self, other: "LoadedDataset") -> bool:
+        """True if this is ``other`` with more partitions appended."""
+        return (
+            self.base_hash == other.base_hash and
+            self.partitions[:len(other.partitions)] == other.partitions
+        )
+
+
+_loaded: Dict[str, LoadedDataset] = {}
+_load_lock = threading.Lock()
+
+
+def _derived(dataset: Dataset, df: pd.DataFrame,
+             known: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Add the derived columns, resolving artists against the ``known`` rows."""
+    if dataset.derive is not None:
+        df = dataset.derive(df)
+    if dataset.artist_name is not None:
+        # Scored in this process: loads run inside the (threaded) server,
+        # where starting a process pool can deadlock
+        ids = resolve_artists(df, dataset.artist_name, dataset.artist_year, known=known,
+                              workers=1)
+        df = df.assign(**{ARTIST_ID: ids})
+    return df
+
+
+@profiled()
+def load_shared(name: str) -> LoadedDataset:
+    """Return the process-wide copy of a dataset, with derived columns.
+
+    The first call loads the base dataset plus all partitions. Later calls
+    return the same object unless partitions were added since, in which case
+    only the new partition rows are read, derived and appended.
+    """
+    dataset = DATASETS[name]
+    base_hash = csv_hash(dataset.csv_path)
+    paths = partition_files() if dataset.from_partitions else []
+    names = tuple(path.name for path in paths)
+
+    with _load_lock:
+        current = _loaded.get(name)
+        if current and current.base_hash == base_hash and current.partitions == names:
+            return current
+
+        candidate = LoadedDataset(base_hash, names, pd.DataFrame())
+        if current and candidate.extends(current):
+            new_paths = paths[len(current.partitions):]
+            df = current.df
+        else:
+            new_paths = paths
+            df = _derived(dataset, read_dataset(name))
+        if new_paths:
+            rows = dataset.from_partitions(read_partitions(new_paths))
+            df = append_rows(df, _derived(dataset, rows, known=df))
+
+        loaded = LoadedDataset(base_hash, names, df)
+        _loaded[name] = loaded
+        return loaded
+
+
+def dataset_version(name: str) -> str:
+    """Return a hash identifying the source CSV and partitions of a dataset."""
+    dataset = DATASETS[name]
+    parts = [csv_hash(dataset.csv_path)]
+    if dataset.from_partitions:
+        parts += [path.name for path in partition_files()]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_columns(name: str) -> List[str]:
+    """Return the columns of a dataset's CSV, leaving out the derived ones."""
+    dataset = DATASETS[name]
+    if dataset.names:
+        return list(dataset.names)
+    return list(pd.read_csv(dataset.csv_path, nrows=0).columns)
+
+
+def dataset_view(name: str) -> pd.DataFrame:
+    """Return a cheap copy-on-write view of the shared dataset.
+
+    The view shares memory with the cached frame; assigning columns or
+    editing values on it copies only what changes and never affects other
+    sessions.
+    """
+    return load_shared(name).df.copy(deep=False)
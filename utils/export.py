@@ -0,0 +1,90 @@
+"""Lazily built, cached file exports of the datasets.
+
+Exports are only written when a user actually clicks a download button. Each
+file is serialized in chunks to ``data/build/exports/`` under the dataset
+version, so later downloads from any session reuse it until the CSV changes.
+Only the dataset's own CSV columns are exported, not the derived ones
+(artist IDs, representation flags, continents).
+"""
+import gzip
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, TextIO
+
+import pandas as pd
+
+from utils.datasets import BUILD_DIR, dataset_version, dataset_view, source_columns
+
+EXPORT_DIR = BUILD_DIR / "exports"
+
+# Rows serialized per chunk when writing CSV
+CHUNK_ROWS = 5000
+# Part of the file name; bumped when the exported columns change so that
+# files written before are rebuilt
+EXPORT_REVISION = 2
+
+_write_lock = threading.Lock()
+
+
+def _write_csv_chunks(df: pd.DataFrame, f: TextIO):
+    for start in range(0, len(df), CHUNK_ROWS):
+        df.iloc[start:start + CHUNK_ROWS].to_csv(f, header=start == 0, index=False)
+
+
+def write_csv(df: pd.DataFrame, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        _write_csv_chunks(df, f)
+
+
+def write_csv_gz(df: pd.DataFrame, path):
+    with gzip.open(path, "wt", newline="", encoding="utf-8") as f:
+        _write_csv_chunks(df, f)
+
+
+def write_parquet(df: pd.DataFrame, path):
+    df.to_parquet(path, index=False, row_group_size=CHUNK_ROWS)
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """A downloadable file format."""
+    label: str
+    extension: str
+    mime: str
+    write: Callable[[pd.DataFrame, os.PathLike], None]
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    "csv": ExportFormat("CSV", "csv", "text/csv", write_csv),
+    "csv.gz": ExportFormat("Compressed CSV (gzip)", "csv.gz", "application/gzip", write_csv_gz),
+    "parquet": ExportFormat("Parquet", "parquet", "application/vnd.apache.parquet", write_parquet),
+}
+
+
+def export_path(name: str, fmt: str):
+    """Write the export for the current dataset version if needed and return its path."""
+    export_format = EXPORT_FORMATS[fmt]
+    version = dataset_version(name)[:12]
+    path = EXPORT_DIR / f"{name}-{version}-r{EXPORT_REVISION}.{export_format.extension}"
+    if path.is_file():
+        return path
+
+    with _write_lock:
+        if not path.is_file():
+            EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop exports of older versions of this dataset
+            for old in EXPORT_DIR.glob(f"{name}-*.{export_format.extension}"):
+                old.unlink(missing_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            export_format.write(dataset_view(name)[source_columns(name)], tmp_path)
+            os.replace(tmp_path, path)
+    return path
+
+
+def read_export(name: str, fmt: str) -> bytes:
+    """Return the export file's contents, building it on first use."""
+    # Not streamed: st.download_button holds the whole file in memory to
+    # serve it, so only building the file is chunked
+    with open(export_path(name, fmt), "rb") as f:
+        return f.read()
@@ -0,0 +1,91 @@
+"""Process-wide cache of Plotly figures shared by all sessions.
+
+Building a figure with plotly.express and validating it takes tens of
+milliseconds, and most sessions look at the same default charts. A
+:class:`FigureCache` stores each figure's JSON under a key of (dataset
+version, chart id, parameters) and rebuilds a ``go.Figure`` from it without
+re-validating, so a repeated view costs a few milliseconds. Entries are
+evicted least recently used first once ``maxsize`` figures are stored, and
+a new dataset version (e.g. an ingested batch) changes every key.
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from utils.datasets import dataset_version
+from utils.lazy import lazy_import
+from utils.profiling import section
+
+go = lazy_import("plotly.graph_objects")
+
+DEFAULT_MAXSIZE = 64
+
+
+class FigureCache:
+    """Bounded LRU cache of serialized figures with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._figures: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key: Hashable,
+            build: Callable[[], Optional["go.Figure"]]) -> Optional["go.Figure"]:
+        """Return the figure for ``key``, calling ``build`` only on a miss.
+
+        ``build`` may return None (e.g. after reporting an error); nothing
+        is cached then.
+        """
+        with self._lock:
+            spec = self._figures.get(key)
+            if spec is not None:
+                self._figures.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if spec is None:
+            fig = build()
+            if fig is None:
+                return None
+            spec = fig.to_json()
+            with self._lock:
+                self._figures[key] = spec
+                self._figures.move_to_end(key)
+                while len(self._figures) > self.maxsize:
+                    self._figures.popitem(last=False)
+            return fig
+        # The spec came from a validated figure, so skip validating it again
+        return go.Figure(json.loads(spec), _validate=False)
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit/miss counters and how many figures (and bytes) are stored."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._figures),
+                "maxsize": self.maxsize,
+                "bytes": sum(len(spec) for spec in self._figures.values()),
+            }
+
+
+FIGURES = FigureCache()
+
+
+def cached_figure(dataset: str, chart_id: str, params: Optional[Dict[str, Hashable]],
+                  build: Callable[[], Optional["go.Figure"]]) -> Optional["go.Figure"]:
+    """Return a chart of a utils.datasets dataset from the shared cache.
+
+    ``params`` holds every widget value the chart depends on; together with
+    the dataset version and ``chart_id`` it forms the cache key.
+    """
+    with section(f"figure {chart_id}"):
+        key = (dataset_version(dataset), chart_id, tuple(sorted((params or {}).items())))
+        return FIGURES.get(key, build)
@@ -0,0 +1,78 @@
+"""Representation groups (African, African diaspora, ...) flagged per artist.
+
+Each group is a set of regular expressions on categorical columns. Patterns
+are matched once against each column's categories (a few hundred strings)
+and the result is broadcast to the artist rows by categorical code, so
+adding a group doesn't add another full-column scan.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class RepresentationGroup:
+    """An artist group defined by regex patterns on one or more columns.
+
+    An artist belongs to the group when any column matches its pattern.
+    """
+    name: str
+    label: str
+    patterns: Dict[str, str]
+
+    @property
+    def column(self) -> str:
+        return f"is_{self.name}"
+
+
+REPRESENTATION_GROUPS: List[RepresentationGroup] = [
+    RepresentationGroup(
+        "african",
+        "African",
+        {"Ethnicity": r"African", "Nationality": r"African"},
+    ),
+    RepresentationGroup(
+        "african_diaspora",
+        "African diaspora",
+        {
+            "Ethnicity": r"African|Afro|Haitian|Jamaican|Caribbean|Bajan",
+            "Nationality": r"African|Afro|Haitian|Jamaican|Bahamian|Bajan|Trinidad",
+            "Race": r"^Black$",
+        },
+    ),
+    RepresentationGroup(
+        "hispanic",
+        "Hispanic/Latino",
+        {"Ethnicity": r"Hispanic|Latin|Mexican|Cuban|Puerto Rican"},
+    ),
+]
+
+# Flag column names, e.g. for use as extra CountCube keys
+GROUP_COLUMNS = [group.column for group in REPRESENTATION_GROUPS]
+
+
+def match_categories(values: pd.Series, pattern: str) -> np.ndarray:
+    """Return a boolean mask of the rows whose value matches ``pattern``.
+
+    The regex runs on the distinct values only and is mapped back by code.
+    """
+    values = values.astype("category")
+    hits = values.cat.categories.astype(str).str.contains(pattern, regex=True, na=False)
+    # Trailing False so that code -1 (missing value) never matches
+    hits = np.append(np.asarray(hits, dtype=bool), False)
+    return hits[values.cat.codes.to_numpy()]
+
+
+def group_flags(df: pd.DataFrame,
+                groups: Optional[List[RepresentationGroup]] = None) -> pd.DataFrame:
+    """Return one boolean ``is_<name>`` column per group for the rows of ``df``."""
+    flags = {}
+    for group in groups or REPRESENTATION_GROUPS:
+        mask = np.zeros(len(df), dtype=bool)
+        for column, pattern in group.patterns.items():
+            if column in df.columns:
+                mask |= match_categories(df[column], pattern)
+        flags[group.column] = mask
+    return pd.DataFrame(flags, index=df.index)
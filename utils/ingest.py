@@ -0,0 +1,77 @@
+"""Append new museum batches to the partitioned store.
+
+A batch uses the same columns as ``Small Museum Data - Sheet1 (1).csv``. It
+is validated and written as its own CSV in ``data/partitions/``, named with a
+microsecond timestamp (so partitions sort in ingestion order) and a prefix
+of its content hash. A partition is never overwritten: it is linked into
+place and ingestion fails if the name is taken. utils.datasets appends the
+partitions to both the small-museum and combined datasets at load time, and
+running pages pick up new partitions by reading and counting only their rows.
+"""
+import os
+import re
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from utils.datasets import PARTITION_DIR, SMALL_COLUMNS, partition_files, source_hash
+
+
+def validate_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Check a batch has the small museum columns and every row names an artist and museum."""
+    missing = [col for col in SMALL_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Batch is missing column(s): {', '.join(missing)}")
+
+    df = df[SMALL_COLUMNS].apply(lambda col: col.str.strip())
+    df = df.dropna(how="all")
+    incomplete = df["Name"].isna() | df["Museum"].isna()
+    if incomplete.any():
+        rows = ", ".join(str(i + 2) for i in df.index[incomplete][:10])
+        raise ValueError(f"Rows without a Name or Museum (CSV line {rows})")
+    if df.empty:
+        raise ValueError("Batch has no rows")
+    return df
+
+
+def ingest_batch(source: Union[str, Path, pd.DataFrame], name: Optional[str] = None) -> Path:
+    """Validate a batch and write it as a new partition.
+
+    ``name`` labels the partition file; it defaults to the batch's museum.
+    Raises ValueError if the batch is invalid or was already ingested.
+    """
+    if isinstance(source, pd.DataFrame):
+        df = source.astype(str).where(source.notna())
+    else:
+        df = pd.read_csv(source, dtype=str)
+    df = validate_batch(df)
+
+    label = name or "-".join(df["Museum"].unique()[:2])
+    slug = re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-") or "batch"
+
+    PARTITION_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=PARTITION_DIR)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        df.to_csv(tmp_path, index=False)
+
+        # Refuse to ingest the same rows twice
+        new_hash = source_hash(tmp_path)
+        for existing in partition_files():
+            if source_hash(existing) == new_hash:
+                raise ValueError(f"Batch was already ingested as {existing.name}")
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        path = PARTITION_DIR / f"{timestamp}-{new_hash[:8]}-{slug}.csv"
+        # A link fails instead of replacing a partition that has the name
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            raise ValueError(f"Partition {path.name} already exists") from None
+    finally:
+        tmp_path.unlink()
+    return path
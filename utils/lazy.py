@@ -0,0 +1,38 @@
+"""Modules that are imported the first time they are used.
+
+``px = lazy_import("plotly.express")`` binds a stand-in module; the real
+import runs on the first attribute lookup (``px.bar``), so a page pays for
+plotly.express only on a rerun that actually builds a chart with it, not
+when the page is first loaded. After that the stand-in holds the module's
+attributes and behaves like it. Modules that are already imported are
+returned as they are. The dashboard pages and utils.figures import Plotly
+this way.
+
+Names that are only used in annotations should be quoted (``"go.Figure"``)
+so that defining a function doesn't trigger the import.
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Stand-in for a module, imported on first attribute access."""
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes the stand-in doesn't have yet; importlib
+        # holds the module's import lock, so concurrent first uses are safe
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return the module ``name``, or a stand-in importing it on first use."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
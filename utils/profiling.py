@@ -0,0 +1,277 @@
+"""Opt-in timing of named sections of a page rerun.
+
+Hot paths are wrapped in :func:`section` (a context manager) or
+:func:`profiled` (a decorator). Nothing is recorded unless profiling is on
+for the current rerun; a disabled section costs one context-variable lookup
+and a no-op context manager, well under a microsecond.
+
+Profiling is turned on per session with the ``?profile=1`` query parameter,
+or for every session with the ``DASHBOARD_PROFILE=1`` environment variable.
+Each page wraps its ``main`` in :func:`profile_page`, which calls
+:func:`start_page` first and :func:`end_page` last, even if the rerun
+raises or is stopped. While it is on, every section records its wall time,
+the CPU time of the session's thread and the memory it allocated (with
+tracemalloc). :func:`end_page` lists them in a
+"Profiler" expander in the sidebar and appends the rerun as one JSON line to
+``logs/profile.jsonl`` (``DASHBOARD_PROFILE_LOG`` overrides the path).
+
+tracemalloc sees the whole process, so when several sessions profile at the
+same time their allocation figures include each other's.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from contextlib import nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, ContextManager, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROFILE_ENV = "DASHBOARD_PROFILE"
+PROFILE_LOG_ENV = "DASHBOARD_PROFILE_LOG"
+PROFILE_PARAM = "profile"
+DEFAULT_LOG = ROOT / "logs" / "profile.jsonl"
+_TRUE = {"1", "true", "yes", "on"}
+
+
+@dataclass
+class SectionTiming:
+    """What one section of a rerun cost."""
+    name: str
+    depth: int
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    # Net change in traced memory, and the peak above the starting point
+    alloc_kib: float = 0.0
+    peak_kib: float = 0.0
+
+
+class _Frame:
+    __slots__ = ("timing", "wall", "cpu", "memory", "peak")
+
+    def __init__(self, timing: SectionTiming, memory: int):
+        self.timing = timing
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.memory = memory
+        self.peak = memory
+
+
+class Recorder:
+    """Section timings of one page rerun, in the order the sections started."""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.sections: List[SectionTiming] = []
+        self._stack: List[_Frame] = []
+        _start_tracing()
+        # Runs once: when the recorder finishes, or when it is garbage
+        # collected after a rerun that never reached end_page
+        self._release = weakref.finalize(self, _stop_tracing)
+        self._root = _Frame(SectionTiming(page, -1), tracemalloc.get_traced_memory()[0])
+
+    def enter(self, name: str) -> _Frame:
+        memory, peak = tracemalloc.get_traced_memory()
+        # Keep the enclosing sections' peaks before resetting it for this one
+        for frame in [self._root] + self._stack:
+            frame.peak = max(frame.peak, peak)
+        tracemalloc.reset_peak()
+        timing = SectionTiming(name, len(self._stack))
+        self.sections.append(timing)
+        frame = _Frame(timing, memory)
+        self._stack.append(frame)
+        return frame
+
+    def exit(self, frame: _Frame):
+        self._close(frame)
+        if self._stack and self._stack[-1] is frame:
+            self._stack.pop()
+
+    def _close(self, frame: _Frame):
+        memory, peak = tracemalloc.get_traced_memory()
+        frame.peak = max(frame.peak, peak)
+        timing = frame.timing
+        timing.wall_ms += (time.perf_counter() - frame.wall) * 1000
+        timing.cpu_ms += (time.thread_time() - frame.cpu) * 1000
+        timing.alloc_kib += (memory - frame.memory) / 1024
+        timing.peak_kib = max(timing.peak_kib, (frame.peak - frame.memory) / 1024)
+
+    def finish(self) -> SectionTiming:
+        """Stop recording and return the timing of the whole rerun."""
+        while self._stack:
+            self.exit(self._stack[-1])
+        self._close(self._root)
+        self._release()
+        return self._root.timing
+
+
+_current: ContextVar[Optional[Recorder]] = ContextVar("profile_recorder", default=None)
+
+# Sessions currently profiling; tracemalloc runs while there are any, and
+# is only stopped if it was started here
+_tracing_users = 0
+_started_tracing = False
+_tracing_lock = threading.Lock()
+_log_lock = threading.Lock()
+
+
+def _start_tracing():
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    global _tracing_users, _started_tracing
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+class _Section:
+    __slots__ = ("recorder", "name", "frame")
+
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> "_Section":
+        self.frame = self.recorder.enter(self.name)
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.recorder.exit(self.frame)
+        return False
+
+
+# Returned by section() while nothing is being recorded
+_DISABLED = nullcontext()
+
+
+def section(name: str) -> ContextManager:
+    """Time a ``with`` block as a named section of the current rerun."""
+    recorder = _current.get()
+    if recorder is None:
+        return _DISABLED
+    return _Section(recorder, name)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorate a function so each call is a section (named after it by default)."""
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _current.get()
+            if recorder is None:
+                return func(*args, **kwargs)
+            frame = recorder.enter(label)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.exit(frame)
+        return wrapper
+    return decorate
+
+
+def profiling_enabled() -> bool:
+    """True if the environment or the page URL asks for profiling."""
+    if os.environ.get(PROFILE_ENV, "").lower() in _TRUE:
+        return True
+    try:
+        import streamlit as st
+
+        return st.query_params.get(PROFILE_PARAM, "").lower() in _TRUE
+    except Exception:
+        return False
+
+
+def start_page(page: str) -> Optional[Recorder]:
+    """Start recording this rerun of ``page`` if profiling is enabled."""
+    previous = _current.get()
+    if previous is not None:
+        previous.finish()
+    recorder = Recorder(page) if profiling_enabled() else None
+    _current.set(recorder)
+    return recorder
+
+
+def end_page():
+    """Stop recording, show the sections in the sidebar and log them."""
+    recorder = _current.get()
+    if recorder is None:
+        return
+    _current.set(None)
+    total = recorder.finish()
+    show_profile(recorder, total)
+    log_profile(recorder, total)
+
+
+def profile_page(page: str) -> Callable[[Callable], Callable]:
+    """Decorate a page's ``main`` to profile each rerun of it."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start_page(page)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                end_page()
+        return wrapper
+    return decorate
+
+
+def show_profile(recorder: Recorder, total: SectionTiming):
+    import streamlit as st
+
+    with st.sidebar.expander("Profiler"):
+        st.caption(f"{recorder.page}: {total.wall_ms:,.1f} ms wall, "
+                   f"{total.cpu_ms:,.1f} ms CPU, {total.peak_kib:,.0f} KiB peak")
+        st.dataframe(
+            [{
+                "Section": " " * timing.depth + timing.name,
+                "Wall ms": round(timing.wall_ms, 1),
+                "CPU ms": round(timing.cpu_ms, 1),
+                "Alloc KiB": round(timing.alloc_kib),
+                "Peak KiB": round(timing.peak_kib),
+            } for timing in recorder.sections],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
+def log_profile(recorder: Recorder, total: SectionTiming):
+    """Append the rerun to the JSON-lines profile log; failures are ignored."""
+    path = Path(os.environ.get(PROFILE_LOG_ENV) or DEFAULT_LOG)
+    record = {
+        "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        "page": recorder.page,
+        "pid": os.getpid(),
+        "wall_ms": round(total.wall_ms, 3),
+        "cpu_ms": round(total.cpu_ms, 3),
+        "peak_kib": round(total.peak_kib, 1),
+        "sections": [
+            {key: round(value, 3) if isinstance(value, float) else value
+             for key, value in asdict(timing).items()}
+            for timing in recorder.sections
+        ],
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _log_lock, open(path, "a") as log:
+            log.write(json.dumps(record) + "\n")
+    except OSError:
+        pass
@@ -0,0 +1,197 @@
+"""In-memory search indexes used by the pages' search boxes."""
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+class SubstringIndex:
+    """Case-insensitive substring lookup over a small vocabulary.
+
+    Every substring of every value is mapped to the sorted row positions that
+    contain it, so a query is a single dict lookup instead of a scan. Memory
+    grows with the sum of squared value lengths, which suits short values
+    such as single words.
+    """
+
+    def __init__(self, values: Iterable[str]):
+        positions = defaultdict(list)
+        for row, value in enumerate(values):
+            value = str(value).lower()
+            substrings = {
+                value[start:end]
+                for start in range(len(value))
+                for end in range(start + 1, len(value) + 1)
+            }
+            for substring in substrings:
+                positions[substring].append(row)
+        self._positions = {
+            substring: np.array(rows, dtype=np.int32)
+            for substring, rows in positions.items()
+        }
+        self._empty = np.array([], dtype=np.int32)
+
+    def search(self, query: str) -> np.ndarray:
+        """Return the row positions whose value contains ``query``."""
+        return self._positions.get(query.lower(), self._empty)
+
+
+def normalize_text(value: str) -> str:
+    """Lowercase, strip diacritics and collapse punctuation to single spaces."""
+    value = str(value).lower()
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value)
+        value = "".join(char for char in value if not unicodedata.combining(char))
+        value = value.encode("ascii", "replace").decode()
+    return " ".join(_NON_ALNUM.sub(" ", value).split())
+
+
+def trigram_codes(normalized: List[str], width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (value position, trigram code) for every trigram of padded values.
+
+    Values are padded with a space on each side and packed into a uint8
+    matrix, so the trigrams of all values are computed in one vectorized
+    pass; a trigram's code is its three bytes as one integer.
+    """
+    padded = np.array([f" {value} ".encode() for value in normalized], dtype=f"S{width}")
+    chars = padded.view(np.uint8).reshape(len(normalized), width).astype(np.int32)
+    lengths = np.char.str_len(padded)
+    codes = (chars[:, :-2] << 16) | (chars[:, 1:-1] << 8) | chars[:, 2:]
+    valid = np.arange(width - 2) < (lengths - 2)[:, None]
+    rows = np.broadcast_to(np.arange(len(normalized))[:, None], codes.shape)
+    return rows[valid], codes[valid]
+
+
+def first_of_runs(values: np.ndarray) -> np.ndarray:
+    """Mark the first element of each run of equal values in a sorted array."""
+    first = np.ones(len(values), dtype=bool)
+    first[1:] = values[1:] != values[:-1]
+    return first
+
+
+class TrigramIndex:
+    """Ranked substring and fuzzy search over a list of strings.
+
+    Every value is split into overlapping three-character grams (after
+    :func:`normalize_text`, so "Dürer" matches "durer") and an inverted
+    index maps each gram to the sorted positions of the values containing
+    it. A query's grams are looked up and counted per value; values sharing
+    at least ``min_overlap`` of them are ranked by how much of the query they
+    contain and how closely their length matches, with exact substring
+    matches first. Misspelt queries still share most grams, so typos match.
+    """
+
+    def __init__(self, values: Sequence[str]):
+        self.values = list(values)
+        self._normalized = [normalize_text(value) for value in self.values]
+        width = max((len(value) for value in self._normalized), default=0) + 2
+        rows, codes = trigram_codes(self._normalized, max(width, 3))
+
+        # Unique (gram, value) pairs sorted by gram give the postings lists
+        pairs = np.sort((codes.astype(np.int64) << 32) | rows)
+        pairs = pairs[first_of_runs(pairs)]
+        codes, rows = pairs >> 32, (pairs & 0xFFFFFFFF).astype(np.int32)
+        starts = np.flatnonzero(first_of_runs(codes))
+        self._grams = codes[starts]
+        self._starts = np.append(starts, len(codes))
+        self._postings = rows
+        self._gram_counts = np.bincount(rows, minlength=len(self.values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _query_grams(self, query: str) -> np.ndarray:
+        query = normalize_text(query)
+        # Short queries must start a word; longer ones get no padding, so
+        # they can match the middle of a word
+        if len(query) < 3:
+            query = f" {query} "[:max(3, len(query) + 1)]
+        data = query.encode()
+        return np.unique(np.array(
+            [(data[i] << 16) | (data[i + 1] << 8) | data[i + 2] for i in range(len(data) - 2)],
+            dtype=np.int64,
+        ))
+
+    def search(self, query: str, k: int = 20,
+               min_overlap: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the positions and scores of the ``k`` best matching values."""
+        empty = (np.array([], dtype=np.int64), np.array([]))
+        grams = self._query_grams(query)
+        slots = np.searchsorted(self._grams, grams)
+        found = slots < len(self._grams)
+        found[found] = self._grams[slots[found]] == grams[found]
+        if not found.any():
+            return empty
+        postings = np.concatenate(
+            [self._postings[self._starts[s]:self._starts[s + 1]] for s in slots[found]]
+        )
+
+        shared = np.bincount(postings, minlength=len(self.values))
+        candidates = np.flatnonzero(shared >= max(1, min_overlap * len(grams)))
+        shared = shared[candidates]
+        containment = shared / len(grams)
+        similarity = shared / (len(grams) + self._gram_counts[candidates] - shared)
+        scores = containment + similarity
+
+        # Rank a shortlist, moving exact substring matches to the front
+        shortlist = min(len(scores), 4 * k)
+        top = np.argpartition(-scores, shortlist - 1)[:shortlist] if shortlist < len(scores) \
+            else np.arange(len(scores))
+        needle = normalize_text(query)
+        for i in top:
+            if containment[i] == 1 and needle in self._normalized[candidates[i]]:
+                scores[i] += 1
+        top = top[np.argsort(-scores[top], kind="stable")][:k]
+        return candidates[top], scores[top]
+
+
+class RowSearch:
+    """:class:`TrigramIndex` over the distinct values of several DataFrame columns.
+
+    Matching values are mapped back to the rows that hold them, best match
+    first, with the column that matched in a ``Matched on`` column.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: Sequence[str]):
+        self.df = df
+        self.columns = list(columns)
+        values, owners = [], []
+        self._rows: List[Tuple[np.ndarray, np.ndarray]] = []
+        for column_id, column in enumerate(self.columns):
+            values_of = df[column].astype("category")
+            categories = values_of.cat.categories
+            values += [str(value) for value in categories]
+            owners += [(column_id, code) for code in range(len(categories))]
+            # Rows grouped by value: rows of code c are order[bounds[c]:bounds[c + 1]]
+            codes = values_of.cat.codes.to_numpy()
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(categories) + 1))
+            self._rows.append((order, bounds))
+        self._owners = owners
+        self.index = TrigramIndex(values)
+
+    def search(self, query: str, k: int = 25) -> pd.DataFrame:
+        """Return up to ``k`` rows matching ``query`` in any column, best first."""
+        rows, matched, scores = [], [], []
+        seen = set()
+        positions, value_scores = self.index.search(query, k=k)
+        for position, score in zip(positions, value_scores):
+            column_id, code = self._owners[position]
+            order, bounds = self._rows[column_id]
+            for row in order[bounds[code]:bounds[code + 1]]:
+                if row not in seen:
+                    seen.add(row)
+                    rows.append(row)
+                    matched.append(self.columns[column_id])
+                    scores.append(score)
+                if len(rows) == k:
+                    break
+            if len(rows) == k:
+                break
+        return self.df.iloc[rows].assign(**{"Matched on": matched, "Score": scores})
@@ -0,0 +1,189 @@
+"""Offline, lexicon-based sentiment scores for mission statements.
+
+Words are scored from ``data/sentiment_lexicon.csv`` (-1 negative to +1
+positive). A negation ("not", "never", ...) in the two preceding words
+flips and halves a word's score and an intensifier ("very", "deeply", ...)
+strengthens it. A sentence's polarity is the mean score of its scored words,
+and a statement's polarity is the mean over all of its scored words, so
+statements with no lexicon words are neutral (0).
+
+:class:`SentimentScorer` tokenizes a whole batch of sentences into flat
+arrays and scores them with numpy in one pass. Results are cached per
+statement under a hash of its text and the lexicon, so only new or edited
+statements are scored again, and the cache can be saved between runs.
+"""
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.datasets import DATA_DIR
+from utils.text import Statement, normalize_word
+
+LEXICON_PATH = DATA_DIR / "sentiment_lexicon.csv"
+SENTIMENT_CSV = "Mission_Statement_Sentiment.csv"
+SENTENCE_SENTIMENT_CSV = "Mission_Statement_Sentence_Sentiment.csv"
+
+NEGATIONS = frozenset(["not", "no", "never", "neither", "nor", "without", "cannot", "don't",
+                       "doesn't", "isn't", "aren't", "won't"])
+INTENSIFIERS = frozenset(["very", "deeply", "truly", "highly", "most", "extremely",
+                          "especially", "particularly", "greatly", "profoundly"])
+NEGATION_FACTOR = -0.5
+INTENSIFIER_FACTOR = 1.3
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+|\n+")
+_TOKEN = re.compile(r"[a-z]+(?:[-'][a-z]+)*")
+
+# Word codes below 1; lexicon words are numbered from 1
+UNSCORED, NEGATION, INTENSIFIER = 0, -1, -2
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split a statement into its non-empty sentences."""
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+class Lexicon:
+    """Word polarities, with a memoized word -> code lookup."""
+
+    def __init__(self, polarity: Dict[str, float]):
+        words = sorted(polarity)
+        self.scores = np.array([0.0] + [polarity[w] for w in words], dtype=np.float64)
+        self._codes = {word: i for i, word in enumerate(words, 1)}
+        self._codes.update({word: NEGATION for word in NEGATIONS if word not in polarity})
+        self._codes.update({word: INTENSIFIER for word in INTENSIFIERS})
+        self._memo: Dict[str, int] = {}
+        entries = "\n".join(f"{w},{polarity[w]}" for w in words)
+        self.version = hashlib.sha1(entries.encode()).hexdigest()
+
+    @classmethod
+    def from_csv(cls, path: Path = LEXICON_PATH) -> "Lexicon":
+        df = pd.read_csv(path)
+        return cls(dict(zip(df["Word"].str.strip().str.lower(), df["Polarity"].astype(float))))
+
+    def code(self, token: str) -> int:
+        code = self._memo.get(token)
+        if code is None:
+            code = self._codes.get(token)
+            if code is None:
+                code = self._codes.get(normalize_word(token), UNSCORED)
+            self._memo[token] = code
+        return code
+
+    def score(self, sentences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the polarity and number of scored words of each sentence."""
+        codes: List[int] = []
+        lengths = np.zeros(len(sentences), dtype=np.int64)
+        for i, sentence in enumerate(sentences):
+            tokens = _TOKEN.findall(sentence.lower().replace("’", "'"))
+            codes.extend(map(self.code, tokens))
+            lengths[i] = len(tokens)
+        codes = np.array(codes, dtype=np.int64)
+        sentence_ids = np.repeat(np.arange(len(sentences)), lengths)
+        if not len(codes):
+            return np.zeros(len(sentences)), np.zeros(len(sentences), dtype=np.int64)
+
+        # Look back up to two words within the same sentence for modifiers
+        factor = np.ones(len(codes))
+        for shift in (1, 2):
+            previous = np.full(len(codes), UNSCORED)
+            previous[shift:] = codes[:-shift]
+            same = np.zeros(len(codes), dtype=bool)
+            same[shift:] = sentence_ids[shift:] == sentence_ids[:-shift]
+            factor[same & (previous == NEGATION)] *= NEGATION_FACTOR
+            factor[same & (previous == INTENSIFIER)] *= INTENSIFIER_FACTOR
+
+        scored = codes > 0
+        values = np.clip(self.scores[np.where(scored, codes, 0)] * factor, -1.0, 1.0)
+        totals = np.bincount(sentence_ids, weights=values * scored, minlength=len(sentences))
+        counts = np.bincount(sentence_ids, weights=scored, minlength=len(sentences))
+        polarity = np.divide(totals, counts, out=np.zeros(len(sentences)), where=counts > 0)
+        return polarity, counts.astype(np.int64)
+
+
+class SentimentScorer:
+    """Batch scorer with a per-statement cache keyed by content hash.
+
+    The cache maps a statement hash to its sentences with their polarities
+    and scored word counts; :meth:`load_cache` and :meth:`save_cache` keep
+    it on disk between runs.
+    """
+
+    def __init__(self, lexicon: Optional[Lexicon] = None):
+        self.lexicon = lexicon or Lexicon.from_csv()
+        self._cache: Dict[str, List[Tuple[str, float, int]]] = {}
+        self._used = set()
+        self.hits = self.misses = 0
+
+    def statement_hash(self, text: str) -> str:
+        return hashlib.sha1(f"{self.lexicon.version}\n{text}".encode()).hexdigest()
+
+    def _score_missing(self, texts: Dict[str, str]):
+        keys, sentences = [], []
+        for key, text in texts.items():
+            parts = split_sentences(text)
+            keys += [key] * len(parts)
+            sentences += parts
+            self._cache[key] = []
+        polarity, words = self.lexicon.score(sentences)
+        for key, row in zip(keys, zip(sentences, polarity.tolist(), words.tolist())):
+            self._cache[key].append(row)
+
+    def score(self, statements: Iterable[Statement]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Score statements, reusing cached results for unchanged text.
+
+        Returns a statement table (``Institution``/``Polarity``/``Sentences``/
+        ``Words``) and a sentence table (``Institution``/``Sentence``/
+        ``Polarity``/``Words``).
+        """
+        statements = list(statements)
+        keys = [self.statement_hash(s.text) for s in statements]
+        missing = {k: s.text for k, s in zip(keys, statements) if k not in self._cache}
+        self.misses += len(missing)
+        self.hits += len(statements) - len(missing)
+        self._used.update(keys)
+        if missing:
+            self._score_missing(missing)
+
+        statement_rows, sentence_rows = [], []
+        for key, statement in zip(keys, statements):
+            sentences = self._cache[key]
+            words = sum(n for _, _, n in sentences)
+            total = sum(polarity * n for _, polarity, n in sentences)
+            statement_rows.append(
+                (statement.institution, total / words if words else 0.0, len(sentences), words)
+            )
+            sentence_rows += [(statement.institution, *row) for row in sentences]
+
+        return (
+            pd.DataFrame(statement_rows, columns=["Institution", "Polarity", "Sentences", "Words"]),
+            pd.DataFrame(sentence_rows, columns=["Institution", "Sentence", "Polarity", "Words"]),
+        )
+
+    def load_cache(self, path: Path):
+        """Add the cached results saved at ``path``, if the file exists."""
+        if not path.is_file():
+            return
+        rows = pd.read_csv(path, dtype={"Hash": str, "Sentence": str}, keep_default_na=False)
+        for key, sentence, polarity, words in rows.itertuples(index=False):
+            self._cache.setdefault(key, []).append((sentence, polarity, words))
+
+    def save_cache(self, path: Path):
+        """Write the results of the statements scored so far to ``path``.
+
+        Entries loaded from an earlier run but not scored again (edited
+        statements, or results for an older lexicon) are dropped.
+        """
+        rows = [(key, *row) for key in self._used for row in self._cache[key]]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(rows, columns=["Hash", "Sentence", "Polarity", "Words"]).to_csv(path, index=False)
+
+
+def load_scores(path: Path = DATA_DIR / SENTIMENT_CSV) -> Optional[pd.DataFrame]:
+    """Load the statement scores written by scripts/process_statements.py, if any."""
+    if not path.is_file():
+        return None
+    return pd.read_csv(path, dtype={"Institution": str})
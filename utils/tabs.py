@@ -0,0 +1,39 @@
+"""Tabs that only compute the tab being looked at.
+
+Plain ``st.tabs`` runs the body of every tab on every rerun and sends all
+of them to the browser. :func:`lazy_tabs` keys the tabs and reruns the page
+when another one is picked, so only the open tab's function runs. The open
+tab is remembered in session state, also when the visitor goes to another
+page and comes back.
+
+What a tab computes stays in the bounded caches it already goes through
+(``utils.figures.FIGURES``, the count cube's slices, the trend engine), so
+switching back to a tab seen before is cheap.
+"""
+from typing import Callable, Dict, Optional
+
+import streamlit as st
+
+from utils.profiling import section
+
+
+def lazy_tabs(key: str, tabs: Dict[str, Callable[[], None]],
+              default: Optional[str] = None) -> Optional[str]:
+    """Render one tab per label of ``tabs`` and run only the open one's function.
+
+    ``key`` is the session state key holding the open tab's label; ``default``
+    is opened the first time (the first tab if None). Returns the open label.
+    """
+    # Widget state is dropped while another page is shown; this copy isn't
+    remembered = f"{key}_remembered"
+    if key not in st.session_state and st.session_state.get(remembered) in tabs:
+        default = st.session_state[remembered]
+
+    containers = st.tabs(list(tabs), key=key, default=default, on_change="rerun")
+    for (label, render), container in zip(tabs.items(), containers):
+        if container.open:
+            st.session_state[remembered] = label
+            with container, section(f"{label} tab"):
+                render()
+            return label
+    return None
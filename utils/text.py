@@ -0,0 +1,189 @@
+"""Tokenize museum mission statements into word counts.
+
+The mission statement page reads a precomputed frequency table;
+``scripts/process_statements.py`` builds it from raw statements with
+:func:`count_corpus`. A corpus is either a directory of ``.txt`` files (one
+statement per file, named after the institution) or a JSONL file with one
+``{"institution": ..., "text": ...}`` object per line.
+
+Statements are streamed from disk and tokenized across a process pool; only
+the per-institution word counts and the co-occurring pair counts are kept in
+memory.
+"""
+import json
+import os
+import re
+import unicodedata
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from utils.cooccurrence import DEFAULT_WINDOW, window_pairs
+
+# Common English function words plus words every mission statement shares
+# without saying anything about the institution
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+even ever every few for from further had has have having he her here hers herself him
+himself his how i if in into is it its itself just may me might more most must my
+myself no nor not now of off on once only or other our ours ourselves out over own
+per same shall she should so some such than that the their theirs them themselves then
+there these they this those through thus to too under until up upon us very via was
+we well were what when where whether which while who whom whose why will with within
+without would yet you your yours yourself yourselves
+""".split())
+
+# Per-institution word counts written by scripts/process_statements.py
+INSTITUTION_WORDS_CSV = "Mission_Statement_Institution_Words.csv"
+
+# Keys accepted for the two fields of a JSONL record
+INSTITUTION_KEYS = ("institution", "museum", "name")
+TEXT_KEYS = ("text", "statement", "mission")
+
+_WORD = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+
+@dataclass(frozen=True)
+class Statement:
+    """One institution's raw mission statement."""
+    institution: str
+    text: str
+
+
+@lru_cache(maxsize=65536)
+def normalize_word(word: str) -> str:
+    """Fold possessives and regular plurals so "museums" counts as "museum"."""
+    if word.endswith("'s"):
+        word = word[:-2]
+    word = word.replace("'", "")
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Return the normalized, stopword-filtered words of a statement."""
+    text = text.lower()
+    if not text.isascii():
+        # Drop accents ("café" -> "cafe"); other non-ASCII characters split words
+        text = unicodedata.normalize("NFKD", text.replace("’", "'"))
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    # Stopwords are checked before folding too, or "does" would count as "doe"
+    words = (normalize_word(word) for word in _WORD.findall(text) if word not in STOPWORDS)
+    return [word for word in words if len(word) > 1 and word not in STOPWORDS]
+
+
+def _count_chunk(chunk: List[Statement], window: int) -> Tuple[Dict[str, Counter], Counter]:
+    # Merged per institution here so less is pickled back to the parent
+    counts: Dict[str, Counter] = {}
+    pairs = Counter()
+    for statement in chunk:
+        tokens = tokenize(statement.text)
+        counts.setdefault(statement.institution, Counter()).update(tokens)
+        if window > 1:
+            pairs.update(window_pairs(tokens, window))
+    return counts, pairs
+
+
+def read_corpus(path: Union[str, Path]) -> Iterator[Statement]:
+    """Yield the statements of a directory of .txt files or a JSONL file."""
+    path = Path(path)
+    if path.is_dir():
+        for file in sorted(path.glob("*.txt")):
+            yield Statement(file.stem, file.read_text(encoding="utf-8"))
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            institution = next((record[k] for k in INSTITUTION_KEYS if k in record), None)
+            text = next((record[k] for k in TEXT_KEYS if k in record), None)
+            if institution is None or text is None:
+                raise ValueError(f"{path}:{line_no}: record needs an institution and a text")
+            yield Statement(str(institution).strip(), str(text))
+
+
+def _chunks(statements: Iterable[Statement], size: int) -> Iterator[List[Statement]]:
+    statements = iter(statements)
+    while chunk := list(islice(statements, size)):
+        yield chunk
+
+
+@dataclass
+class CorpusCounts:
+    """Word counts for a whole corpus and for each institution in it.
+
+    ``pairs`` counts co-occurring word pairs (see utils.cooccurrence).
+    """
+    by_institution: Dict[str, Counter]
+    pairs: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> Counter:
+        total = Counter()
+        for counts in self.by_institution.values():
+            total.update(counts)
+        return total
+
+    def frequency_table(self, min_count: int = 3) -> pd.DataFrame:
+        """Return the ``Words``/``Frequency`` table the mission statement page reads."""
+        words = [(w, n) for w, n in self.total.most_common() if n >= min_count]
+        return pd.DataFrame(words, columns=["Words", "Frequency"])
+
+    def institution_table(self) -> pd.DataFrame:
+        """Return one ``Institution``/``Words``/``Count`` row per word used by an institution."""
+        rows = [
+            (institution, word, count)
+            for institution, counts in self.by_institution.items()
+            for word, count in counts.most_common()
+        ]
+        return pd.DataFrame(rows, columns=["Institution", "Words", "Count"])
+
+
+def count_corpus(statements: Iterable[Statement], workers: Optional[int] = None,
+                 chunk_size: int = 256, window: int = DEFAULT_WINDOW) -> CorpusCounts:
+    """Tokenize and count statements in a single pass.
+
+    Chunks of ``chunk_size`` statements are tokenized in a pool of
+    ``workers`` processes (default: one per CPU); ``workers=1`` runs in this
+    process. Statements of the same institution are added together. Words
+    within ``window`` tokens of each other are counted as co-occurring; a
+    window below 2 skips the pair counts.
+    """
+    corpus = CorpusCounts({})
+    count_chunk = partial(_count_chunk, window=window)
+
+    def add(results):
+        counts, pairs = results
+        for institution, words in counts.items():
+            corpus.by_institution.setdefault(institution, Counter()).update(words)
+        corpus.pairs.update(pairs)
+
+    chunks = _chunks(statements, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            add(count_chunk(chunk))
+    else:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Executor.map() would read the whole corpus up front, so keep
+            # only a few chunks per worker in flight
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(count_chunk, chunk))
+                if len(pending) >= 4 * workers:
+                    add(pending.popleft().result())
+            while pending:
+                add(pending.popleft().result())
+    return corpus
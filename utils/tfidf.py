@@ -0,0 +1,209 @@
+"""TF-IDF vectors of each institution's mission statement.
+
+:class:`TfidfIndex` turns the per-institution word counts written by
+``scripts/process_statements.py`` into a sparse (CSR) matrix of
+L2-normalized TF-IDF rows, so the dot product of two rows is their cosine
+similarity. Institutions are grouped with spherical k-means at build time.
+
+The index is saved to ``data/build/tfidf/`` as ``.npy`` arrays plus a JSON
+file of names, stamped with the hash of the counts CSV it was built from.
+:func:`load_tfidf` memory-maps that build when it is current and only
+rebuilds it when the counts changed.
+"""
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utils.datasets import BUILD_DIR, DATA_DIR, csv_hash
+from utils.text import INSTITUTION_WORDS_CSV
+
+INSTITUTION_WORDS_PATH = DATA_DIR / INSTITUTION_WORDS_CSV
+TFIDF_DIR = BUILD_DIR / "tfidf"
+ARRAYS = ["indptr", "indices", "data", "clusters"]
+
+DEFAULT_CLUSTERS = 6
+CLUSTER_TERMS = 5
+
+
+class TfidfIndex:
+    """Cosine nearest-neighbour queries and clusters over institutions."""
+
+    def __init__(self, institutions: List[str], terms: List[str], indptr: np.ndarray,
+                 indices: np.ndarray, data: np.ndarray, clusters: np.ndarray,
+                 cluster_terms: Optional[List[List[str]]] = None):
+        self.institutions = institutions
+        self.terms = terms
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.clusters = clusters
+        self.cluster_terms = cluster_terms or []
+        self._rows: Dict[str, int] = {name: i for i, name in enumerate(institutions)}
+        self._row_ids = np.repeat(np.arange(len(institutions)), np.diff(indptr))
+        self._similar: Dict[tuple, pd.DataFrame] = {}
+
+    @classmethod
+    def build(cls, counts: pd.DataFrame, n_clusters: int = DEFAULT_CLUSTERS) -> "TfidfIndex":
+        """Build from an ``Institution``/``Words``/``Count`` table."""
+        institution = counts["Institution"].astype("category")
+        term = counts["Words"].astype(str).astype("category")
+        rows = institution.cat.codes.to_numpy()
+        cols = term.cat.codes.to_numpy().astype(np.int32)
+        tf = 1 + np.log(counts["Count"].to_numpy(dtype=np.float64))
+
+        n_rows = len(institution.cat.categories)
+        df = np.bincount(cols, minlength=len(term.cat.categories))
+        idf = np.log((1 + n_rows) / (1 + df)) + 1
+        values = tf * idf[cols]
+
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=n_rows))
+        values = (values / norms[rows]).astype(np.float32)
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=n_rows))])
+
+        index = cls(
+            [str(name) for name in institution.cat.categories],
+            [str(word) for word in term.cat.categories],
+            indptr.astype(np.int64), cols, values, np.zeros(n_rows, dtype=np.int32),
+        )
+        index._cluster(min(n_clusters, n_rows))
+        return index
+
+    def __contains__(self, institution: str) -> bool:
+        return institution in self._rows
+
+    def __len__(self) -> int:
+        return len(self.institutions)
+
+    def _dots(self, dense: np.ndarray) -> np.ndarray:
+        """Return the dot product of every row with a dense vector."""
+        return np.bincount(self._row_ids, weights=self.data * dense[self.indices],
+                           minlength=len(self.institutions))
+
+    def _dense(self, row: int) -> np.ndarray:
+        vector = np.zeros(len(self.terms))
+        span = slice(self.indptr[row], self.indptr[row + 1])
+        vector[self.indices[span]] = self.data[span]
+        return vector
+
+    def _centroids(self, labels: np.ndarray, k: int) -> np.ndarray:
+        n_terms = len(self.terms)
+        sums = np.bincount(labels[self._row_ids] * n_terms + self.indices,
+                           weights=self.data, minlength=k * n_terms).reshape(k, n_terms)
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        return np.divide(sums, norms, out=np.zeros_like(sums), where=norms > 0)
+
+    def _cluster(self, k: int, iterations: int = 50, seed: int = 0):
+        """Spherical k-means with k-means++ seeding; sets clusters and their top terms."""
+        if k < 1:
+            return
+        rng = np.random.default_rng(seed)
+        centroids = [self._dense(int(rng.integers(len(self))))]
+        nearest = self._dots(centroids[0])
+        for _ in range(1, k):
+            distance = np.clip(1 - nearest, 0, None) ** 2
+            if distance.sum() == 0:
+                break
+            centroids.append(self._dense(int(rng.choice(len(self), p=distance / distance.sum()))))
+            nearest = np.maximum(nearest, self._dots(centroids[-1]))
+        centroids = np.array(centroids)
+
+        labels = None
+        for _ in range(iterations):
+            similarity = np.stack([self._dots(centroid) for centroid in centroids])
+            new_labels = similarity.argmax(axis=0).astype(np.int32)
+            if labels is not None and np.array_equal(labels, new_labels):
+                break
+            labels = new_labels
+            centroids = self._centroids(labels, len(centroids))
+
+        # Number clusters by size so cluster 0 is the largest
+        sizes = np.bincount(labels, minlength=len(centroids))
+        rank = np.empty(len(centroids), dtype=np.int32)
+        rank[np.argsort(-sizes, kind="stable")] = np.arange(len(centroids))
+        self.clusters = rank[labels]
+        centroids = centroids[np.argsort(-sizes, kind="stable")]
+        self.cluster_terms = [
+            [self.terms[i] for i in np.argsort(-centroid)[:CLUSTER_TERMS] if centroid[i] > 0]
+            for centroid in centroids
+        ]
+
+    def similar(self, institution: str, k: int = 5) -> pd.DataFrame:
+        """Return the ``k`` institutions with the most similar statements.
+
+        The result has ``Institution``, ``Similarity`` (cosine, 0 to 1) and
+        ``Cluster`` columns, most similar first. The institution itself is
+        left out, so at most ``len(self) - 1`` rows are returned.
+        """
+        k = max(0, min(k, len(self) - 1))
+        key = (institution, k)
+        if key not in self._similar:
+            row = self._rows[institution]
+            scores = self._dots(self._dense(row))
+            others = np.delete(np.arange(len(self)), row)
+            top = others[np.argsort(-scores[others], kind="stable")[:k]]
+            self._similar[key] = pd.DataFrame({
+                "Institution": [self.institutions[i] for i in top],
+                "Similarity": scores[top],
+                "Cluster": self.clusters[top],
+            })
+        return self._similar[key].copy()
+
+    def cluster_table(self) -> pd.DataFrame:
+        """Return each institution's cluster (``Institution``/``Cluster``)."""
+        return pd.DataFrame({"Institution": self.institutions, "Cluster": self.clusters})
+
+    def save(self, directory: Path, version: str):
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ARRAYS:
+            np.save(directory / f"{name}.npy", np.asarray(getattr(self, name)))
+        meta = {
+            "version": version,
+            "institutions": self.institutions,
+            "terms": self.terms,
+            "cluster_terms": self.cluster_terms,
+        }
+        # Written last, so a build interrupted before this point is ignored
+        (directory / "meta.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, directory: Path) -> "TfidfIndex":
+        """Load a saved index, memory-mapping its arrays."""
+        meta = json.loads((directory / "meta.json").read_text())
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in ARRAYS}
+        return cls(meta["institutions"], meta["terms"], cluster_terms=meta["cluster_terms"],
+                   **arrays)
+
+
+def saved_version(directory: Path = TFIDF_DIR) -> Optional[str]:
+    """Return the counts hash a saved index was built from, if there is one."""
+    try:
+        return json.loads((directory / "meta.json").read_text())["version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def build_tfidf(counts_path: Path = INSTITUTION_WORDS_PATH,
+                directory: Path = TFIDF_DIR) -> TfidfIndex:
+    """Build the index from a per-institution counts CSV and save it."""
+    index = TfidfIndex.build(pd.read_csv(counts_path, dtype={"Institution": str, "Words": str}))
+    (directory / "meta.json").unlink(missing_ok=True)
+    index.save(directory, csv_hash(counts_path))
+    return index
+
+
+def load_tfidf(counts_path: Path = INSTITUTION_WORDS_PATH,
+               directory: Path = TFIDF_DIR) -> Optional[TfidfIndex]:
+    """Memory-map the saved index, rebuilding it first if the counts changed.
+
+    Returns None when there are no per-institution counts to build from.
+    """
+    if not counts_path.is_file():
+        return None
+    if saved_version(directory) != csv_hash(counts_path):
+        build_tfidf(counts_path, directory)
+    return TfidfIndex.load(directory)
@@ -0,0 +1,151 @@
+"""Artist counts and representation over time, at any bin width.
+
+A :class:`TrendEngine` reduces the artist rows once to integer arrays: each
+counted artist's birth year, museum code and representation group flags. A
+trend at any bin width is then one ``np.bincount`` over ``year // width``
+(offset by the museum code when split by museum), so changing the width
+never goes back to pandas. Results are memoized per parameter set.
+
+Overall, each artist is counted once, from the same row as the count cube
+in utils.aggregates; split by museum, once per museum holding their work.
+Birth years are shared between an artist's rows, so an artist is placed in
+time even when only one museum records the year.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregates import CUBE_DIMENSIONS, distinct_positions
+from utils.artists import ARTIST_ID
+from utils.groups import GROUP_COLUMNS
+
+BIN_WIDTHS: Dict[str, int] = {"Year": 1, "5 years": 5, "Decade": 10, "Quarter century": 25}
+# Earlier birth years are placeholders (such as 0), not dates
+MIN_YEAR = 1000
+ALL_MUSEUMS = "All museums"
+# Trends kept per engine, least recently used first out
+MAX_CACHED_TRENDS = 128
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum each row of a 2-D array over a centered window, shrunk at the edges."""
+    sums = np.cumsum(np.pad(values, ((0, 0), (1, 0))), axis=1)
+    bins = np.arange(values.shape[1])
+    low = np.clip(bins - (window - 1) // 2, 0, None)
+    high = np.clip(bins + window // 2 + 1, None, values.shape[1])
+    return sums[:, high] - sums[:, low]
+
+
+class TrendEngine:
+    """Counts and group proportions per birth-year bin, overall or per museum."""
+
+    def __init__(self, df: pd.DataFrame, year: str = "BeginDate", museum: str = "Museum",
+                 flags: Optional[List[str]] = None, unique: str = ARTIST_ID):
+        years = df[year].to_numpy(dtype=np.float64, na_value=np.nan)
+        ids = df[unique] if unique in df.columns else pd.Series(pd.NA, index=df.index)
+        known = ids.notna().to_numpy()
+        if known.any():
+            # An artist's birth year is the one any of their rows records
+            shared = pd.Series(years[known]).groupby(ids[known].to_numpy()).transform("max")
+            years[known] = shared.to_numpy()
+        dated = years >= MIN_YEAR
+
+        museums = df[museum].astype("category")
+        self.museums: List[str] = [str(name) for name in museums.cat.categories]
+        self.flags = [flag for flag in (flags or GROUP_COLUMNS) if flag in df.columns]
+
+        codes = museums.cat.codes.to_numpy().astype(np.int64)
+        if unique in df.columns:
+            dimensions = [dim for dim in CUBE_DIMENSIONS if dim in df.columns]
+            overall = np.zeros(len(df), dtype=bool)
+            overall[distinct_positions(df, unique, dimensions)] = True
+            per_museum = (ids.isna() | ~pd.DataFrame({"id": ids, "museum": codes})
+                          .duplicated()).to_numpy()
+        else:
+            overall = per_museum = np.ones(len(df), dtype=bool)
+
+        self._rows = {
+            False: np.flatnonzero(overall & dated),
+            True: np.flatnonzero(per_museum & dated & (codes >= 0)),
+        }
+        self._years = np.where(dated, years, 0).astype(np.int32)
+        self._museum_codes = codes
+        self._flags = {flag: df[flag].to_numpy(dtype=bool) for flag in self.flags}
+        self.first_year = int(self._years[dated].min()) if dated.any() else MIN_YEAR
+        self.last_year = int(self._years[dated].max()) if dated.any() else MIN_YEAR
+        self._trends: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        # Engines are shared by every session
+        self._lock = threading.Lock()
+
+    def _bincounts(self, width: int, group: str,
+                   by_museum: bool) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Return the (series x bins) totals and group counts, and the first bin."""
+        rows = self._rows[by_museum]
+        first_bin = self.first_year // width
+        n_bins = self.last_year // width - first_bin + 1
+        bins = self._years[rows] // width - first_bin
+        n_series = len(self.museums) if by_museum else 1
+        if by_museum:
+            bins = self._museum_codes[rows] * n_bins + bins
+        shape = (n_series, n_bins)
+        totals = np.bincount(bins, minlength=n_series * n_bins).reshape(shape)
+        counts = np.bincount(bins, weights=self._flags[group][rows],
+                             minlength=n_series * n_bins).reshape(shape)
+        return totals.astype(np.float64), counts, first_bin
+
+    def trend(self, width: int = 10, group: str = GROUP_COLUMNS[0], by_museum: bool = False,
+              cumulative: bool = False, smooth: int = 1,
+              museums: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Return artist totals, group counts and proportions per bin of ``width`` years.
+
+        The result has ``Museum`` (``ALL_MUSEUMS`` unless ``by_museum``),
+        ``Period`` (first year of the bin), ``Total``, ``Count`` and
+        ``Proportion`` columns; bins without artists are left out.
+        ``cumulative`` counts every artist born up to the end of each bin.
+        Otherwise ``smooth`` sums counts over a centered window of that many
+        bins before the proportion is taken; ``Total`` and ``Count`` stay the
+        bin's own. Running totals are not smoothed. ``museums`` limits a
+        per-museum trend.
+        """
+        if cumulative:
+            smooth = 1
+        key = (width, group, by_museum, cumulative, smooth,
+               tuple(museums) if by_museum and museums is not None else None)
+        with self._lock:
+            result = self._trends.get(key)
+            if result is not None:
+                self._trends.move_to_end(key)
+                return result.copy()
+        totals, counts, first_bin = self._bincounts(width, group, by_museum)
+        if cumulative:
+            totals, counts = totals.cumsum(axis=1), counts.cumsum(axis=1)
+        summed_totals, summed_counts = totals, counts
+        if smooth > 1:
+            summed_totals = rolling_sum(totals, smooth)
+            summed_counts = rolling_sum(counts, smooth)
+        proportions = np.divide(summed_counts, summed_totals,
+                                out=np.full_like(summed_counts, np.nan),
+                                where=summed_totals > 0)
+
+        names = self.museums if by_museum else [ALL_MUSEUMS]
+        n_bins = totals.shape[1]
+        result = pd.DataFrame({
+            "Museum": np.repeat(names, n_bins),
+            "Period": np.tile((first_bin + np.arange(n_bins)) * width, len(names)),
+            "Total": totals.ravel().round().astype(np.int64),
+            "Count": counts.ravel().round().astype(np.int64),
+            "Proportion": proportions.ravel(),
+        })
+        keep = result["Total"].to_numpy() > 0
+        if museums is not None and by_museum:
+            keep &= result["Museum"].isin(list(museums)).to_numpy()
+        result = result[keep].reset_index(drop=True)
+        with self._lock:
+            self._trends[key] = result
+            self._trends.move_to_end(key)
+            while len(self._trends) > MAX_CACHED_TRENDS:
+                self._trends.popitem(last=False)
+        return result.copy()